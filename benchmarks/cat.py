@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hot paths of Cat and Owner.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits),
+or without asv through benchmarks/run.py and benchmarks/compare.py.
+"""
+
+import contextlib
+import io
+
+from pyCatSim import Cat, Clowder, Owner
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+
+
+class CatSuite:
+    """Creating n cats, one at a time or in bulk"""
+    params = SIZES
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.names = [f"cat{i}" for i in range(n)]
+
+    def time_init(self, n):
+        for name in self.names:
+            Cat(name, age=3, mood=1)
+
+    def time_init_fuzzy_color(self, n):
+        # Misspelled colors go through difflib, and are reported with print
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in self.names:
+                Cat(name, color='tabi')
+
+    def time_bulk(self, n):
+        Cat.bulk(self.names, color='tabi')
+
+    def peakmem_init(self, n):
+        [Cat(name) for name in self.names]
+
+
+class OwnerSuite:
+    """Caring for n cats living in a Clowder"""
+    params = SIZES
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}", 'hunger_level': 5} for i in range(n))
+        self.cats = self.group.catlist
+        self.owner = Owner('John', self.cats)
+
+    def time_feed_each(self, n):
+        for cat in self.cats:
+            self.owner.feed(cat)
+
+    def time_feed_all(self, n):
+        self.owner.feed_all()
+
+    def time_groom_all(self, n):
+        self.owner.groom_all()
+
+    def time_adopt(self, n):
+        Owner('Sasha', Cat('Mochi')).adopt(Cat.bulk([f"kitten{i}" for i in range(n)]))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hot paths of Clowder.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits),
+or without asv through benchmarks/run.py and benchmarks/compare.py.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+
+from pyCatSim import Cat, Clowder
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+
+
+def make_records(n):
+    return ({'name': f"cat{i}", 'age': i % 15, 'color': 'black', 'hunger_level': i % 4}
+            for i in range(n))
+
+
+def make_clowder(n):
+    if hasattr(Clowder, 'from_records'):
+        return Clowder.from_records(make_records(n))
+    # Versions without from_records, so that they can be compared
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Clowder([Cat(**record) for record in make_records(n)])
+
+
+class ClowderSuite:
+    """Building a Clowder of n cats and acting on all of them"""
+    params = SIZES
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.names = [f"cat{i}" for i in range(n)]
+        self.group = make_clowder(n)
+
+    def time_init(self, n):
+        Clowder([Cat(name) for name in self.names])
+
+    def time_from_records(self, n):
+        Clowder.from_records(make_records(n))
+
+    def time_play(self, n):
+        self.group.play()
+
+    def time_eat(self, n):
+        self.group.eat()
+
+    def time_simulate_10(self, n):
+        self.group.simulate(10, seed=0)
+
+    def time_stats(self, n):
+        self.group.stats()
+
+    def time_mean_mood_from_catlist(self, n):
+        sum(cat.mood for cat in self.group.catlist) / n
+
+    def time_catlist(self, n):
+        self.group.catlist
+
+    def peakmem_from_records(self, n):
+        Clowder.from_records(make_records(n))
+
+
+class RemoveSuite:
+    """Removing cats from a Clowder of n cats"""
+    params = SIZES
+    param_names = ['n_cats']
+    # Every removal shrinks the Clowder, so start from a fresh one each time
+    number = 1
+    repeat = 5
+    warmup_time = 0
+
+    def setup(self, n):
+        self.group = make_clowder(n)
+        self.victims = self.group.catlist[::max(1, n // 10)][:10]
+
+    def time_remove_cat(self, n):
+        for cat in self.victims:
+            self.group.remove_cat(cat)
+
+    def time_find(self, n):
+        self.group.find(f"cat{n // 2}")
+
+
+class QuerySuite:
+    """Top-k and range queries through the indexes, against a scan of the cats"""
+    params = [10_000, 1_000_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}", 'hunger_level': (i * 7919) % 1000,
+                                           'mood': (i * 104729) % 41 - 20} for i in range(n))
+        # Build the indexes, then change the state a little
+        self.group.top_k('hunger_level', 10)
+        self.group.where(mood__lt=-18)
+        self.group.play()
+        for cat in self.group.catlist[:10]:
+            cat.bathe()
+
+    def time_top_k(self, n):
+        self.group.top_k('hunger_level', 10)
+
+    def time_top_k_scan(self, n):
+        sorted(self.group.catlist, key=lambda cat: cat.hunger_level, reverse=True)[:10]
+
+    def time_where(self, n):
+        self.group.where(mood__lt=-18)
+
+    def time_where_scan(self, n):
+        [cat for cat in self.group.catlist if cat.mood < -18]
+
+    def time_where_numpy_scan(self, n):
+        np.flatnonzero(self.group.mood < -18)
+
+
+class BehaviorSuite:
+    """Random noises and actions for every cat, against one make_noise call per cat"""
+    params = [1_000, 1_000_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}", 'mood': i % 21 - 10} for i in range(n))
+        self.rng = np.random.default_rng(0)
+
+    def time_make_noises(self, n):
+        self.group.make_noises(seed=self.rng)
+
+    def time_random_actions(self, n):
+        self.group.random_actions(seed=self.rng)
+
+    def time_make_noise_loop(self, n):
+        noises = ('meow', 'purr', 'chatter', 'hiss', 'chirrup')
+        choices = self.rng.integers(0, len(noises), len(self.group))
+        [cat.make_noise(noises[choice]) for cat, choice in zip(self.group.catlist, choices)]
+
+
+class ViewSuite:
+    """Grooming the grumpy cats through a view, against grooming them one by one"""
+    params = [10_000, 1_000_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}", 'mood': i % 21 - 10} for i in range(n))
+        self.grumpy = self.group.mood < 0
+        self.cats = self.group.catlist
+
+    def time_groom_view(self, n):
+        self.group[self.grumpy].groom()
+
+    def time_groom_slice(self, n):
+        self.group[:n // 2].groom()
+
+    def time_groom_loop(self, n):
+        # Without views: the cats already belong to a Clowder, so they are groomed one by one
+        for cat, grumpy in zip(self.cats, self.grumpy.tolist()):
+            if grumpy:
+                cat.groom()
+
+    def time_copy(self, n):
+        self.group[self.grumpy].copy()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares the benchmarks of two commits without asv.
+
+Each commit is checked out in a temporary git worktree and the current
+benchmark suites (from the working copy) are run against its code in a
+separate process. Benchmarks that do not exist at one of the commits are
+reported as failed there.
+
+    python benchmarks/compare.py main HEAD --max-size 100000 --filter Clowder
+
+With asv installed, `asv continuous main HEAD` gives the same comparison in
+isolated environments.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO = BENCHMARK_DIR.parent
+
+
+def run_at(commit, options, workdir):
+    """Runs the suites against the code of a commit, returning their results"""
+    tree = Path(workdir) / commit.replace('/', '_')
+    subprocess.run(['git', 'worktree', 'add', '--detach', str(tree), commit],
+                   cwd=REPO, check=True, capture_output=True)
+    try:
+        out = Path(workdir) / f"{tree.name}.json"
+        env = dict(os.environ, PYTHONPATH=str(tree), MPLBACKEND='Agg')
+        subprocess.run([sys.executable, str(BENCHMARK_DIR / 'run.py'), '--json', str(out), *options],
+                       cwd=workdir, env=env, check=True)
+        with open(out) as f:
+            return json.load(f)['results']
+    finally:
+        subprocess.run(['git', 'worktree', 'remove', '--force', str(tree)], cwd=REPO, check=True)
+
+
+def compare(base, head, threshold):
+    """Yields one report line per benchmark, flagging changes beyond threshold"""
+    for key in sorted(set(base) | set(head)):
+        old, new = base.get(key, {}), head.get(key, {})
+        if 'error' in old or 'error' in new or not old or not new:
+            status = ['failed' if 'error' in result or not result else 'ok' for result in (old, new)]
+            yield f"  {key:<60} {status[0]:>14} {status[1]:>14}"
+            continue
+        for metric, unit, better in (('ops_per_sec', 'ops/s', 1), ('peak_bytes', 'B peak', -1),
+                                     ('value', '', -1)):
+            if metric not in old or metric not in new:
+                continue
+            ratio = new[metric] / old[metric] if old[metric] else float('inf') if new[metric] else 1.0
+            flag = ''
+            if ratio ** better < 1 / threshold:
+                flag = '-'
+            elif ratio ** better > threshold:
+                flag = '+'
+            yield f"{flag or ' '} {key:<60} {old[metric]:>14,.1f} {new[metric]:>14,.1f} {ratio:>7.2f}x {unit}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base', help="reference commit")
+    parser.add_argument('head', help="commit to compare")
+    parser.add_argument('--filter', help="only run benchmarks whose name matches this regex")
+    parser.add_argument('--max-size', type=int, help="skip parameters larger than this")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per benchmark (default 3)")
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help="ratio beyond which a change is flagged (default 1.1)")
+    args = parser.parse_args(argv)
+
+    options = ['--repeat', str(args.repeat)]
+    if args.filter:
+        options += ['--filter', args.filter]
+    if args.max_size:
+        options += ['--max-size', str(args.max_size)]
+    with tempfile.TemporaryDirectory() as workdir:
+        base = run_at(args.base, options, workdir)
+        head = run_at(args.head, options, workdir)
+    print(f"\n  {'benchmark':<60} {args.base:>14} {args.head:>14}")
+    regressed = False
+    for line in compare(base, head, args.threshold):
+        regressed |= line.startswith('-')
+        print(line)
+    print("\n+ better, - worse (beyond the threshold)")
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
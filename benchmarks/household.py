@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cost of owner-cat lookups in a large household registry.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits).
+"""
+
+import numpy as np
+
+from pyCatSim import Cat, Household, Owner
+
+
+class HouseholdSuite:
+    """Lookups among n_edges random relationships, with one owner per 4 edges and one cat per 2"""
+    params = [10_000, 1_000_000]
+    param_names = ['n_edges']
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        self.home = Household()
+        for cat in Cat.bulk([f"cat{i}" for i in range(n // 2)]):
+            self.home.add_cat(cat)
+        for i in range(n // 4):
+            self.home.add_owner(Owner(f"owner{i}", []))
+        self.owners = rng.integers(0, n // 4, n)
+        self.cats = rng.integers(0, n // 2, n)
+        self.home.link(self.owners, self.cats)
+        self.home.n_edges
+        self.changed = rng.choice(n // 2, n // 100, replace=False)
+
+    def time_link(self, n):
+        self.home.link(self.owners[:n // 100], self.cats[::-1][:n // 100])
+        self.home.n_edges
+
+    def time_owners_of(self, n):
+        for i in range(1000):
+            self.home.owner_indices_of(i)
+
+    def time_cats_of(self, n):
+        for i in range(1000):
+            self.home.cat_indices_of(i)
+
+    def time_affected_owners(self, n):
+        self.home.affected_owner_indices(self.changed)
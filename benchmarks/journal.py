@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cost of recording a simulation in a journal.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits).
+"""
+
+from pyCatSim import Clowder
+from pyCatSim.utils.journal import Journal
+
+
+class JournalSuite:
+    """Time to simulate 10 ticks, with and without a journal"""
+    params = [1_000, 100_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}"} for i in range(n))
+
+    def time_simulate(self, n):
+        self.group.simulate(10, seed=0)
+
+    def time_simulate_journaled(self, n):
+        self.group.attach_journal(Journal(capacity=10 * n))
+        self.group.simulate(10, seed=0)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory footprint of cat populations, reported in bytes per cat.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits).
+"""
+
+import tracemalloc
+
+from pyCatSim import Cat, Clowder
+
+
+def bytes_per_cat(build, n):
+    """Traces the memory retained by build(n), divided by n"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    population = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del population
+    return (after - before) / n
+
+
+def make_cats(n):
+    return [Cat(name=f"cat{i}", age=3, mood=1) for i in range(n)]
+
+
+def make_bulk(n):
+    return Cat.bulk([f"cat{i}" for i in range(n)], age=3, mood=1)
+
+
+def make_records(n):
+    return Clowder.from_records({'name': f"cat{i}", 'age': 3, 'mood': 1} for i in range(n))
+
+
+class MemorySuite:
+    """Bytes per cat for the different ways of building a population"""
+    params = [1_000, 100_000]
+    param_names = ['n_cats']
+    unit = 'bytes'
+
+    def track_cat_objects(self, n):
+        return bytes_per_cat(make_cats, n)
+
+    def track_cat_bulk(self, n):
+        return bytes_per_cat(make_bulk, n)
+
+    def track_clowder_from_records(self, n):
+        return bytes_per_cat(make_records, n)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cost of recording the state of every cat at every tick.
+
+Run with `asv run` (or `asv continuous <base> <head>` to compare two commits).
+"""
+
+import numpy as np
+
+from pyCatSim import Clowder
+from pyCatSim.utils.recorder import Recorder
+
+
+class RecorderSuite:
+    """100 ticks of n cats, when every cat changes and when 10 cats change per tick"""
+    params = [10_000, 1_000_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        self.group = Clowder.from_records({'name': f"cat{i}"} for i in range(n))
+        self.rows = np.random.default_rng(0).integers(0, n, (100, 10))
+
+    def time_simulate(self, n):
+        self.group.simulate(100, seed=0)
+
+    def time_simulate_recorded(self, n):
+        self.group.attach_recorder(Recorder())
+        self.group.simulate(100, seed=0)
+        self.group.detach_recorder()
+
+    def time_sparse_recorded(self, n):
+        recorder = self.group.attach_recorder(Recorder())
+        store = self.group._store
+        for rows in self.rows:
+            store.play(1, 1, -1, rows=rows)
+            recorder.advance()
+        self.group.detach_recorder()
+
+    def time_sparse_full_copy(self, n):
+        # What recording costs without knowing which cats changed
+        store = self.group._store
+        fields = ('mood', 'hunger_level', 'energy', 'health')
+        series = {field: np.empty((101, n), dtype=np.int64) for field in fields}
+        for tick, rows in enumerate(self.rows):
+            store.play(1, 1, -1, rows=rows)
+            for field in fields:
+                series[field][tick + 1] = store.column(field)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Runs the benchmark suites without asv.
+
+Every `time_*` benchmark is reported in operations per second (calls of the
+benchmark per second) together with the peak memory allocated by one call,
+as traced by tracemalloc. `peakmem_*` benchmarks only report the peak memory
+and `track_*` benchmarks report the value they return.
+
+    python benchmarks/run.py --max-size 100000 --filter Clowder --json results.json
+
+Pictures are rendered with the Agg backend, so no display is needed.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+BENCHMARK_DIR = Path(__file__).parent
+PREFIXES = ('time_', 'peakmem_', 'track_')
+
+
+def discover():
+    """Yields (module name, class) for every suite in the benchmark directory"""
+    sys.path.insert(0, str(BENCHMARK_DIR.parent))
+    for path in sorted(BENCHMARK_DIR.glob('*.py')):
+        if path.stem in ('__init__', 'run', 'compare'):
+            continue
+        try:
+            module = importlib.import_module(f'benchmarks.{path.stem}')
+        except ImportError as error:
+            # The suite needs features this version of pyCatSim does not have
+            print(f"skipping benchmarks/{path.name} ({error})", file=sys.stderr)
+            continue
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and any(
+                    attr.startswith(PREFIXES) for attr in dir(cls)):
+                yield path.stem, cls
+
+
+def param_sets(cls, max_size):
+    """The parameter combinations of a suite, skipping sizes above max_size"""
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    if not params or not isinstance(params[0], (list, tuple)):
+        params = [params]
+    combos = itertools.product(*params)
+    return [combo for combo in combos
+            if max_size is None or all(not isinstance(p, int) or p <= max_size for p in combo)]
+
+
+def peak_bytes(suite, method, args):
+    """Peak memory traced while calling method once"""
+    tracemalloc.start()
+    try:
+        getattr(suite, method)(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def ops_per_sec(cls, method, args, repeat):
+    """Best rate over repeat runs, in calls per second"""
+    number = getattr(cls, 'number', None)
+    best = 0.0
+    for _ in range(repeat):
+        suite = cls()
+        if hasattr(suite, 'setup'):
+            suite.setup(*args)
+        timer = timeit.Timer(lambda: getattr(suite, method)(*args))
+        if number is None:
+            calls, elapsed = timer.autorange()
+        else:
+            calls, elapsed = number, timer.timeit(number)
+        best = max(best, calls / elapsed)
+        if hasattr(suite, 'teardown'):
+            suite.teardown(*args)
+    return best
+
+
+def run_benchmark(cls, method, args, repeat):
+    """Runs one benchmark, returning its result as a dict"""
+    result = {}
+    if method.startswith('time_'):
+        result['ops_per_sec'] = ops_per_sec(cls, method, args, repeat)
+    suite = cls()
+    if hasattr(suite, 'setup'):
+        suite.setup(*args)
+    if method.startswith('track_'):
+        result['value'] = getattr(suite, method)(*args)
+    else:
+        result['peak_bytes'] = peak_bytes(suite, method, args)
+    if hasattr(suite, 'teardown'):
+        suite.teardown(*args)
+    return result
+
+
+def run(pattern=None, max_size=None, repeat=3, out=print):
+    """
+    Runs every benchmark whose full name matches pattern
+
+    Returns
+    -------
+    dict
+        Maps 'module.Class.method(params)' to its result.
+
+    """
+    results = {}
+    for module, cls in discover():
+        methods = sorted(name for name in dir(cls) if name.startswith(PREFIXES))
+        for method, args in itertools.product(methods, param_sets(cls, max_size)):
+            key = f"{module}.{cls.__name__}.{method}({', '.join(map(str, args))})"
+            if pattern and not re.search(pattern, key):
+                continue
+            try:
+                results[key] = run_benchmark(cls, method, args, repeat)
+            except Exception as error:
+                results[key] = {'error': f"{type(error).__name__}: {error}"}
+            out(format_result(key, results[key]))
+    return results
+
+
+def format_result(key, result):
+    if 'error' in result:
+        return f"{key:<60} failed ({result['error']})"
+    parts = []
+    if 'ops_per_sec' in result:
+        parts.append(f"{result['ops_per_sec']:>14,.1f} ops/s")
+    if 'peak_bytes' in result:
+        parts.append(f"{result['peak_bytes'] / 2**20:>10.2f} MiB peak")
+    if 'value' in result:
+        parts.append(f"{result['value']:>14,.1f}")
+    return f"{key:<60} {'  '.join(parts)}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help="only run benchmarks whose name matches this regex")
+    parser.add_argument('--max-size', type=int, help="skip parameters larger than this")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per benchmark (default 3)")
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    import pyCatSim
+    print(f"pyCatSim from {Path(pyCatSim.__file__).parent}", file=sys.stderr)
+    results = run(args.filter, args.max_size, args.repeat)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
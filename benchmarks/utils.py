@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hot paths of the utilities: pictures, noises, facts and colors.
+
+The display benchmarks render to an in-memory PNG and the noise benchmarks
+use a backend that discards the sound, so the suite runs headless and
+without an audio device.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+
+from pyCatSim import Cat, Clowder
+from pyCatSim.utils import display, facts, noises, playback
+from pyCatSim.utils.colors import resolve_colors
+
+
+class DisplaySuite:
+    """Rendering cat pictures without a window"""
+
+    def setup(self):
+        display.load_image('tabby')
+
+    def time_show(self):
+        display.show('tabby', output=io.BytesIO())
+
+    def time_load_image_cached(self):
+        display.load_image('tabby')
+
+    def time_cat_show(self):
+        Cat('Nutmeg', color='black', quiet=True).show(output=io.BytesIO())
+
+
+class NoiseSuite:
+    """Making n noises"""
+    params = [10, 1_000]
+    param_names = ['n_noises']
+
+    def setup(self, n):
+        playback.set_backend(playback.NullBackend(), max_concurrency=4)
+        self.cat = Cat('Nutmeg', quiet=True)
+
+    def teardown(self, n):
+        playback.get_player().shutdown()
+
+    def time_make_noise_text(self, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(n):
+                self.cat.make_noise('purr')
+
+    def time_make_noise_play(self, n):
+        handles = [self.cat.make_noise('meow', play=True) for _ in range(n)]
+        for handle in handles:
+            handle.result()
+
+    def time_noise_functions(self, n):
+        for _ in range(n):
+            noises.hiss()
+
+
+class FactSuite:
+    """Drawing k facts"""
+    params = [10, 1_000, 100_000, 1_000_000]
+    param_names = ['k']
+
+    def time_random_fact_loop(self, k):
+        # Capped, a million single draws would dominate the suite
+        for _ in range(min(k, 100_000)):
+            facts.random_facts()
+
+    def time_random_facts_batch(self, k):
+        facts.random_facts(k, rng=0)
+
+
+class ColorSuite:
+    """Interpreting n color inputs"""
+    params = [10, 1_000, 100_000, 1_000_000]
+    param_names = ['n_colors']
+
+    def setup(self, n):
+        spellings = ['tabby', 'Black ', 'tabi', 'tortie', 'orange']
+        self.colors = [spellings[i % len(spellings)] for i in range(n)]
+
+    def time_resolve_colors(self, n):
+        resolve_colors(self.colors)
+
+
+class MosaicSuite:
+    """Mosaic of n cats, with their names and state written on the tiles"""
+    params = [100, 10_000]
+    param_names = ['n_cats']
+    timeout = 120
+
+    def setup(self, n):
+        colors = ['tabby', 'black', 'orange', 'tortoiseshell', 'tuxedo']
+        self.group = Clowder.from_records({'name': f"cat{i}", 'color': colors[i % 5], 'mood': i % 7}
+                                          for i in range(n))
+        self.group.render_grid(io.BytesIO(), columns=10)
+
+    def time_render_grid(self, n):
+        self.group.render_grid(io.BytesIO())
+
+    def peakmem_render_grid(self, n):
+        self.group.render_grid(io.BytesIO())
+
+
+class MixerSuite:
+    """Chorus of n cats over 30 seconds, with clips as long as the recorded noises"""
+    params = [10, 1_000, 100_000]
+    param_names = ['n_cats']
+
+    def setup(self, n):
+        from pyCatSim.utils import mixer
+        self.mix = mixer.mix
+        rng = np.random.default_rng(0)
+        # 4 to 60 seconds of noise at 22050 Hz, like the decoded mp3 files
+        self.clips = [rng.uniform(-0.1, 0.1, int(seconds * mixer.RATE)) for seconds in (8, 60, 8, 4, 4)]
+        self.codes = rng.integers(0, 5, n)
+        self.starts = rng.uniform(0, 30, n)
+        self.gains = rng.uniform(0.2, 1, n)
+
+    def time_mix(self, n):
+        self.mix(np.arange(n), self.codes, self.starts, gains=self.gains, clips=self.clips)
@@ -5,6 +5,7 @@ Definition of the various Classes and in which Modules they may be found.
 from .cat import Cat
 from .clowder import Clowder
 from .human import Owner
+from .household import Household
 
-__all__ = ["Cat", "Owner", "Clowder"]
+__all__ = ["Cat", "Owner", "Clowder", "Household"]
 
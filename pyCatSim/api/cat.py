@@ -8,11 +8,108 @@ The cat module allows to create a Cat or a group of Cats (i.e. a Clowder)
 from ..utils import noises
 from ..utils import display
 from ..utils import facts
+from ..utils.colors import COLORS, resolve_color, resolve_colors
+from ..utils.behavior import NOISES
 
+import io
 import random
-import difflib
 import math
 
+
+def _state_property(field):
+    """
+    Builds a property for a Cat attribute.
+
+    A standalone Cat keeps the value on the instance. Once the Cat joins a
+    Clowder, the value lives in the Clowder's columnar storage and the Cat
+    becomes a lightweight view on its row.
+    """
+    private = '_' + field
+
+    def getter(self):
+        if self._store is None:
+            return getattr(self, private)
+        return self._store.get(self._row, field)
+
+    def setter(self, value):
+        if self._store is None:
+            setattr(self, private, value)
+        else:
+            self._store.set(self._row, field, value)
+
+    return property(getter, setter)
+
+
+def _interpret_color(color, quiet=False):
+    """
+    Interprets a color input with fuzzy matching.
+
+    Returns the matching color, or None (with a message unless quiet) if the
+    input is too far from any known color.
+    """
+    match = resolve_color(color)
+
+    if not quiet:
+        if match:
+            print(f"Color '{color}' interpreted as '{match}'.")
+        else:
+            print(f"Invalid color '{color}'. Valid options are: {', '.join(COLORS)}.")
+    return match
+
+
+def _interpret_colors(colors, quiet=False):
+    """
+    Interprets a list of color inputs, matching each distinct spelling once.
+
+    Returns the int8 color codes (see pyCatSim.utils.colors.resolve_colors).
+    """
+    if not quiet:
+        for color in dict.fromkeys(colors):
+            if color:
+                _interpret_color(color)
+    return resolve_colors(colors)
+
+
+def _per_cat(value, n, label):
+    """Expands a single value to n values, or checks that a sequence has n values"""
+    if isinstance(value, str) or not hasattr(value, '__iter__'):
+        return [value] * n
+    value = list(value)
+    if len(value) != n:
+        raise ValueError(f"Expected {n} values for {label}, got {len(value)}.")
+    return value
+
+
+def _check_play_args(mood_boost, hunger_boost, energy_boost):
+    """Validates the arguments of Cat.play and Clowder.play"""
+    for arg_name, arg_value in {
+        "mood_boost": mood_boost,
+        "hunger_boost": hunger_boost,
+        "energy_boost": energy_boost
+    }.items():
+        if not isinstance(arg_value, int):
+            raise TypeError(f"{arg_name} must be an integer.")
+
+    if hunger_boost <= 0:
+        raise ValueError("Cats always get hungry when playing! hunger_boost must be positive.")
+    if energy_boost >= 0:
+        raise ValueError("Cats always get tired when playing! energy_boost must be negative.")
+
+
+def _check_sleep_duration(duration):
+    """Validates the duration of Cat.sleep and Clowder.sleep"""
+    # Enforce duration type is int or float
+    if type(duration) != int:
+        if type(duration) != float:
+            raise TypeError("duration must be an integer or float")
+
+    # Enforce min (0 hrs) and max duration (16 hrs)
+    if duration < 0:
+        raise ValueError("Cats cannot sleep for negative hours. User-specified duration must be positive")
+    if duration > 16:
+        raise ValueError("Cats should not sleep for more than 16 hours. User-specified duration must be less than 16")
+
+
 class Cat:
     
     """
@@ -36,6 +133,8 @@ class Cat:
         Energy level of the cat. Default is 0.
     health : int, optional
         Health level of the cat. Default is 0.
+    quiet : bool, optional
+        If True, do not print how the color was interpreted. Default is False.
 
     Attributes
     ----------
@@ -54,6 +153,15 @@ class Cat:
     health : int
         The cat's health level.
     
+    Notes
+    -----
+    Once added to a Clowder, the cat's attributes are stored in the Clowder's
+    columnar arrays and the Cat object acts as a view on its row: changes made
+    through the Cat and through the Clowder are visible to both. A Cat can only
+    belong to one Clowder at a time.
+
+    Cats use ``__slots__`` and carry no instance ``__dict__``. Use Cat.bulk or
+    Clowder.from_records to create many cats at once.
     
     Examples
     --------
@@ -65,40 +173,131 @@ class Cat:
     
     """
 
+    name = _state_property('name')
+    age = _state_property('age')
+    color = _state_property('color')
+    mood = _state_property('mood')
+    hunger_level = _state_property('hunger_level')
+    energy = _state_property('energy')
+    health = _state_property('health')
     
+    __slots__ = ('_store', '_row', '_name', '_age', '_color', '_mood',
+                 '_hunger_level', '_energy', '_health')
+
     def __init__(self, name, age=None, color=None, mood=0, hunger_level=0, 
-                 energy=0, health=0):
+                 energy=0, health=0, quiet=False):
         
+        # Set when the cat joins a Clowder (see pyCatSim.utils.store.CatStore)
+        self._store = None
+        self._row = None
         
-        self.name = name
-        self.age = age
-        
-        possible_colors = ['tabby', 'black', 'orange', 'tortoiseshell', 'tuxedo']
-
-        if color:
-            color_normalized = color.lower().strip()
-            match = difflib.get_close_matches(color_normalized, possible_colors, n=1, cutoff=0.6)
-
-            if match:
-                self.color = match[0]
-                print(f"Color '{color}' interpreted as '{self.color}'.")
-            else:
-                print(f"Invalid color '{color}'. Valid options are: {', '.join(possible_colors)}.")
-                self.color = None
-        
-        self.mood = mood
-        self.hunger_level = hunger_level
-        self.energy = energy
-        self.health = health
+        # A new cat is standalone, so its state goes straight to its own attributes
+        self._name = name
+        self._age = age
+        self._color = _interpret_color(color, quiet) if color else None
+        self._mood = mood
+        self._hunger_level = hunger_level
+        self._energy = energy
+        self._health = health
+
+    @classmethod
+    def bulk(cls, names, age=None, color=None, mood=0, hunger_level=0,
+             energy=0, health=0, quiet=True):
+        """
+        Creates many cats in one call.
+
+        Each attribute can be given either as a single value shared by all
+        cats or as a sequence with one value per cat. Colors are interpreted
+        once per distinct spelling rather than once per cat.
+
+        Parameters
+        ----------
+        names : list of str
+            The names of the cats.
+        age : int or sequence, optional
+            The age of the cats in years. Default is None.
+        color : str or sequence, optional
+            Coat color of the cats. Default is None.
+        mood : int or sequence, optional
+            Mood level of the cats. Default is 0.
+        hunger_level : int or sequence, optional
+            Hunger level of the cats. Default is 0.
+        energy : int or sequence, optional
+            Energy level of the cats. Default is 0.
+        health : int or sequence, optional
+            Health level of the cats. Default is 0.
+        quiet : bool, optional
+            If False, report how each distinct color was interpreted. Default is True.
+
+        Raises
+        ------
+        ValueError
+            If a sequence does not have one value per name.
+
+        Returns
+        -------
+        list of pyCatSim.Cat
+            The new cats, in the order of names.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            litter = cats.Cat.bulk(['Nutmeg', 'Chestnut', 'Mochi'], age=1,
+                                   color=['tortoiseshell', 'tabby', 'black'])
+            print([cat.color for cat in litter])
+
+        """
+        n = len(names)
+        values = {
+            'age': _per_cat(age, n, 'age'),
+            'color': [COLORS[code] if code >= 0 else None
+                      for code in _interpret_colors(_per_cat(color, n, 'color'), quiet)],
+            'mood': _per_cat(mood, n, 'mood'),
+            'hunger_level': _per_cat(hunger_level, n, 'hunger_level'),
+            'energy': _per_cat(energy, n, 'energy'),
+            'health': _per_cat(health, n, 'health'),
+        }
+        cats = []
+        for i, name in enumerate(names):
+            cat = cls.__new__(cls)
+            cat._store = None
+            cat._row = None
+            cat._name = name
+            cat._age = values['age'][i]
+            cat._color = values['color'][i]
+            cat._mood = values['mood'][i]
+            cat._hunger_level = values['hunger_level'][i]
+            cat._energy = values['energy'][i]
+            cat._health = values['health'][i]
+            cats.append(cat)
+        return cats
+
+    @classmethod
+    def _from_row(cls, store, row):
+        """Creates a Cat viewing an existing row of a CatStore"""
+        cat = cls.__new__(cls)
+        cat._store = store
+        cat._row = row
+        return cat
     
-    def give_fact(self):
+    def give_fact(self, k=None, rng=None):
         """
         Gives a random fact about cats
+
+        Parameters
+        ----------
+        k : int, optional
+            Number of facts to give, drawn in one call. Default is None (a single fact).
+        rng : int or numpy.random.Generator, optional
+            Seed or generator used for the draw. Default is None.
         
         Returns
         -------
-        str
-            A fact randomly chosen from a pre-defined fact pool 
+        str or list of str
+            A fact randomly chosen from a pre-defined fact pool, or k facts
             
         Examples    
         --------
@@ -109,7 +308,7 @@ class Cat:
             nutmeg = cats.Cat(name='Nutmeg', age = 3, color = 'tortoiseshell')
             nutmeg.give_fact()
         """ 
-        return facts.random_facts()
+        return facts.random_facts(k, rng=rng)
     
     def make_noise(self, noise='meow', play=False):
         """
@@ -122,6 +321,7 @@ class Cat:
 
         play : bool, optional
             Whether to play the sound (True) or print out the sound (False). The default is False.
+            Playback happens in the background and does not block.
 
         Raises
         ------
@@ -130,8 +330,8 @@ class Cat:
 
         Returns
         -------
-        str
-            The sound
+        str or concurrent.futures.Future
+            The sound, or a handle on the playback if play is True
         
         See also
         --------
@@ -146,6 +346,8 @@ class Cat:
         
         pyCatSim.utils.noises.chirrup: Simulates a cat chirrup
 
+        pyCatSim.utils.playback.set_backend: Chooses how sounds are played
+
         
         Examples
         --------
@@ -164,19 +366,64 @@ class Cat:
 
         """
         
-        noise_func ={
-            'meow':noises.meow,
-            'purr':noises.purr,
-            'chatter':noises.chatter,
-            'hiss':noises.hiss,
-            'chirrup':noises.chirrup}
-    
-        if noise in noise_func.keys():
-            return noise_func[noise](play=play)
+        if noise in NOISES:
+            return getattr(noises, noise)(play=play)
         else:
-            raise ValueError(f"Invalid noise '{noise}'. Valid options: {', '.join(noise_func.keys())}")
-        
+            raise ValueError(f"Invalid noise '{noise}'. Valid options: {', '.join(NOISES)}")
         
+
+    async def amake_noise(self, noise='meow', play=False):
+        """
+        Have the cat make a noise, without blocking the event loop
+
+        Parameters
+        ----------
+        noise : string, optional
+            The sound the cat makes. Valid options include "meow", "purr", "chirrup", and "hiss". The default is 'meow'.
+        play : bool, optional
+            Whether to play the sound (True) or return it as text (False). The default is False.
+            When playing, the coroutine finishes once the sound has been played.
+
+        Raises
+        ------
+        ValueError
+            Raises an error if the sound is not valid
+
+        Returns
+        -------
+        str or None
+            The sound as text, or None once it has been played
+
+        See also
+        --------
+
+        pyCatSim.Cat.make_noise: Blocking version
+
+        pyCatSim.utils.aio.set_max_workers: Limits the number of threads used by the asyncio API
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import asyncio
+            import pyCatSim as cats
+            litter = cats.Cat.bulk(['Nutmeg', 'Chestnut', 'Mochi'])
+
+            async def main():
+                return await asyncio.gather(*[cat.amake_noise('purr') for cat in litter])
+
+            asyncio.run(main())
+
+        """
+        if not play:
+            return self.make_noise(noise)
+        # the playback runs on the player's threads, the clip is read on ours
+        import asyncio
+        from ..utils.aio import run_blocking
+        handle = await run_blocking(self.make_noise, noise, play=True)
+        await asyncio.wrap_future(handle)
+
     def play(self, mood_boost=1, hunger_boost=1, energy_boost=-1):
             
         """
@@ -209,19 +456,11 @@ class Cat:
             
         
         """
-        for arg_name, arg_value in {
-            "mood_boost": mood_boost,
-            "hunger_boost": hunger_boost,
-            "energy_boost": energy_boost
-        }.items():
-            if not isinstance(arg_value, int):
-                raise TypeError(f"{arg_name} must be an integer.")
-    
-        if hunger_boost <= 0:
-            raise ValueError("Cats always get hungry when playing! hunger_boost must be positive.")
-        if energy_boost >= 0:
-            raise ValueError("Cats always get tired when playing! energy_boost must be negative.")
+        _check_play_args(mood_boost, hunger_boost, energy_boost)
     
+        if self._store is not None:
+            self._store.play(mood_boost, hunger_boost, energy_boost, rows=self._row)
+            return
         self.mood += mood_boost
         self.hunger_level += hunger_boost
         self.energy += energy_boost
@@ -245,18 +484,32 @@ class Cat:
             print(mochi.health) # Output: 6
             
         """
+        if self._store is not None:
+            self._store.bathe(rows=self._row)
+            return
         self.mood -= 1
         self.health += 1
 
         
-    def show(self):
+    def show(self, output=None):
         """
-        Shows a picture of the cat. If the color is not set, shows a random cat. 
+        Shows a picture of the cat. If the color is not set, shows a random cat.
+
+        Parameters
+        ----------
+        output : str, path-like or file-like, optional
+            Where to write the picture as a PNG, without opening a window
+            (works headless). Default is None (show in a window).
 
         Returns
         -------
-        None.
-        
+        None or the output
+
+        See also
+        --------
+
+        pyCatSim.utils.display.show: Shows the picture of a cat
+
         Examples
         --------
         .. jupyter-execute::
@@ -266,14 +519,50 @@ class Cat:
             mochi.show()
 
         """
-        
-        possible_colors = ['tabby', 'black', 'orange', 'tortoiseshell', 'tuxedo']
-        
+
         try:
-            display.show(self.color)
-        except:        
-            color = random.choice(possible_colors)
-            display.show(color)
+            return display.show(self.color, output=output)
+        except FileNotFoundError:
+            color = random.choice(COLORS)
+            return display.show(color, output=output)
+
+    async def ashow(self, output=None):
+        """
+        Renders a picture of the cat as a PNG, without blocking the event loop
+
+        Decoding and rendering run on a worker thread. Windows cannot be
+        opened from worker threads, so the picture is always rendered headless.
+
+        Parameters
+        ----------
+        output : str, path-like or file-like, optional
+            Where to write the picture. Default is None (a new io.BytesIO).
+
+        Returns
+        -------
+        The output, holding the PNG
+
+        See also
+        --------
+
+        pyCatSim.Cat.show: Blocking version, which can also open a window
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import asyncio
+            import pyCatSim as cats
+            mochi = cats.Cat(name='Mochi', color='black')
+            png = asyncio.run(mochi.ashow())
+            print(len(png.getvalue()))
+
+        """
+        from ..utils.aio import run_blocking
+        if output is None:
+            output = io.BytesIO()
+        return await run_blocking(self.show, output=output)
        
                         
     def groom(self):
@@ -293,6 +582,9 @@ class Cat:
             
         
         """
+        if self._store is not None:
+            self._store.groom(rows=self._row)
+            return
         self.mood += 1
         self.health += 1
         #print(f"{self.name} has been groomed. Health: {self.health}, Mood: {self.mood}")
@@ -320,6 +612,9 @@ class Cat:
             nutmeg.eat()
             # Output: {'hunger_level': 1, 'mood': 1}
         """
+        if self._store is not None:
+            self._store.eat(rows=self._row)
+            return {"hunger_level": self.hunger_level, "mood": self.mood}
         # Prevent hunger_level from going negative
         if self.hunger_level > 0:
             self.hunger_level -= 1
@@ -363,16 +658,11 @@ class Cat:
 
         """
 
-        # Enforce duration type is int or float
-        if type(duration) != int:
-            if type(duration) != float:
-                raise TypeError("duration must be an integer or float")
+        _check_sleep_duration(duration)
 
-        # Enforce min (0 hrs) and max duration (16 hrs)
-        if duration < 0:
-            raise ValueError("Cats cannot sleep for negative hours. User-specified duration must be positive")
-        if duration > 16:
-            raise ValueError("Cats should not sleep for more than 16 hours. User-specified duration must be less than 16")
+        if self._store is not None:
+            self._store.sleep(duration, rows=self._row)
+            return
 
         # Cat gains 1 energy level for every 3 hours of sleep (rounded-down; floor())
         energy_boost = math.floor(duration/3)
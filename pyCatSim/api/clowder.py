@@ -4,111 +4,1443 @@
 The cat module allows to create a Cat or a group of Cats (i.e. a Clowder)
 """
 
-from .cat import Cat
-                        
+import math
+
+import numpy as np
+
+from .cat import Cat, _check_play_args, _check_sleep_duration, _interpret_colors
+from ..utils.store import CatStore, STATE_FIELDS, ACTIONS, _color_counts
+from ..utils.colors import COLORS
+from ..utils.simulation import simulate
+from ..utils.behavior import draw_noises, draw_actions
+from ..utils.journal import Journal
+from ..utils.recorder import Recorder
+from ..utils.snapshot import save_snapshot, load_snapshot
+from ..utils.ingest import stream_records, stream_csv, stream_jsonl
+from ..utils.display import render_grid
+from ..utils.mixer import RATE, mix, write_wav
+
+
+def _color_parser(quiet):
+    """Interprets the colors of a chunk of records, reporting them unless quiet"""
+    return lambda colors: _interpret_colors(colors, quiet)
+
+
+def _as_slice(rows):
+    """Turns consecutive increasing rows into a slice, so that columns are viewed rather than copied"""
+    if not len(rows):
+        return slice(0, 0)
+    if (np.diff(rows) == 1).all():
+        return slice(int(rows[0]), int(rows[0]) + len(rows))
+    return rows
+
+
+class _CatList(list):
+    """A list of the cats of a Clowder that refuses changes, which would not reach the Clowder"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("catlist is a read-only copy of the cats; use add_cat and remove_cat to change the Clowder.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+
 class Clowder:
     """
     Represents a group of cats.
-    
+
+    The state of the cats (age, mood, hunger_level, energy and health) is
+    stored in contiguous NumPy arrays, so that actions applied to the Clowder
+    update every cat in a single vectorized pass. The Cat objects in the
+    Clowder remain usable and act as views on their row. As a consequence, a
+    Cat belongs to at most one Clowder at a time: remove it from a Clowder
+    before adding it to another one. The state attributes of the cats must
+    be whole numbers.
+
+    Indexing a Clowder with a slice, a boolean mask or an array of positions
+    returns a view: a Clowder of some of the cats that shares their state, so
+    that acting on the view changes the cats of the original Clowder (see
+    __getitem__). Use copy for an independent Clowder.
+
     Parameters
     ----------
-    catlist: list 
+    catlist: list
         A list of cats from the Cat class
 
     Attributes
     ----------
-    catlist: list 
-        A list of cats from the Cat class
-    
+    catlist: list
+        The cats of the Clowder, rebuilt at each access. It cannot be
+        modified: use add_cat and remove_cat instead.
+    ids : numpy.ndarray
+        Read-only view on the ID of each cat. IDs are unique within the
+        Clowder and increase in insertion order.
+    age : numpy.ndarray
+        Read-only view on the age of each cat (NaN when unknown)
+    mood : numpy.ndarray
+        Read-only view on the mood of each cat
+    hunger_level : numpy.ndarray
+        Read-only view on the hunger level of each cat
+    energy : numpy.ndarray
+        Read-only view on the energy level of each cat
+    health : numpy.ndarray
+        Read-only view on the health level of each cat
+
+    Raises
+    ------
+    TypeError
+        If any element of catlist is not a Cat, or a state attribute of a
+        Cat is not a number.
+    ValueError
+        If a Cat already belongs to a Clowder, has a state attribute that is
+        not a whole number or a color that is not valid.
+
     Examples
     --------
-    
+
     .. jupyter-execute::
-        
+
         import pyCatSim as cats
         nutmeg = cats.Cat('Nutmeg')
         charming = cats.Cat('Charming')
         maze = cats.Cat('Mazikeen')
         una = cats.Cat('Una')
         group = cats.Clowder(catlist = [nutmeg, charming, maze, una])
-        
+
     """
-        
+
     def __init__(self, catlist=None):
         if catlist is None:
              catlist = []
         elif isinstance(catlist, Cat):
             catlist = [catlist]
-        elif not all(isinstance(cat,Cat) for cat in catlist):
-            raise TypeError("All elements of the list must be a Cat object")
-        self.catlist = catlist
-        
-        
-    def add_cat(self, cat):
-     
+        else:
+            # a generator would be used up by the check below
+            catlist = list(catlist)
+            if not all(isinstance(cat,Cat) for cat in catlist):
+                raise TypeError("All elements of the list must be a Cat object")
+        self._store = CatStore(capacity=len(catlist))
+        self._store.bind_many(catlist)
+        # IDs of the cats of a view (see __getitem__), None for a whole Clowder
+        self._view_ids = None
+
+    @classmethod
+    def from_records(cls, records, quiet=True, chunk_size=10000):
         """
-        Adds a Cat to the Clowder
+        Creates a Clowder directly from cat records.
+
+        The records are consumed in chunks and written straight into the
+        columnar storage: no Cat object is created until one is requested
+        (e.g. through catlist), and colors are interpreted once per distinct
+        spelling in each chunk. Records can come from a generator, so that
+        they never all have to be held in memory.
 
         Parameters
         ----------
-        cat: pycCatSim.Cat
-            the new Cat to add
+        records : iterable of dict
+            One mapping per cat with a 'name' key and, optionally, 'age',
+            'color', 'mood', 'hunger_level', 'energy' and 'health' keys.
+        quiet : bool, optional
+            If False, report how each distinct color was interpreted. Default is True.
+        chunk_size : int, optional
+            Number of records processed at a time. Default is 10000.
+
+        Raises
+        ------
+        KeyError
+            If a record has no name.
+
+        Returns
+        -------
+        pyCatSim.Clowder
+            The new Clowder.
+
+        See also
+        --------
+
+        pyCatSim.utils.ingest.stream_records: Processes records chunk by chunk without building a Clowder
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder.from_records([
+                {'name': 'Nutmeg', 'age': 3, 'color': 'tortoiseshell'},
+                {'name': 'Chestnut', 'color': 'tabby', 'hunger_level': 2},
+            ])
+            print(group.hunger_level)
+
+        """
+        return cls._from_chunks(stream_records(records, chunk_size, _color_parser(quiet)))
+
+    @classmethod
+    def from_csv(cls, path, quiet=True, chunk_size=10000):
+        """
+        Creates a Clowder from a CSV file, reading it in chunks.
+
+        Parameters
+        ----------
+        path : str or path-like
+            A CSV file whose first row holds the column names: 'name' and,
+            optionally, 'age', 'color', 'mood', 'hunger_level', 'energy' and
+            'health'. Empty cells take their default value.
+        quiet : bool, optional
+            If False, report how each distinct color was interpreted. Default is True.
+        chunk_size : int, optional
+            Number of rows processed at a time. Default is 10000.
+
+        Returns
+        -------
+        pyCatSim.Clowder
+            The new Clowder.
+
+        See also
+        --------
+
+        pyCatSim.utils.ingest.stream_csv: Reads a CSV file chunk by chunk without building a Clowder
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            with open('cats.csv', 'w') as f:
+                f.write("name,age,color,mood\nNutmeg,3,tortoiseshell,2\nUna,,black,\n")
+            group = cats.Clowder.from_csv('cats.csv')
+            print(group.age, group.mood)
+
+        """
+        return cls._from_chunks(stream_csv(path, chunk_size, _color_parser(quiet)))
+
+    @classmethod
+    def from_jsonl(cls, path, quiet=True, chunk_size=10000):
+        """
+        Creates a Clowder from a JSON Lines file, reading it in chunks.
+
+        Parameters
+        ----------
+        path : str or path-like
+            A file with one JSON object per line, with the same keys as the
+            records of Clowder.from_records.
+        quiet : bool, optional
+            If False, report how each distinct color was interpreted. Default is True.
+        chunk_size : int, optional
+            Number of lines processed at a time. Default is 10000.
+
+        Returns
+        -------
+        pyCatSim.Clowder
+            The new Clowder.
+
+        See also
+        --------
+
+        pyCatSim.utils.ingest.stream_jsonl: Reads a JSON Lines file chunk by chunk without building a Clowder
+
+        """
+        return cls._from_chunks(stream_jsonl(path, chunk_size, _color_parser(quiet)))
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        """Appends chunks of columns (see pyCatSim.utils.ingest) to a new Clowder"""
+        group = cls()
+        for chunk in chunks:
+            names = chunk.pop('name')
+            group._store.extend(names, chunk)
+        return group
+
+    def save(self, path):
+        """
+        Saves the Clowder to a compact binary snapshot.
+
+        Numeric attributes are written as fixed-width columns, colors as
+        integer codes and names as a string table. Cat IDs are kept. The
+        journal, if any, is not saved. A view saves only its own cats.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The file to write.
 
         Raises
         ------
         TypeError
-            If any of the arguments are not Cat instances.
-        
+            If a cat's name is not a str.
+
+        See also
+        --------
+
+        pyCatSim.Clowder.load: Opens a snapshot
+
         Examples
         --------
-        
+
         .. jupyter-execute::
-            
+
             import pyCatSim as cats
-            nutmeg = cats.Cat('Nutmeg')
-            charming = cats.Cat('Charming')
-            maze = cats.Cat('Mazikeen')
-            una = cats.Cat('Una')
-            group = cats.Clowder(catlist = [nutmeg, charming, maze, una])
-            bailey = cats.Cat('Bailey')
-            group.add_cat(bailey)
-        
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i} for i in range(1000))
+            group.save('clowder.pcs')
+            print(cats.Clowder.load('clowder.pcs').mood[:5])
+
         """
-    
-        if not isinstance(cat, Cat):
-                raise TypeError("Only Cat objects can be added.")
-        self.catlist.append(cat)
-    
-    
-    def remove_cat(self,cat):
+        rows = self._rows()
+        save_snapshot(self._store if rows is None else self._store.take(rows), path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
         """
-        Removes a Cat from the Clowder
+        Opens a snapshot written by Clowder.save.
 
         Parameters
         ----------
-        cat: pyCatSim.Cat
-            the Cat to remove
+        path : str or path-like
+            The file to read.
+        mmap : bool, optional
+            If True, the columns are memory-mapped from the file instead of
+            read, so that even a large snapshot opens almost instantly and
+            only the parts that are used get loaded. Changes to the cats stay
+            in memory and never modify the file. Default is True.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a pyCatSim snapshot.
+
+        Returns
+        -------
+        pyCatSim.Clowder
+            The Clowder, with the same cats and IDs as when it was saved.
+
+        """
+        group = cls()
+        group._store = load_snapshot(path, mmap=mmap)
+        return group
+
+    def _cat(self, row):
+        """Returns the Cat viewing a row, creating it on first access"""
+        cat = self._store.cats[row]
+        if cat is None:
+            cat = Cat._from_row(self._store, row)
+            self._store.cats[row] = cat
+        return cat
+
+    def _rows(self):
+        """
+        The rows of the cats, as passed to the vectorized actions of the store
+
+        None for a whole Clowder. For a view, a slice if its cats are in
+        consecutive rows and an array of rows otherwise, looked up again from
+        the IDs of the cats after cats changed rows.
+        """
+        if self._view_ids is None:
+            return None
+        store = self._store
+        if self._view_layout != store.layout:
+            rows = store._row_of_id[self._view_ids]
+            kept = rows >= 0
+            if not kept.all():
+                # cats removed from the Clowder leave its views too
+                self._view_ids = self._view_ids[kept]
+                rows = rows[kept]
+            self._view_rows = _as_slice(rows)
+            self._view_layout = store.layout
+        return self._view_rows
+
+    def _rows_at(self, positions):
+        """The rows of the cats at some positions"""
+        rows = self._rows()
+        if rows is None:
+            return positions
+        if isinstance(rows, slice):
+            return positions + rows.start
+        return rows[positions]
+
+    def _row_list(self):
+        rows = self._rows()
+        if rows is None:
+            return range(self._store.size)
+        if isinstance(rows, slice):
+            return range(rows.start, rows.stop)
+        return rows.tolist()
+
+    def _selects(self, rows):
+        """Whether each of some rows of the store holds a cat of this Clowder"""
+        selected = self._rows()
+        rows = np.asarray(rows)
+        if selected is None:
+            return np.ones(rows.shape, dtype=bool)
+        if isinstance(selected, slice):
+            return (rows >= selected.start) & (rows < selected.stop)
+        return np.isin(rows, selected)
+
+    def _whole(self, action):
+        """Raises an error if this Clowder is a view"""
+        if self._view_ids is not None:
+            raise ValueError(f"Cannot {action} a view of a Clowder; use the Clowder it was taken from.")
+
+    def __getitem__(self, key):
+        """
+        Selects cats by position, in the order of catlist.
+
+        An integer returns a Cat. A slice, a boolean mask or an array of
+        positions returns a view: a Clowder of the selected cats, sharing
+        their state with this Clowder rather than copying it. Actions on the
+        view change the selected cats of this Clowder, and changes made
+        through this Clowder show in the view. A view keeps the same cats
+        even when other cats are added or removed; cats removed from the
+        Clowder leave the view. Cats cannot be added to or removed from a
+        view.
+
+        Parameters
+        ----------
+        key : int, slice, array-like of bool or array-like of int
+            The positions of the cats. A boolean mask has one entry per cat.
+
+        Raises
+        ------
+        IndexError
+            If a position is out of range, a mask does not have one entry per
+            cat or an array selects the same cat twice.
+        TypeError
+            If the key is of any other type.
+
+        Returns
+        -------
+        pyCatSim.Cat or pyCatSim.Clowder
+            The Cat, or a view on the selected cats.
+
+        See also
+        --------
+
+        pyCatSim.Clowder.copy: Copies the cats into an independent Clowder
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i % 5 - 2} for i in range(10))
+            group[group.mood < 0].groom()
+            print(group.mood)
+            print(group[::3].mood, group[[0, 9]].ids)
+
+        """
+        n = len(self)
+        if isinstance(key, (int, np.integer)):
+            position = int(key) + n if key < 0 else int(key)
+            if not 0 <= position < n:
+                raise IndexError("Clowder index out of range")
+            return self._cat(int(self._rows_at(position)))
+        rows = self._rows()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(n)
+            if step == 1 and not isinstance(rows, np.ndarray):
+                offset = 0 if rows is None else rows.start
+                return self._view(slice(offset + start, offset + max(start, stop)))
+            positions = np.arange(start, stop, step)
+        else:
+            key = np.asarray(key)
+            if key.dtype == bool:
+                if key.shape != (n,):
+                    raise IndexError("A boolean mask must have one entry per cat.")
+                positions = np.flatnonzero(key)
+            elif key.ndim == 1 and (key.dtype.kind in 'iu' or not key.size):
+                positions = key.astype(np.int64)
+                positions = np.where(positions < 0, positions + n, positions)
+                if positions.size and (positions.min() < 0 or positions.max() >= n):
+                    raise IndexError("Clowder index out of range")
+                ordered = np.sort(positions)
+                if (ordered[1:] == ordered[:-1]).any():
+                    raise IndexError("A view cannot select the same cat twice.")
+            else:
+                raise TypeError("Clowder indices must be integers, slices, boolean masks or arrays of integers.")
+        return self._view(_as_slice(self._rows_at(positions)))
+
+    def _view(self, rows):
+        """A Clowder of some rows of the store, sharing their state"""
+        view = type(self).__new__(type(self))
+        view._store = self._store
+        ids = self._store._data['id'][rows]
+        view._view_ids = ids.copy() if isinstance(rows, slice) else ids
+        view._view_rows = rows
+        view._view_layout = self._store.layout
+        return view
+
+    def copy(self):
+        """
+        Copies the cats into an independent Clowder.
+
+        The copy has the same cats, with the same names, state and IDs, but
+        changes to one do not affect the other. The journal and the
+        recorder, if any, are not copied. Cat objects of the copy are created
+        when first requested.
+
+        Returns
+        -------
+        pyCatSim.Clowder
+            The copy, a whole Clowder even when copying a view.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i} for i in range(5))
+            happy = group[group.mood > 2].copy()
+            happy.groom()
+            print(happy.mood, group.mood)
+
+        """
+        rows = self._rows()
+        group = type(self)()
+        group._store = self._store.take(slice(0, self._store.size) if rows is None else rows)
+        return group
+
+    @property
+    def catlist(self):
+        return _CatList(self._cat(row) for row in self._row_list())
+
+    def _column(self, field):
+        rows = self._rows()
+        values = self._store.column(field)
+        # a slice of a column is a view; other selections are copies
+        values = values.view() if rows is None else values[rows]
+        values.flags.writeable = False
+        return values
+
+    @property
+    def ids(self):
+        return self._column('id')
+
+    @property
+    def age(self):
+        return self._column('age')
+
+    @property
+    def mood(self):
+        return self._column('mood')
+
+    @property
+    def hunger_level(self):
+        return self._column('hunger_level')
+
+    @property
+    def energy(self):
+        return self._column('energy')
+
+    @property
+    def health(self):
+        return self._column('health')
+
+    def stats(self, verify=False):
+        """
+        Summarizes the state of the cats in the Clowder.
+
+        The statistics are kept up to date as cats are added, removed and
+        act, so this takes constant time after the first call (which
+        computes them once). A minimum or maximum is recomputed when a change
+        may have lowered it (or raised it), e.g. after the cat holding the
+        maximum mood is bathed. The statistics of a view are computed from
+        its cats at each call.
+
+        Parameters
+        ----------
+        verify : bool, optional
+            If True, also recompute every statistic from scratch and check
+            that the running values match (ignored by views). Meant for
+            testing. Default is False.
+
+        Raises
+        ------
+        AssertionError
+            If verify is True and a running statistic is out of sync.
+
+        Returns
+        -------
+        dict
+            'count' (the number of cats), 'colors' (the number of cats of
+            each color, None counting the cats without a color) and, for
+            'mood', 'hunger_level', 'energy' and 'health', a dict with the
+            'sum', 'mean', 'std' (population standard deviation), 'min' and
+            'max' of the attribute (None for an empty Clowder).
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i % 5, 'color': 'tabby'}
+                                              for i in range(1000))
+            group.play()
+            print(group.stats()['mood'])
+            print(group.stats()['colors'])
+
+        """
+        n = len(self)
+        if self._view_ids is None:
+            aggregates = self._store.aggregate()
+            if verify:
+                aggregates.verify()
+            sums, squares, colors = aggregates.sum, aggregates.sumsq, aggregates.colors
+            minimum, maximum = aggregates.minimum, aggregates.maximum
+        else:
+            # a view is summarized from its columns, in one pass over its cats
+            columns = {field: self._column(field) for field in STATE_FIELDS}
+            sums = {field: int(values.sum()) for field, values in columns.items()}
+            squares = {field: int(np.dot(values, values)) for field, values in columns.items()}
+            colors = _color_counts(self._column('color'))
+            minimum = lambda field: int(columns[field].min()) if n else None
+            maximum = lambda field: int(columns[field].max()) if n else None
+        summary = {'count': n}
+        for field in STATE_FIELDS:
+            total = sums[field]
+            if n:
+                mean = total / n
+                std = math.sqrt(max(squares[field] / n - mean * mean, 0.0))
+            else:
+                mean = std = None
+            summary[field] = {'sum': total, 'mean': mean, 'std': std,
+                              'min': minimum(field), 'max': maximum(field)}
+        counts = colors.tolist()
+        summary['colors'] = dict(zip(COLORS + (None,), counts))
+        return summary
+
+    def __len__(self):
+        if self._rows() is None:
+            return self._store.size
+        return len(self._view_ids)
+
+    def __contains__(self, cat):
+        return isinstance(cat, Cat) and cat._store is self._store and bool(self._selects(cat._row))
+
+    def __iter__(self):
+        for row in self._row_list():
+            yield self._cat(row)
+
+    def find(self, name):
+        """
+        Finds the cats with a given name
+
+        The name index is built on the first call and kept up to date
+        afterwards, so each lookup takes constant time.
+
+        Parameters
+        ----------
+        name : str
+            The name to look up.
+
+        Returns
+        -------
+        list of pyCatSim.Cat
+            The cats with this name, in insertion order (empty if there are none).
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            group.find('Una')
+
+        """
+        rows = self._store.rows_named(name)
+        return [self._cat(row) for row, kept in zip(rows, self._selects(rows)) if kept]
+
+    def top_k(self, field, k, largest=True):
+        """
+        Finds the cats with the highest (or lowest) value of an attribute.
+
+        Queries go through an index of the attribute, built on the first
+        query and kept up to date as the cats change, so they do not scan
+        the whole Clowder.
+
+        Parameters
+        ----------
+        field : str
+            One of 'mood', 'hunger_level', 'energy' or 'health'.
+        k : int
+            Number of cats to return.
+        largest : bool, optional
+            If True, find the highest values, otherwise the lowest. Default is True.
 
         Raises
         ------
         ValueError
-            If the Cat is not found in the clowder.
-        
+            If the field is not valid or k is negative.
+
+        Returns
+        -------
+        list of pyCatSim.Cat
+            At most k cats, from the highest (lowest) value.
+
         Examples
         --------
-        
+
         .. jupyter-execute::
-            
+
             import pyCatSim as cats
-            nutmeg = cats.Cat('Nutmeg')
-            charming = cats.Cat('Charming')
-            maze = cats.Cat('Mazikeen')
-            una = cats.Cat('Una')
-            group = cats.Clowder(catlist = [nutmeg, charming, maze, una])
-            group.remove_cat(nutmeg)
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'hunger_level': i % 97}
+                                              for i in range(10000))
+            print([cat.hunger_level for cat in group.top_k('hunger_level', 10)])
+
         """
-        
-        try:
-            self.catlist.remove(cat)
-        except ValueError:
-            raise ValueError("Cat not found in Clowder")
+        if k < 0:
+            raise ValueError("k must be non-negative.")
+        if self._view_ids is None:
+            rows = self._store.top_rows(field, k, largest)
+        else:
+            # a view sorts its own cats rather than querying the index of the whole Clowder
+            if field not in STATE_FIELDS:
+                raise ValueError(f"Cannot query '{field}'. Valid options: {', '.join(STATE_FIELDS)}")
+            values = self._column(field)
+            rows = self._rows_at(np.lexsort((self.ids, -values if largest else values))[:k])
+        return [self._cat(row) for row in np.asarray(rows).tolist()]
+
+    def where(self, **conditions):
+        """
+        Finds the cats whose attributes satisfy all the conditions.
+
+        Conditions are written as keyword arguments `field__op=value`, where
+        field is 'mood', 'hunger_level', 'energy' or 'health' and op is 'lt',
+        'le', 'gt', 'ge' or 'eq' (`field=value` means `field__eq=value`).
+        Each condition goes through an index of its attribute (see top_k), so
+        the cost follows the number of matching cats.
+
+        Parameters
+        ----------
+        **conditions
+            The conditions, e.g. mood__lt=-5.
+
+        Raises
+        ------
+        ValueError
+            If a field or an operator is not valid, or no condition is given.
+
+        Returns
+        -------
+        list of pyCatSim.Cat
+            The matching cats, in the order they joined the Clowder.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i % 21 - 10, 'energy': i % 3}
+                                              for i in range(10000))
+            grumpy = group.where(mood__lt=-8, energy__ge=1)
+            print(len(grumpy))
+
+        """
+        if not conditions:
+            raise ValueError("Specify at least one condition.")
+        rows = None
+        for key, value in conditions.items():
+            field, _, op = key.partition('__')
+            matched = self._store.rows_where(field, op or 'eq', value)
+            rows = matched if rows is None else np.intersect1d(rows, matched)
+        rows = rows[self._selects(rows)]
+        rows = rows[np.argsort(self._store.column('id')[rows])]
+        return [self._cat(row) for row in rows.tolist()]
+
+    def get(self, cat_id):
+        """
+        Returns the cat with a given ID
+
+        Parameters
+        ----------
+        cat_id : int
+            The ID of the cat (see the ids attribute).
+
+        Raises
+        ------
+        KeyError
+            If no cat in the Clowder has this ID.
+
+        Returns
+        -------
+        pyCatSim.Cat
+            The cat.
+
+        """
+        row = self._store.row_of(cat_id)
+        if row < 0 or not self._selects(row):
+            raise KeyError(f"No cat with ID {cat_id} in Clowder")
+        return self._cat(row)
+
+    def add_cat(self, cat):
+
+        """
+        Adds a Cat to the Clowder
+
+        Parameters
+        ----------
+        cat: pycCatSim.Cat
+            the new Cat to add
+
+        Raises
+        ------
+        TypeError
+            If any of the arguments are not Cat instances.
+        ValueError
+            If the Cat already belongs to a Clowder (remove it from that one
+            first), has a state attribute that is not a whole number or a
+            color that is not valid, or this Clowder is a view.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            nutmeg = cats.Cat('Nutmeg')
+            charming = cats.Cat('Charming')
+            maze = cats.Cat('Mazikeen')
+            una = cats.Cat('Una')
+            group = cats.Clowder(catlist = [nutmeg, charming, maze, una])
+            bailey = cats.Cat('Bailey')
+            group.add_cat(bailey)
+
+        """
+
+        self._whole("add cats to")
+        if not isinstance(cat, Cat):
+                raise TypeError("Only Cat objects can be added.")
+        self._store.bind(cat)
+
+
+    def remove_cat(self,cat):
+        """
+        Removes a Cat from the Clowder
+
+        The Cat keeps its current state and becomes a standalone Cat again.
+        Removal takes constant time: the last cat of the Clowder takes the
+        place of the removed one.
+
+        Parameters
+        ----------
+        cat: pyCatSim.Cat
+            the Cat to remove
+
+        Raises
+        ------
+        ValueError
+            If the Cat is not found in the clowder, or the clowder is a view.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            nutmeg = cats.Cat('Nutmeg')
+            charming = cats.Cat('Charming')
+            maze = cats.Cat('Mazikeen')
+            una = cats.Cat('Una')
+            group = cats.Clowder(catlist = [nutmeg, charming, maze, una])
+            group.remove_cat(nutmeg)
+        """
+
+        self._whole("remove cats from")
+        if not isinstance(cat, Cat) or cat._store is not self._store:
+            raise ValueError("Cat not found in Clowder")
+        self._store.unbind(cat._row)
+
+    def play(self, mood_boost=1, hunger_boost=1, energy_boost=-1):
+        """
+        Simulates playtime with every cat in the Clowder.
+
+        Same rules as pyCatSim.Cat.play, applied to all cats at once.
+
+        Parameters
+        ----------
+        mood_boost : int, optional
+            How much mood improves from play. Must be an integer. Default is 1.
+        hunger_boost : int, optional
+            How much hunger increases from play. Must be a positive integer. Default is 1.
+        energy_boost : int, optional
+            How much energy decreases from play. Must be a negative integer. Default is -1.
+
+        Raises
+        ------
+        TypeError
+            If any of the arguments are not integers.
+        ValueError
+            If hunger_boost is not positive or energy_boost is not negative.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            group.play()
+            print(group.mood)
+
+        """
+        _check_play_args(mood_boost, hunger_boost, energy_boost)
+        self._store.play(mood_boost, hunger_boost, energy_boost, rows=self._rows())
+
+    def bathe(self):
+        """
+        Bathes every cat in the Clowder, decreasing mood by 1 and increasing health by 1.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            group.bathe()
+            print(group.health)
+
+        """
+        self._store.bathe(rows=self._rows())
+
+    def groom(self):
+        """
+        Grooms every cat in the Clowder, increasing health and mood by 1.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            group.groom()
+            print(group.mood)
+
+        """
+        self._store.groom(rows=self._rows())
+
+    def eat(self):
+        """
+        Feeds every cat in the Clowder.
+
+        Decreases `hunger_level` by 1 (to a minimum of 0) and increases `mood` by 1.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg', hunger_level=2), cats.Cat('Una')])
+            group.eat()
+            print(group.hunger_level)
+
+        """
+        self._store.eat(rows=self._rows())
+
+    def sleep(self, duration=0):
+        """
+        Has every cat in the Clowder sleep for the same duration.
+
+        Each cat gains 1 energy level for every 3 hours of sleep (rounded down).
+
+        Parameters
+        ----------
+        duration : int or float, optional
+            Number of hours the cats sleep. Must be an integer or float. The default is 0.
+
+        Raises
+        ------
+        TypeError
+            If duration is neither an integer nor float.
+        ValueError
+            If duration is not positive or is greater than 16.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            group.sleep(duration=7)
+            print(group.energy)
+
+        """
+        _check_sleep_duration(duration)
+        self._store.sleep(duration, rows=self._rows())
+
+    def act(self, actions, sleep_duration=0):
+        """
+        Has each cat in the Clowder take its own action, in one vectorized pass.
+
+        Parameters
+        ----------
+        actions : array-like of int
+            One action code per cat, as an index in pyCatSim.utils.store.ACTIONS
+            ('idle', 'play', 'bathe', 'groom', 'eat', 'sleep'). Actions follow
+            the same rules as the Cat methods, with default arguments.
+        sleep_duration : int or float, optional
+            Hours slept by the cats whose action is 'sleep'. Default is 0.
+
+        Raises
+        ------
+        ValueError
+            If there is not one valid action code per cat.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg', hunger_level=2), cats.Cat('Una')])
+            group.act([4, 1])  # Nutmeg eats, Una plays
+            print(group.hunger_level)
+
+        """
+        _check_sleep_duration(sleep_duration)
+        codes = np.asarray(actions)
+        if codes.shape != (len(self),):
+            raise ValueError("actions must contain one action code per cat.")
+        if codes.size and (codes.min() < 0 or codes.max() >= len(ACTIONS)):
+            raise ValueError(f"Invalid action code. Valid codes are 0 to {len(ACTIONS) - 1}.")
+        self._store.apply_actions(codes, sleep_duration, rows=self._rows())
+
+    def make_noises(self, weights=None, seed=None):
+        """
+        Draws a random noise for every cat in the Clowder, in one vectorized pass.
+
+        Parameters
+        ----------
+        weights : dict, array-like or callable, optional
+            Relative weight of each noise: a dict mapping noise names to a
+            weight or to one weight per cat, an array with one column per
+            noise, or a function of the Clowder returning either. Default is
+            None (hungry cats meow more, happy cats purr more and grumpy cats
+            hiss more).
+        seed : int or numpy.random.Generator, optional
+            Seed of the random number generator. Default is None.
+
+        Raises
+        ------
+        ValueError
+            If the weights are invalid.
+
+        Returns
+        -------
+        numpy.ndarray of int8
+            One code per cat, as an index in pyCatSim.utils.behavior.NOISES
+            ('meow', 'purr', 'chatter', 'hiss', 'chirrup').
+
+        See also
+        --------
+
+        pyCatSim.utils.behavior.draw_noises: Draws noises with given weights
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import numpy as np
+            import pyCatSim as cats
+            from pyCatSim.utils.behavior import NOISES, NOISE_TEXT
+            group = cats.Clowder([cats.Cat('Nutmeg', mood=-10), cats.Cat('Una', mood=10)])
+            codes = group.make_noises(seed=0)
+            print([NOISES[code] for code in codes])
+
+            codes = group.make_noises(weights={'meow': 1, 'hiss': group.mood < 0}, seed=0)
+            print(np.asarray(NOISE_TEXT)[codes])
+
+        """
+        return draw_noises(self, weights, seed)
+
+    def chorus(self, output, noises=None, starts=0, gains=None, duration=None, seed=None, rate=RATE):
+        """
+        Records every cat of the Clowder making a noise, mixed into one WAV file.
+
+        Each clip is decoded once and the noises of all the cats are mixed in
+        a vectorized pass, so a chorus of thousands of cats renders much
+        faster than real time. Decoding the clips requires the optional
+        soundfile package. See pyCatSim.utils.mixer.mix for schedules with
+        several noises per cat.
+
+        Parameters
+        ----------
+        output : str, path-like or file-like
+            Where to write the WAV.
+        noises : array-like of str or int, optional
+            The noise of each cat, as a name or a code into
+            pyCatSim.utils.behavior.NOISES. Default is None (drawn with
+            make_noises).
+        starts : float or array-like of float, optional
+            When each cat starts, in seconds. Default is 0.
+        gains : float or array-like of float, optional
+            Volume of each cat. Default is None (1 for every cat).
+        duration : float, optional
+            Length of the recording, in seconds. Default is None (until the
+            last noise ends).
+        seed : int or numpy.random.Generator, optional
+            Seed used to draw the noises, if not given. Default is None.
+        rate : int, optional
+            Sample rate, in Hz. Default is 22050.
+
+        Raises
+        ------
+        ImportError
+            If soundfile is not installed.
+
+        Returns
+        -------
+        The output
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import io
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'mood': i % 7 - 3} for i in range(100))
+            wav = group.chorus(io.BytesIO(), starts=[i * 0.05 for i in range(100)], duration=8, seed=0)
+            print(len(wav.getvalue()))
+
+        """
+        n = len(self)
+        if noises is None:
+            noises = self.make_noises(seed=seed)
+        cats = np.arange(n)
+        starts = np.broadcast_to(np.asarray(starts, dtype=np.float64), (n,))
+        if gains is not None:
+            gains = np.broadcast_to(np.asarray(gains, dtype=np.float64), (n,))
+        samples = mix(cats, noises, starts, gains=gains, rate=rate, duration=duration)
+        return write_wav(samples, output, rate)
+
+    def random_actions(self, weights=None, seed=None):
+        """
+        Draws a random action for every cat in the Clowder, in one vectorized pass.
+
+        The cats do not act: pass the codes to act to apply them.
+
+        Parameters
+        ----------
+        weights : dict, array-like or callable, optional
+            Relative weight of each action, as in make_noises but with action
+            names. Default is None (hungry cats eat more, tired cats sleep
+            more and rested cats play more).
+        seed : int or numpy.random.Generator, optional
+            Seed of the random number generator. Default is None.
+
+        Raises
+        ------
+        ValueError
+            If the weights are invalid.
+
+        Returns
+        -------
+        numpy.ndarray of int8
+            One code per cat, as an index in pyCatSim.utils.store.ACTIONS.
+
+        See also
+        --------
+
+        pyCatSim.utils.simulation.weighted_policy: Draws actions like this at every tick of a simulation
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg', hunger_level=20), cats.Cat('Una', energy=-20)])
+            codes = group.random_actions(seed=0)
+            print(codes)
+            group.act(codes)
+
+        """
+        return draw_actions(self, weights, seed)
+
+    def simulate(self, n_steps, policy=None, sleep_duration=8, seed=None, record_stats=False):
+        """
+        Runs the Clowder forward in time.
+
+        At every tick the policy chooses one action per cat and all cats are
+        updated at once; a view only updates its own cats. See
+        pyCatSim.utils.simulation.simulate for details.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of ticks to simulate.
+        policy : callable, optional
+            Called as policy(clowder, tick, rng) at every tick; returns one
+            action code per cat. Default is a uniformly random policy.
+        sleep_duration : int or float, optional
+            Hours slept by a cat whose action is 'sleep'. Default is 8.
+        seed : int or numpy.random.Generator, optional
+            Seed of the random number generator passed to the policy. Default is None.
+        record_stats : bool, optional
+            Whether to record summary statistics at every tick. Default is False.
+
+        Returns
+        -------
+        pyCatSim.utils.simulation.SimulationResult
+            Throughput (cat-ticks per second) and, optionally, per-tick statistics.
+
+        See also
+        --------
+
+        pyCatSim.utils.simulation.random_policy: Cats pick random actions
+
+        pyCatSim.utils.simulation.needs_policy: Cats attend to their most pressing need
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            from pyCatSim.utils.simulation import needs_policy
+            group = cats.Clowder.from_records({'name': f'cat{i}'} for i in range(1000))
+            result = group.simulate(100, policy=needs_policy(), seed=1, record_stats=True)
+            print(result.throughput, result.stats['mood']['mean'][-1])
+
+        """
+        return simulate(self, n_steps, policy=policy, sleep_duration=sleep_duration,
+                        seed=seed, record_stats=record_stats)
+
+    def render_grid(self, output, columns=None, size=96, labels=True):
+        """
+        Draws every cat of the Clowder in one mosaic PNG, without opening a window.
+
+        Each cat is a square tile with the picture of its coat and, unless
+        labels is False, its name and state written on it. Tiles come from
+        thumbnails built once per color and size, and the mosaic is written
+        one row of tiles at a time, so thousands of cats take seconds and
+        little memory.
+
+        Parameters
+        ----------
+        output : str, path-like or file-like
+            Where to write the PNG.
+        columns : int, optional
+            Number of tiles per row. Default is None (a roughly square mosaic).
+        size : int, optional
+            Width and height of each tile, in pixels. Default is 96.
+        labels : bool, optional
+            Whether to write the name, mood, hunger level, energy and health
+            of each cat on its tile. Default is True.
+
+        Returns
+        -------
+        The output
+
+        See also
+        --------
+
+        pyCatSim.utils.display.render_grid: Composes a mosaic from colors and labels
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import io
+            import pyCatSim as cats
+            group = cats.Clowder.from_records({'name': f'cat{i}', 'color': ['tabby', 'black', 'tuxedo'][i % 3],
+                                               'mood': i % 5} for i in range(12))
+            png = group.render_grid(io.BytesIO(), columns=4)
+            print(len(png.getvalue()))
+
+        """
+        codes = self._column('color').tolist()
+        colors = [COLORS[code] if code >= 0 else None for code in codes]
+        text = None
+        if labels:
+            names = [self._store.names[row] for row in self._row_list()]
+            text = [f"{name}\nmood {mood} hunger {hunger}\nenergy {energy} health {health}"
+                    for name, mood, hunger, energy, health
+                    in zip(names, *(self._column(field).tolist() for field in STATE_FIELDS))]
+        return render_grid(colors, text, output, columns=columns, size=size)
+
+    async def ashow(self, outputs=None):
+        """
+        Renders a picture of every cat as a PNG, without blocking the event loop.
+
+        The pictures are rendered concurrently on the worker threads of the
+        asyncio API (see pyCatSim.utils.aio.set_max_workers).
+
+        Parameters
+        ----------
+        outputs : list, optional
+            One output per cat: str, path-like or file-like. Default is None
+            (a new io.BytesIO per cat).
+
+        Raises
+        ------
+        ValueError
+            If there is not one output per cat.
+
+        Returns
+        -------
+        list
+            The outputs, holding the PNGs, in the order of the cats.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import asyncio
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg', color='tabby'), cats.Cat('Una', color='black')])
+            pictures = asyncio.run(group.ashow())
+            print([len(png.getvalue()) for png in pictures])
+
+        """
+        import asyncio
+        cats = self.catlist
+        if outputs is None:
+            outputs = [None] * len(cats)
+        if len(outputs) != len(cats):
+            raise ValueError("outputs must contain one output per cat.")
+        return list(await asyncio.gather(*[cat.ashow(output) for cat, output in zip(cats, outputs)]))
+
+    def attach_journal(self, journal=None):
+        """
+        Starts recording every change to the state of the cats in a journal.
+
+        Actions on the Clowder, on its cats and care given by an Owner are
+        recorded, one record per cat, with the change of each attribute.
+        Recording has no cost when no journal is attached.
+
+        Parameters
+        ----------
+        journal : pyCatSim.utils.journal.Journal, optional
+            The journal to record into. Default is None (a new Journal).
+
+        Raises
+        ------
+        ValueError
+            If this Clowder is a view.
+
+        Returns
+        -------
+        pyCatSim.utils.journal.Journal
+            The attached journal.
+
+        See also
+        --------
+
+        pyCatSim.utils.journal.replay: Rebuilds the state of a Clowder from a journal
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+            journal = group.attach_journal()
+            group.groom()
+            print(len(journal))
+
+        """
+        self._whole("attach a journal to")
+        if journal is None:
+            journal = Journal()
+        self._store.journal = journal
+        return journal
+
+    def detach_journal(self):
+        """
+        Stops recording changes.
+
+        Raises
+        ------
+        ValueError
+            If this Clowder is a view.
+
+        Returns
+        -------
+        pyCatSim.utils.journal.Journal or None
+            The journal that was attached, if any.
+
+        """
+        self._whole("detach a journal from")
+        journal, self._store.journal = self._store.journal, None
+        return journal
+
+    def attach_recorder(self, recorder=None):
+        """
+        Starts recording the state of every cat over time.
+
+        The current state is recorded as tick 0, then simulate records the
+        state after each tick (see the stride of the recorder). Outside of
+        simulate, call the advance method of the recorder to record a tick.
+
+        Parameters
+        ----------
+        recorder : pyCatSim.utils.recorder.Recorder, optional
+            The recorder, which must not have been attached before. Default
+            is None (a new Recorder of all the state attributes).
+
+        Raises
+        ------
+        ValueError
+            If the recorder was already attached, or this Clowder is a view.
+
+        Returns
+        -------
+        pyCatSim.utils.recorder.Recorder
+            The attached recorder.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            nutmeg, una = cats.Cat('Nutmeg'), cats.Cat('Una')
+            group = cats.Clowder([nutmeg, una])
+            recorder = group.attach_recorder()
+            nutmeg.play()
+            recorder.advance()
+            group.groom()
+            recorder.advance()
+            print(recorder.read()['mood'])
+
+        """
+        self._whole("attach a recorder to")
+        if recorder is None:
+            recorder = Recorder()
+        recorder.start(self._store)
+        self._store.recorder = recorder
+        return recorder
+
+    def detach_recorder(self):
+        """
+        Stops recording the state of the cats.
+
+        Raises
+        ------
+        ValueError
+            If this Clowder is a view.
+
+        Returns
+        -------
+        pyCatSim.utils.recorder.Recorder or None
+            The recorder that was attached, if any. Its recording can still be read.
+
+        """
+        self._whole("detach a recorder from")
+        recorder, self._store.recorder = self._store.recorder, None
+        if recorder is not None:
+            recorder.flush()
+        return recorder
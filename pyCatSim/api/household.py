@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The household module keeps track of which owners care for which cats
+"""
+
+import numpy as np
+
+from .cat import Cat
+from .human import Owner
+
+
+def _gather(indptr, indices, rows):
+    """Concatenates indices[indptr[r]:indptr[r + 1]] for every r in rows, without a Python loop"""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    # Position of each row's block in the output
+    outputs = np.cumsum(lengths) - lengths
+    return indices[np.repeat(starts - outputs, lengths) + np.arange(lengths.sum())]
+
+
+def _sorted_unique(values):
+    """Sorted values without duplicates (faster than numpy.unique for large integer arrays)"""
+    values = np.sort(values)
+    keep = np.ones(len(values), dtype=bool)
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+def _indptr(rows, n_rows):
+    """Start of each row in compressed sparse arrays sorted by row"""
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return indptr
+
+
+class Household:
+    """
+    Registry of the owner-cat relationships of many owners.
+
+    Owners and cats are numbered in the order they are registered. The
+    relationships (edges) are kept in integer arrays, compressed by owner
+    (CSR) and by cat (CSC), so that the cats of an owner and the owners of a
+    cat are found in time proportional to their number, and millions of
+    edges take a few bytes each rather than a Python object each. Edges
+    added or removed since the last query are merged on the next query.
+
+    Parameters
+    ----------
+    owners : list of pyCatSim.Owner, optional
+        Owners to register, together with the cats they own. Default is None.
+
+    Attributes
+    ----------
+    owners : list of pyCatSim.Owner
+        The registered owners, by index.
+    cats : list of pyCatSim.Cat
+        The registered cats, by index.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        whiskers = cats.Cat(name="Whiskers")
+        boots = cats.Cat(name="Boots", color="tabby")
+        sasha = cats.Owner(name="Sasha", cats_owned=whiskers)
+        liam = cats.Owner(name="Liam", cats_owned=[whiskers, boots])
+
+        home = cats.Household([sasha, liam])
+        print([owner.name for owner in home.owners_of(whiskers)])
+        print([owner.name for owner in home.affected_owners([boots])])
+
+    """
+
+    def __init__(self, owners=None):
+        self.owners = []
+        self.cats = []
+        self._owner_index = {}
+        self._cat_index = {}
+        # Edges (owner index, cat index) added or removed since the last compression
+        self._added = []
+        self._removed = []
+        self._edges = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        self._csr = None
+        self._csc = None
+        for owner in owners or []:
+            self.add_owner(owner)
+
+    def __len__(self):
+        return len(self.owners)
+
+    @property
+    def n_edges(self):
+        """Number of owner-cat relationships"""
+        self._compress()
+        return len(self._edges[0])
+
+    def add_cat(self, cat):
+        """
+        Registers a cat, if it is not registered yet.
+
+        Parameters
+        ----------
+        cat : pyCatSim.Cat
+            The cat to register.
+
+        Raises
+        ------
+        TypeError
+            If cat is not a Cat.
+
+        Returns
+        -------
+        int
+            The index of the cat.
+
+        """
+        index = self._cat_index.get(cat)
+        if index is None:
+            if not isinstance(cat, Cat):
+                raise TypeError("cat must be an instance of Cat.")
+            index = self._cat_index[cat] = len(self.cats)
+            self.cats.append(cat)
+            # the compressed arrays need a row for the new cat
+            self._csr = self._csc = None
+        return index
+
+    def add_owner(self, owner):
+        """
+        Registers an owner and the cats it owns.
+
+        Parameters
+        ----------
+        owner : pyCatSim.Owner
+            The owner to register.
+
+        Raises
+        ------
+        TypeError
+            If owner is not an Owner.
+        ValueError
+            If the owner is already registered.
+
+        Returns
+        -------
+        int
+            The index of the owner.
+
+        """
+        if not isinstance(owner, Owner):
+            raise TypeError("owner must be an instance of Owner.")
+        if owner in self._owner_index:
+            raise ValueError(f"Owner '{owner.name}' is already registered.")
+        index = self._owner_index[owner] = len(self.owners)
+        self.owners.append(owner)
+        self._csr = self._csc = None
+        cat_indices = [self.add_cat(cat) for cat in owner.cats_owned]
+        self.link(np.full(len(cat_indices), index), cat_indices)
+        return index
+
+    def adopt(self, owner, cats):
+        """
+        Has a registered owner adopt cats, recording the new relationships.
+
+        Parameters
+        ----------
+        owner : pyCatSim.Owner
+            A registered owner.
+        cats : pyCatSim.Cat or list of pyCatSim.Cat
+            The cats to adopt. They are registered if needed.
+
+        Raises
+        ------
+        KeyError
+            If the owner is not registered.
+        ValueError
+            If the owner already owns one of the cats.
+
+        See also
+        --------
+
+        pyCatSim.Owner.adopt: Adopts cats outside of a household
+
+        """
+        index = self._owner_index[owner]
+        owner.adopt(cats)
+        cats = [cats] if isinstance(cats, Cat) else cats
+        cat_indices = [self.add_cat(cat) for cat in cats]
+        self.link(np.full(len(cat_indices), index), cat_indices)
+
+    def link(self, owner_indices, cat_indices):
+        """
+        Records relationships between registered owners and cats, by index.
+
+        This is the vectorized way of building a large household: it only
+        updates the registry, not the cats_owned lists of the Owner objects.
+        Relationships that already exist are ignored.
+
+        Parameters
+        ----------
+        owner_indices : array-like of int
+            The index of the owner of each relationship.
+        cat_indices : array-like of int
+            The index of the cat of each relationship.
+
+        Raises
+        ------
+        IndexError
+            If an index does not refer to a registered owner or cat.
+
+        """
+        owner_indices, cat_indices = self._check_edges(owner_indices, cat_indices)
+        if owner_indices.size:
+            if self._removed:
+                # apply pending removals first, so that relinking an edge keeps it
+                self._compress()
+            self._added.append((owner_indices, cat_indices))
+            self._csr = self._csc = None
+
+    def unlink(self, owner_indices, cat_indices):
+        """
+        Removes relationships between registered owners and cats, by index.
+
+        As with link, the cats_owned lists of the Owner objects are not
+        changed. Relationships that do not exist are ignored.
+
+        Parameters
+        ----------
+        owner_indices : array-like of int
+            The index of the owner of each relationship.
+        cat_indices : array-like of int
+            The index of the cat of each relationship.
+
+        """
+        owner_indices, cat_indices = self._check_edges(owner_indices, cat_indices)
+        if owner_indices.size:
+            self._compress()
+            self._removed.append((owner_indices, cat_indices))
+            self._csr = self._csc = None
+
+    def _check_edges(self, owner_indices, cat_indices):
+        owner_indices = np.asarray(owner_indices, dtype=np.int64).ravel()
+        cat_indices = np.asarray(cat_indices, dtype=np.int64).ravel()
+        if owner_indices.shape != cat_indices.shape:
+            raise ValueError("owner_indices and cat_indices must have the same length.")
+        for indices, n, label in ((owner_indices, len(self.owners), 'owner'),
+                                  (cat_indices, len(self.cats), 'cat')):
+            if indices.size and (indices.min() < 0 or indices.max() >= n):
+                raise IndexError(f"Unknown {label} index.")
+        return owner_indices, cat_indices
+
+    def _compress(self):
+        """Merges pending changes into the edge list and rebuilds the compressed arrays"""
+        if self._csr is not None:
+            return
+        owners, cats = self._edges
+        n_cats = max(len(self.cats), 1)
+        # Each edge is encoded as one integer; sorting the codes sorts the edges by owner, then cat
+        keys = owners * n_cats + cats
+        if self._added:
+            added = np.concatenate([o * n_cats + c for o, c in self._added])
+            keys = _sorted_unique(np.concatenate([keys, added]))
+        if self._removed:
+            removed = np.concatenate([o * n_cats + c for o, c in self._removed])
+            keys = keys[~np.isin(keys, removed)]
+        self._added = []
+        self._removed = []
+        owners, cats = np.divmod(keys, n_cats)
+        self._edges = (owners, cats)
+        self._csr = (_indptr(owners, len(self.owners)), cats)
+        # A stable sort by cat keeps the owners of each cat in increasing order
+        order = np.argsort(cats, kind='stable')
+        self._csc = (_indptr(cats, len(self.cats)), owners[order])
+
+    def cat_indices_of(self, owner_index):
+        """
+        Indices of the cats of an owner, in O(degree).
+
+        Parameters
+        ----------
+        owner_index : int
+            The index of the owner.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices of its cats, in increasing order.
+
+        """
+        self._compress()
+        indptr, indices = self._csr
+        return indices[indptr[owner_index]:indptr[owner_index + 1]]
+
+    def owner_indices_of(self, cat_index):
+        """
+        Indices of the owners of a cat, in O(degree).
+
+        Parameters
+        ----------
+        cat_index : int
+            The index of the cat.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices of its owners, in increasing order.
+
+        """
+        self._compress()
+        indptr, indices = self._csc
+        return indices[indptr[cat_index]:indptr[cat_index + 1]]
+
+    def cats_of(self, owner):
+        """
+        The cats of a registered owner.
+
+        Parameters
+        ----------
+        owner : pyCatSim.Owner
+            The owner.
+
+        Raises
+        ------
+        KeyError
+            If the owner is not registered.
+
+        Returns
+        -------
+        list of pyCatSim.Cat
+
+        """
+        return [self.cats[i] for i in self.cat_indices_of(self._owner_index[owner]).tolist()]
+
+    def owners_of(self, cat):
+        """
+        The owners of a registered cat.
+
+        Parameters
+        ----------
+        cat : pyCatSim.Cat
+            The cat.
+
+        Raises
+        ------
+        KeyError
+            If the cat is not registered.
+
+        Returns
+        -------
+        list of pyCatSim.Owner
+
+        """
+        return [self.owners[i] for i in self.owner_indices_of(self._cat_index[cat]).tolist()]
+
+    def degrees(self):
+        """
+        Number of relationships of every owner and every cat.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The number of cats of each owner and the number of owners of each cat.
+
+        """
+        self._compress()
+        return np.diff(self._csr[0]), np.diff(self._csc[0])
+
+    def affected_owner_indices(self, cat_indices):
+        """
+        Indices of the owners of any of the given cats, in one vectorized pass.
+
+        Parameters
+        ----------
+        cat_indices : array-like of int
+            The indices of the cats, e.g. the cats that changed.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices of their owners, sorted and without duplicates.
+
+        """
+        self._compress()
+        cat_indices = np.asarray(cat_indices, dtype=np.int64).ravel()
+        indptr, indices = self._csc
+        return _sorted_unique(_gather(indptr, indices, cat_indices))
+
+    def affected_owners(self, cats):
+        """
+        The owners affected by a change to some cats.
+
+        Parameters
+        ----------
+        cats : list of pyCatSim.Cat
+            The cats that changed. Cats that are not registered have no owner.
+
+        Returns
+        -------
+        list of pyCatSim.Owner
+            The owners of any of the cats, in the order they were registered.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            litter = cats.Cat.bulk([f'cat{i}' for i in range(6)])
+            owners = [cats.Owner(f'Owner{i}', litter[i:i + 3]) for i in range(4)]
+            home = cats.Household(owners)
+            print([owner.name for owner in home.affected_owners(litter[:2])])
+
+        """
+        indices = [self._cat_index[cat] for cat in cats if cat in self._cat_index]
+        return [self.owners[i] for i in self.affected_owner_indices(indices).tolist()]
@@ -6,6 +6,15 @@ The human module controls the behavior of humans around cats
 
 from ..api.cat import Cat
 from ..utils import facts
+from ..utils.store import FEED, OWNER_GROOM
+
+import numpy as np
+
+# Changes made by each kind of care, see Owner._care
+_CARE = {
+    FEED: {'hunger_level': -1, 'mood': 1},
+    OWNER_GROOM: {'mood': 1},
+}
 
 
 class Owner:
@@ -24,12 +33,15 @@ class Owner:
     name : str
         The name of the owner.
     cats_owned : list of Cat
-        The list of Cat objects owned by this person.
+        A copy of the list of Cat objects owned by this person. It is
+        read-only: use adopt to add cats.
 
     Raises
     ------
     TypeError
         If cats_owned is neither a Cat nor a list of Cat objects.
+    ValueError
+        If the same Cat appears more than once in cats_owned.
 
     Examples
     --------
@@ -64,16 +76,82 @@ class Owner:
             raise TypeError("cats_owned must be a Cat instance or a list of Cat instances.")
 
         self.name = name
-        self.cats_owned = cats_owned
+        self._cats = list(cats_owned)
+        # Identity-hashed index of the cats owned, for constant-time ownership checks
+        self._owned = set(self._cats)
+        if len(self._owned) != len(self._cats):
+            raise ValueError("The same cat cannot be owned twice.")
+
+    @property
+    def cats_owned(self):
+        # a copy, so that the list cannot get out of sync with the index
+        return list(self._cats)
+
+    def owns(self, cat):
+        """
+        Checks whether this owner owns a cat, in constant time
+
+        Parameters
+        ----------
+        cat : pyCatSim.Cat
+            The cat to check.
+
+        Returns
+        -------
+        bool
+            True if the cat is owned by this owner.
+
+        """
+        return cat in self._owned
+
+    def _check_owned(self, cats):
+        """Validates ownership of several cats at once, returning them without duplicates"""
+        cats = list(dict.fromkeys(cats))
+        if not all(cat in self._owned for cat in cats):
+            raise ValueError("This owner does not own the specified cat.")
+        return cats
+
+    @staticmethod
+    def _care(cats, event):
+        """
+        Feeds (FEED) or grooms (OWNER_GROOM) several cats in one pass per Clowder.
+
+        Cats that live in a Clowder are updated with one vectorized operation
+        per Clowder, recorded under the event in its journal if any;
+        standalone cats are updated one by one.
+        """
+        rows_by_store = {}
+        for cat in cats:
+            if cat._store is None:
+                for field, delta in _CARE[event].items():
+                    setattr(cat, field, getattr(cat, field) + delta)
+                if event == FEED:
+                    cat.hunger_level = max(0, cat.hunger_level)
+            else:
+                rows_by_store.setdefault(cat._store, []).append(cat._row)
+        for store, rows in rows_by_store.items():
+            rows = np.array(rows)
+            if event == FEED:
+                store.eat(rows, code=FEED)
+            else:
+                for field, delta in _CARE[event].items():
+                    store.add(field, delta, rows, code=event)
     
-    def give_fact(self):
+    def give_fact(self, k=None, rng=None):
         """
         Gives a random fact about cats
+
+        Parameters
+        ----------
+        k : int, optional
+            Number of facts to give, drawn in one call. Default is None (a single fact).
+        rng : int or numpy.random.Generator, optional
+            Seed or generator used for the draw. Default is None.
         
         Returns
         -------
-        str
-            A fact randomly chosen from a pre-defined fact pool 
+        str or list of str
+            A fact randomly chosen from a pre-defined fact pool, or k facts
         
         Examples
         --------
@@ -84,21 +162,25 @@ class Owner:
             nutmeg = cats.Cat(name='Nutmeg', age = 3, color = 'tortoiseshell')
             nutmeg.give_fact()
         """ 
-        return facts.random_facts()
+        return facts.random_facts(k, rng=rng)
 
-    def feed(self, cat):
+    def feed(self, cat=None, cats=None):
         """
-        Feed the specified cat owned by this Owner. Decreases `hunger_level` by 1 and Increases `mood` by 1.
+        Feed the specified cat owned by this Owner. Decreases `hunger_level` by 1 (to a minimum of 0) and Increases `mood` by 1.
 
         Parameters
         ----------
-        cat : pyCatSim.Cat
+        cat : pyCatSim.Cat, optional
             The cat to feed. Must be owned by this owner.
+        cats : list of pyCatSim.Cat, optional
+            Several cats to feed at once, instead of cat. Ownership is checked
+            for all of them before any is fed, and each cat is fed once.
 
         Raises
         ------
         ValueError
-            If the specified cat is not owned by this owner.
+            If the specified cat is not owned by this owner, or if both or
+            neither of cat and cats are given.
         AttributeError
             If the cat does not have 'hunger_level' or 'mood' attributes.
             
@@ -112,14 +194,99 @@ class Owner:
     
             
         """
-        if cat not in self.cats_owned:
+        if (cat is None) == (cats is None):
+            raise ValueError("Specify either cat or cats.")
+        if cats is not None:
+            self._care(self._check_owned(cats), FEED)
+            return
+        if cat not in self._owned:
             raise ValueError("This owner does not own the specified cat.")
         if not hasattr(cat, 'hunger_level') or not hasattr(cat, 'mood'):
             raise AttributeError("Cat must have 'hunger_level' and 'mood' attributes.")
 
+        if cat._store is not None:
+            cat._store.eat(cat._row, code=FEED)
+            return
         cat.hunger_level = max(0, cat.hunger_level - 1)
         cat.mood += 1
 
+    def feed_all(self):
+        """
+        Feeds every cat owned by this Owner in a single pass.
+
+        Each cat's `hunger_level` decreases by 1 (to a minimum of 0) and its `mood` increases by 1.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            litter = cats.Cat.bulk(['Nutmeg', 'Chestnut', 'Mochi'], hunger_level=2)
+            john = cats.Owner(name='John', cats_owned=litter)
+            john.feed_all()
+            print([cat.hunger_level for cat in litter])
+
+        """
+        self._care(self._cats, FEED)
+
+    def groom_all(self):
+        """
+        Grooms every cat owned by this Owner in a single pass, increasing their mood by one.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import pyCatSim as cats
+            litter = cats.Cat.bulk(['Nutmeg', 'Chestnut', 'Mochi'])
+            john = cats.Owner(name='John', cats_owned=litter)
+            john.groom_all()
+            print([cat.mood for cat in litter])
+
+        """
+        self._care(self._cats, OWNER_GROOM)
+
+    async def afeed_all(self):
+        """
+        Feeds every cat owned by this Owner, from a coroutine.
+
+        The cats are fed on the event loop's thread, in one pass as with
+        feed_all, after which the coroutine gives way to the other tasks, so
+        that the care routines of many owners interleave on one event loop.
+
+        Examples
+        --------
+
+        .. jupyter-execute::
+
+            import asyncio
+            import pyCatSim as cats
+            owners = [cats.Owner(f'Owner{i}', cats.Cat.bulk(['Nutmeg', 'Mochi'], hunger_level=3))
+                      for i in range(100)]
+
+            async def main():
+                await asyncio.gather(*[owner.afeed_all() for owner in owners])
+
+            asyncio.run(main())
+            print(owners[0].cats_owned[0].hunger_level)
+
+        """
+        import asyncio
+        self.feed_all()
+        await asyncio.sleep(0)
+
+    async def agroom_all(self):
+        """
+        Grooms every cat owned by this Owner, from a coroutine.
+
+        See afeed_all for how the care routines of many owners interleave.
+        """
+        import asyncio
+        self.groom_all()
+        await asyncio.sleep(0)
+
     def adopt(self, cats):
 
         """
@@ -135,7 +302,7 @@ class Owner:
         TypeError
                 If any of the arguments are not Cat.
         ValueError
-                If cats_object is not Cat.
+                If a cat is already owned by this owner, or appears twice in the list.
 
         Examples
         --------
@@ -159,15 +326,19 @@ class Owner:
 
         """
         if isinstance(cats, Cat):
-            self.cats_owned.append(cats)
+            cats = [cats]
         elif isinstance(cats, list):
             if not all(isinstance(cat, Cat) for cat in cats):
                 raise TypeError("All elements in cats_object must be instances of Cat.")
-            else:
-                self.cats_owned+=cats
         else:
             raise TypeError("cats_owned must be a Cat instance or a list of Cat instances.")
 
+        new = set(cats)
+        if len(new) != len(cats) or not self._owned.isdisjoint(new):
+            raise ValueError("This owner already owns the specified cat.")
+        self._cats += cats
+        self._owned |= new
+
         
     def groom(self,Cat):
         """
@@ -194,5 +365,8 @@ class Owner:
 
         """
         
+        if getattr(Cat, '_store', None) is not None:
+            Cat._store.add('mood', 1, Cat._row, code=OWNER_GROOM)
+            return
         Cat.mood += 1
  
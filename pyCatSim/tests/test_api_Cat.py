@@ -197,4 +197,69 @@ class TestcatCatFact:
         "Cats use their whiskers to detect changes in their surroundings.",
         "The average house cat can run at speeds up to 30 mph.",
         "Cats meow only to communicate with humans."
-    ]
\ No newline at end of file
+    ]
+
+class TestcatCatBulk:
+    ''' Test for the bulk constructor and slots '''
+
+    def test_bulk_t0(self, capsys):
+        litter = Cat.bulk(['A', 'B', 'C'], age=1, color=['tabb', 'black', None],
+                          mood=[1, 2, 3])
+        assert [cat.name for cat in litter] == ['A', 'B', 'C']
+        assert [cat.color for cat in litter] == ['tabby', 'black', None]
+        assert [cat.mood for cat in litter] == [1, 2, 3]
+        assert all(cat.age == 1 for cat in litter)
+        assert capsys.readouterr().out == ''
+
+    @pytest.mark.xfail
+    def test_bulk_t1(self):
+        Cat.bulk(['A', 'B'], mood=[1, 2, 3])  # should raise ValueError
+
+    def test_slots_t0(self):
+        cat = Cat(name="Boots", color="tabby", quiet=True)
+        assert not hasattr(cat, '__dict__')
+        litter = Cat.bulk(['A'])
+        assert not hasattr(litter[0], '__dict__')
+
+
+class TestcatCatShowHeadless:
+    ''' Tests for Cat.show() rendering to a buffer '''
+
+    @pytest.mark.parametrize("color", ['tabby', None])
+    def test_show_t0(self, color):
+        import io
+        cat = Cat(name="Boots", color=color, quiet=True)
+        buffer = cat.show(output=io.BytesIO())
+        assert buffer.getvalue().startswith(b'\x89PNG')
+
+
+class TestcatCatNoisePlayback:
+    ''' Test for background playback of Cat noises '''
+
+    def test_noise_t0(self):
+        from pyCatSim.utils import playback
+        backend = playback.RecordingBackend()
+        player = playback.set_backend(backend)
+        try:
+            cat = Cat(name="Boots")
+            handles = [cat.make_noise(noise, play=True) for noise in ['meow', 'hiss', 'purr']]
+            for handle in handles:
+                handle.result(timeout=5)
+            assert [noise for noise, _ in backend.played] == ['meow', 'hiss', 'purr']
+            assert all(path.exists() for _, path in backend.played)
+        finally:
+            player.shutdown()
+            playback._player = None
+
+
+class TestcatCatFactBatch:
+    ''' Test for drawing facts in batches '''
+
+    def test_give_fact_t0(self):
+        from pyCatSim.utils.facts import CAT_FACTS
+        cat = Cat(name="Boots")
+        first = cat.give_fact(5, rng=3)
+        assert first == cat.give_fact(5, rng=3)
+        assert len(first) == 5
+        assert all(fact in CAT_FACTS for fact in first)
+        assert cat.give_fact(rng=3) in CAT_FACTS
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for Household Class
+"""
+
+''' Tests for pyCatSim.api.household.Household
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import numpy as np
+import pytest
+import pyCatSim as cats
+
+
+def _household():
+    whiskers = cats.Cat(name="Whiskers")
+    boots = cats.Cat(name="Boots", color="tabby")
+    nutmeg = cats.Cat(name="Nutmeg")
+    sasha = cats.Owner(name="Sasha", cats_owned=whiskers)
+    liam = cats.Owner(name="Liam", cats_owned=[whiskers, boots])
+    return cats.Household([sasha, liam]), (whiskers, boots, nutmeg), (sasha, liam)
+
+
+class TesthouseholdHouseholdInit:
+    ''' Test for Household instantiation '''
+
+    def test_init_t0(self):
+        home, (whiskers, boots, _), (sasha, liam) = _household()
+        assert len(home) == 2
+        assert home.cats == [whiskers, boots]
+        assert home.n_edges == 3
+
+    def test_init_t1(self):
+        home = cats.Household()
+        assert len(home) == 0
+        assert home.n_edges == 0
+        assert home.affected_owners([cats.Cat('Boots')]) == []
+
+    @pytest.mark.xfail
+    def test_init_t2(self):
+        owner = cats.Owner(name="Sasha", cats_owned=cats.Cat('Boots'))
+        cats.Household([owner, owner])
+
+    @pytest.mark.xfail
+    def test_init_t3(self):
+        cats.Household(['Sasha'])
+
+
+class TesthouseholdHouseholdLookup:
+    ''' Test for lookups in both directions '''
+
+    def test_lookup_t0(self):
+        home, (whiskers, boots, _), (sasha, liam) = _household()
+        assert home.owners_of(whiskers) == [sasha, liam]
+        assert home.owners_of(boots) == [liam]
+        assert home.cats_of(liam) == [whiskers, boots]
+        assert home.cats_of(sasha) == [whiskers]
+
+    def test_lookup_t1(self):
+        home, (whiskers, boots, nutmeg), (sasha, liam) = _household()
+        home.adopt(sasha, nutmeg)
+        assert sasha.owns(nutmeg)
+        assert home.cats_of(sasha) == [whiskers, nutmeg]
+        assert home.owners_of(nutmeg) == [sasha]
+        n_cats, n_owners = home.degrees()
+        assert n_cats.tolist() == [2, 2]
+        assert n_owners.tolist() == [2, 1, 1]
+
+    def test_lookup_t3(self):
+        home, (whiskers, _, nutmeg), _ = _household()
+        home.n_edges
+        loner = cats.Owner(name="Una", cats_owned=[])
+        home.add_owner(loner)
+        home.add_cat(nutmeg)
+        assert home.cats_of(loner) == []
+        assert home.owners_of(nutmeg) == []
+        assert home.degrees()[0].tolist() == [1, 2, 0]
+        home.link([2], [2])
+        assert home.cats_of(loner) == [nutmeg]
+
+    @pytest.mark.xfail
+    def test_lookup_t2(self):
+        home, (_, _, nutmeg), _ = _household()
+        home.owners_of(nutmeg)
+
+
+class TesthouseholdHouseholdAffectedOwners:
+    ''' Test for Household.affected_owners '''
+
+    def test_affectedOwners_t0(self):
+        home, (whiskers, boots, nutmeg), (sasha, liam) = _household()
+        assert home.affected_owners([boots]) == [liam]
+        assert home.affected_owners([whiskers, boots]) == [sasha, liam]
+        assert home.affected_owners([nutmeg]) == []
+
+    def test_affectedOwners_t1(self):
+        rng = np.random.default_rng(0)
+        home = cats.Household()
+        for cat in cats.Cat.bulk([f'cat{i}' for i in range(50)]):
+            home.add_cat(cat)
+        for i in range(20):
+            home.add_owner(cats.Owner(f'Owner{i}', []))
+        owners = rng.integers(0, 20, 300)
+        cat_indices = rng.integers(0, 50, 300)
+        home.link(owners, cat_indices)
+        changed = np.array([3, 7, 7, 41])
+        expected = sorted({o for o, c in zip(owners, cat_indices) if c in changed})
+        assert home.affected_owner_indices(changed).tolist() == expected
+        assert home.n_edges == len(set(zip(owners, cat_indices)))
+
+
+class TesthouseholdHouseholdLink:
+    ''' Test for Household.link and Household.unlink '''
+
+    def test_link_t0(self):
+        home, (whiskers, boots, nutmeg), (sasha, liam) = _household()
+        home.add_cat(nutmeg)
+        home.link([0, 0], [1, 2])
+        assert home.cats_of(sasha) == [whiskers, boots, nutmeg]
+        home.unlink([1, 0], [0, 2])
+        assert home.owners_of(whiskers) == [sasha]
+        assert home.owners_of(nutmeg) == []
+        assert home.n_edges == 3
+
+    def test_link_t2(self):
+        home, (whiskers, _, _), (sasha, _) = _household()
+        home.unlink([0], [0])
+        home.link([0], [0])
+        assert home.n_edges == 3
+        assert home.cats_of(sasha) == [whiskers]
+        home.link([0], [1])
+        home.unlink([0], [1])
+        assert home.n_edges == 3
+
+    @pytest.mark.xfail
+    def test_link_t1(self):
+        home, _, _ = _household()
+        home.link([0], [5])
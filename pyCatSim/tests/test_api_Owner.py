@@ -91,4 +91,75 @@ class TesthumanOwnerFeed:
         test_owner = cats.Owner(name="Jordan", cats_owned=test_cat)
         test_owner.feed(test_cat)
         assert test_cat.hunger_level == 4
-        assert test_cat.mood == 5
\ No newline at end of file
+        assert test_cat.mood == 5
+
+class TesthumanOwnerFactBatch:
+    ''' Test for drawing facts in batches '''
+
+    def test_give_fact_t0(self):
+        import numpy as np
+        cat1 = cats.Cat(name="Whiskers")
+        owner1 = cats.Owner(name="Sasha", cats_owned=cat1)
+        facts = owner1.give_fact(10, rng=np.random.default_rng(0))
+        assert len(facts) == 10
+
+
+class TesthumanOwnerBatchCare:
+    ''' Test for the ownership index and batch care methods '''
+
+    def test_feed_all_t0(self):
+        loose = cats.Cat(name="Loose", hunger_level=0, mood=1)
+        group = cats.Clowder.from_records({'name': f'cat{i}', 'hunger_level': i} for i in range(4))
+        owner = cats.Owner(name="Jordan", cats_owned=group.catlist + [loose])
+        owner.feed_all()
+        assert group.hunger_level.tolist() == [0, 0, 1, 2]
+        assert group.mood.tolist() == [1, 1, 1, 1]
+        assert loose.hunger_level == 0
+        assert loose.mood == 2
+
+    def test_groom_all_t0(self):
+        litter = cats.Cat.bulk(['A', 'B'], mood=[1, 2])
+        group = cats.Clowder([litter[0]])
+        owner = cats.Owner(name="Jordan", cats_owned=litter)
+        owner.groom_all()
+        assert [cat.mood for cat in litter] == [2, 3]
+        assert group.health.tolist() == [0]
+
+    def test_feed_t1(self):
+        litter = cats.Cat.bulk(['A', 'B', 'C'], hunger_level=3)
+        cats.Clowder(litter[1:])
+        owner = cats.Owner(name="Jordan", cats_owned=litter)
+        owner.feed(cats=[litter[0], litter[2]])
+        assert [cat.hunger_level for cat in litter] == [2, 3, 2]
+
+    def test_feed_t2(self):
+        litter = cats.Cat.bulk(['A', 'B'], hunger_level=3)
+        owner = cats.Owner(name="Jordan", cats_owned=litter[0])
+        with pytest.raises(ValueError):
+            owner.feed(cats=litter)
+        # nothing is fed when ownership fails
+        assert litter[0].hunger_level == 3
+
+    def test_adopt_t1(self):
+        cat1 = cats.Cat(name="Whiskers")
+        owner = cats.Owner(name="Sasha", cats_owned=cat1)
+        assert owner.owns(cat1)
+        with pytest.raises(ValueError):
+            owner.adopt(cat1)
+        cat2 = cats.Cat(name="Boots")
+        with pytest.raises(ValueError):
+            owner.adopt([cat2, cat2])
+        owner.adopt(cat2)
+        assert owner.owns(cat2)
+        assert owner.cats_owned == [cat1, cat2]
+
+    def test_adopt_t2(self):
+        cat1 = cats.Cat(name="Whiskers")
+        owner = cats.Owner(name="Sasha", cats_owned=cat1)
+        stray = cats.Cat(name="Stray")
+        # cats_owned is a copy: changing it does not change what the owner owns
+        owner.cats_owned.append(stray)
+        assert owner.cats_owned == [cat1]
+        assert not owner.owns(stray)
+        with pytest.raises(AttributeError):
+            owner.cats_owned = [stray]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the import cost of pyCatSim
+"""
+
+''' Tests for `import pyCatSim`
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import subprocess
+import sys
+
+
+def import_times(statement):
+    """Runs statement in a fresh interpreter and returns {module: cumulative import time in us}"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestimportPyCatSim:
+    ''' Test that importing pyCatSim stays light '''
+
+    def test_import_t0(self):
+        times = import_times('import pyCatSim')
+        assert 'pyCatSim' in times
+        heavy = [module for module in times
+                 if module.split('.')[0] in ('matplotlib', 'playsound', 'soundfile', 'sounddevice')]
+        assert heavy == []
+
+    def test_import_t1(self):
+        times = import_times('from pyCatSim import Cat; Cat("Boots", color="tabby", quiet=True)')
+        # generous budget, the point is to catch heavy dependencies creeping back in
+        assert times['pyCatSim'] < 2_000_000
+
+    def test_import_t2(self):
+        times = import_times('import pyCatSim.utils.display as d; d.show')
+        assert 'matplotlib' not in times
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the asyncio API
+"""
+
+''' Tests for pyCatSim.utils.aio and the async methods of Cat, Clowder and Owner
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pyCatSim import Cat, Clowder, Owner
+from pyCatSim.utils import aio, playback
+
+
+@pytest.fixture
+def recorder():
+    backend = playback.RecordingBackend()
+    playback.set_backend(backend, max_concurrency=2)
+    yield backend
+    playback.get_player().shutdown()
+    # the next user of the shared player gets the default backend again
+    playback._player = None
+
+
+class TestutilsAioRunBlocking:
+    ''' Test for run_blocking and set_max_workers '''
+
+    def test_run_blocking_t0(self):
+        aio.set_max_workers(3)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+            return threading.current_thread().name
+
+        async def main():
+            return await asyncio.gather(*[aio.run_blocking(work) for _ in range(50)])
+
+        names = asyncio.run(main())
+        assert max(peak) <= 3
+        assert len(set(names)) <= 3
+        aio.set_max_workers(aio.MAX_WORKERS)
+
+    @pytest.mark.xfail
+    def test_run_blocking_t1(self):
+        aio.set_max_workers(0)
+
+
+class TestutilsAioCat:
+    ''' Test for Cat.amake_noise and Cat.ashow '''
+
+    def test_amake_noise_t0(self, recorder):
+        cats = Cat.bulk(['Nutmeg', 'Chestnut', 'Mochi'])
+
+        async def main():
+            return await asyncio.gather(*[cat.amake_noise('purr', play=True) for cat in cats],
+                                        cats[0].amake_noise('hiss'))
+
+        assert asyncio.run(main()) == [None, None, None, 'Hiss..']
+        assert [noise for noise, _ in recorder.played] == ['purr'] * 3
+
+    @pytest.mark.xfail
+    def test_amake_noise_t1(self, recorder):
+        asyncio.run(Cat('Nutmeg').amake_noise('bark', play=True))
+
+    def test_ashow_t0(self):
+        pictures = asyncio.run(Clowder([Cat('A', color='tabby'), Cat('B')]).ashow())
+        assert len(pictures) == 2
+        assert all(png.getvalue().startswith(b'\x89PNG') for png in pictures)
+
+    def test_ashow_t1(self, tmp_path):
+        path = tmp_path / 'mochi.png'
+        assert asyncio.run(Cat('Mochi', color='black').ashow(path)) == path
+        assert path.read_bytes().startswith(b'\x89PNG')
+
+
+class TestutilsAioOwner:
+    ''' Test for Owner.afeed_all and Owner.agroom_all '''
+
+    def test_afeed_all_t0(self):
+        group = Clowder.from_records({'name': f'cat{i}', 'hunger_level': 2} for i in range(20))
+        cats = group.catlist
+        owners = [Owner(f'Owner{i}', cats[2 * i:2 * i + 2]) for i in range(10)]
+        order = []
+
+        async def care(owner):
+            await owner.afeed_all()
+            order.append(owner.name)
+            await owner.agroom_all()
+
+        async def main():
+            await asyncio.gather(*[care(owner) for owner in owners])
+
+        asyncio.run(main())
+        assert group.hunger_level.tolist() == [1] * 20
+        assert group.mood.tolist() == [2] * 20
+        assert len(order) == 10
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for behavior utilities
+"""
+
+''' Tests for pyCatSim.utils.behavior
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import numpy as np
+from pyCatSim import Cat, Clowder
+from pyCatSim.utils import behavior, simulation
+
+
+class TestutilsBehaviorSampleCodes:
+    ''' Test for sample_codes '''
+
+    def test_sampleCodes_t0(self):
+        weights = [[1, 0, 0], [0, 0, 2], [0, 3, 0]] * 100
+        codes = behavior.sample_codes(weights, rng=0)
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [0, 2, 1] * 100
+
+    def test_sampleCodes_t1(self):
+        weights = np.tile([1., 3.], (100_000, 1))
+        codes = behavior.sample_codes(weights, rng=np.random.default_rng(1))
+        assert codes.mean() == pytest.approx(0.75, abs=0.01)
+        assert behavior.sample_codes(np.zeros((0, 2))).size == 0
+
+    @pytest.mark.xfail
+    def test_sampleCodes_t2(self):
+        behavior.sample_codes([[1, 0], [0, 0]])
+
+    @pytest.mark.xfail
+    def test_sampleCodes_t3(self):
+        behavior.sample_codes([[1, -1]])
+
+
+class TestutilsBehaviorDrawNoises:
+    ''' Test for draw_noises '''
+
+    def test_drawNoises_t0(self):
+        group = Clowder.from_records([{'name': 'grumpy', 'mood': -50}] * 1000 +
+                                     [{'name': 'happy', 'mood': 50}] * 1000)
+        codes = behavior.draw_noises(group, rng=0)
+        hiss, purr = behavior.NOISES.index('hiss'), behavior.NOISES.index('purr')
+        assert (codes[:1000] == hiss).mean() > 0.8
+        assert (codes[1000:] == purr).mean() > 0.8
+        assert (codes[:1000] == purr).mean() < 0.1
+
+    def test_drawNoises_t1(self):
+        group = Clowder([Cat('A', mood=-1), Cat('B', mood=1)])
+        codes = behavior.draw_noises(group, weights={'meow': group.mood > 0, 'hiss': group.mood < 0})
+        assert [behavior.NOISE_TEXT[code] for code in codes] == ['Hiss..', 'Meow!']
+        codes = behavior.draw_noises(group, weights=lambda c: np.eye(5)[[2, 4]])
+        assert codes.tolist() == [2, 4]
+
+    @pytest.mark.xfail
+    def test_drawNoises_t2(self):
+        behavior.draw_noises(Clowder([Cat('A')]), weights={'roar': 1})
+
+    @pytest.mark.xfail
+    def test_drawNoises_t3(self):
+        behavior.draw_noises(Clowder([Cat('A')]), weights=[[1, 1]])
+
+
+class TestutilsBehaviorDrawActions:
+    ''' Test for draw_actions and weighted_policy '''
+
+    def test_drawActions_t0(self):
+        group = Clowder([Cat('A', hunger_level=1000), Cat('B', energy=-1000)])
+        assert behavior.draw_actions(group, rng=0).tolist() == [4, 5]
+        assert behavior.draw_actions(group, weights={'bathe': 1}).tolist() == [2, 2]
+
+    def test_drawActions_t1(self):
+        group = Clowder.from_records({'name': f'cat{i}'} for i in range(100))
+        result = group.simulate(20, policy=simulation.weighted_policy(), seed=0, record_stats=True)
+        assert result.stats['actions'].sum() == 2000
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the color utilities
+"""
+
+''' Tests for pyCatSim.utils.colors
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import numpy as np
+from pyCatSim.utils import colors
+
+
+class TestutilsColorsResolveColor:
+    ''' Test for resolve_color '''
+
+    @pytest.mark.parametrize(('color', 'expected'),
+                             [
+                                 ('tabby', 'tabby'),
+                                 (' Black ', 'black'),
+                                 ('tortoiseshel', 'tortoiseshell'),
+                                 ('oragne', 'orange'),
+                                 ('zebra', None),
+                                 ('', None),
+                                 (None, None),
+                             ]
+                             )
+    def test_resolve_color_t0(self, color, expected):
+        assert colors.resolve_color(color) == expected
+
+    def test_resolve_color_t1(self):
+        colors._fuzzy_match.cache_clear()
+        for _ in range(3):
+            colors.resolve_color('tabbie')
+        info = colors._fuzzy_match.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+class TestutilsColorsResolveColors:
+    ''' Test for resolve_colors '''
+
+    def test_resolve_colors_t0(self):
+        codes = colors.resolve_colors(['tabby', 'Tabby ', 'blak', None, 'zebra', 'tabby'])
+        assert codes.tolist() == [0, 0, 1, -1, -1, 0]
+        assert codes.dtype == np.int8
+
+    def test_resolve_colors_t1(self):
+        colors._fuzzy_match.cache_clear()
+        inputs = np.array(['tabbie', 'blak', 'tuxedo'] * 1000)
+        codes = colors.resolve_colors(inputs)
+        assert codes.tolist() == [0, 1, 4] * 1000
+        assert colors._fuzzy_match.cache_info().misses == 2
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the display utilities
+"""
+
+''' Tests for pyCatSim.utils.display
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import io
+import numpy as np
+import matplotlib.image as mpimg
+from pyCatSim.utils import display
+
+
+class TestutilsDisplayShow:
+    ''' Test for the display functions '''
+
+    def test_load_image_t0(self):
+        display.load_image.cache_clear()
+        for _ in range(20):
+            for color in ['tabby', 'black', 'orange', 'tortoiseshell', 'tuxedo']:
+                display.load_image(color)
+        info = display.load_image.cache_info()
+        assert info.misses == 5
+        assert info.hits == 95
+
+    @pytest.mark.xfail
+    def test_load_image_t1(self):
+        display.load_image(None)  # should raise FileNotFoundError
+
+    def test_show_t0(self):
+        buffer = display.show('tuxedo', output=io.BytesIO())
+        assert buffer.getvalue().startswith(b'\x89PNG')
+
+    def test_show_t1(self, tmp_path):
+        path = tmp_path / 'cat.png'
+        display.show('orange', output=path)
+        assert path.read_bytes().startswith(b'\x89PNG')
+
+
+class TestutilsDisplayRenderGrid:
+    ''' Test for the thumbnails and the mosaic '''
+
+    def test_load_thumbnail_t0(self):
+        thumb = display.load_thumbnail('tabby', 32)
+        assert thumb.shape == (32, 32, 3)
+        assert thumb.dtype == np.uint8
+        assert display.load_thumbnail('tabby', 32) is thumb
+
+    def test_render_grid_t0(self):
+        buffer = display.render_grid(['tabby', 'black', None, 'purple'],
+                                     ['Nutmeg\nmood 3', 'Mochi', 'Una', 'Zoë'],
+                                     io.BytesIO(), columns=3, size=40)
+        buffer.seek(0)
+        img = mpimg.imread(buffer, format='png')
+        assert img.shape == (80, 120, 3)
+        # the empty tile at the end stays white
+        assert (img[40:, 80:] == 1).all()
+
+    def test_render_grid_t1(self, tmp_path):
+        path = tmp_path / 'grid.png'
+        display.render_grid(['tuxedo'] * 10, None, path, size=16, level=9)
+        assert mpimg.imread(path).shape == (3 * 16, 4 * 16, 3)
+
+    @pytest.mark.xfail
+    def test_render_grid_t2(self):
+        display.render_grid(['tabby', 'black'], ['Nutmeg'], io.BytesIO())
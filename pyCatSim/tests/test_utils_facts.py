@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the cat facts
+"""
+
+''' Tests for pyCatSim.utils.facts
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+from pyCatSim.utils.facts import random_facts, CAT_FACTS
+
+
+class TestutilsFactsRandomFacts:
+    ''' Test for random_facts '''
+
+    def test_random_facts_t0(self):
+        facts = random_facts(len(CAT_FACTS), rng=1, replace=False)
+        assert sorted(facts) == sorted(CAT_FACTS)
+
+    def test_random_facts_t1(self):
+        assert random_facts(5, rng=3) == random_facts(5, rng=3)
+
+    @pytest.mark.xfail
+    def test_random_facts_t2(self):
+        random_facts(len(CAT_FACTS) + 1, replace=False)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the sorted indexes
+"""
+
+''' Tests for pyCatSim.utils.index
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import pytest
+import numpy as np
+from pyCatSim import Clowder
+from pyCatSim.utils.index import SortedIndex, REBUILD_MIN
+
+
+class TestutilsIndexSortedIndex:
+    ''' Test for SortedIndex '''
+
+    def test_SortedIndex_t0(self):
+        index = SortedIndex(np.array([5, 1, 3, 3, 9]), np.arange(5))
+        assert index.select('lt', 3).tolist() == [1]
+        assert sorted(index.select('eq', 3).tolist()) == [2, 3]
+        index.shift(10)
+        assert index.select('ge', 15).tolist() == [0, 4]
+        index.touch(4)
+        assert index.select('ge', 15).tolist() == [0]
+        assert index.top(1).tolist() == [0]
+
+    def test_SortedIndex_t1(self):
+        index = SortedIndex(np.zeros(10, dtype=np.int64), np.arange(10))
+        index.touch(np.arange(REBUILD_MIN + 1))
+        assert not index.valid
+
+    def test_SortedIndex_t2(self):
+        c = Clowder.from_records({'name': f'cat{i}', 'mood': i} for i in range(10000))
+        c.where(mood__gt=9990)
+        index = c._store._indexes['mood']
+        c.play()
+        c.catlist[5].mood = 20000
+        assert c._store._indexes['mood'] is index
+        assert index.valid and index.offset == 1 and len(index.dirty) == 1
+        assert [cat.mood for cat in c.top_k('mood', 2)] == [20000, 10000]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for chunked ingest of cat records
+"""
+
+''' Tests for pyCatSim.utils.ingest
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import json
+
+import pytest
+import numpy as np
+from pyCatSim.utils import ingest
+from pyCatSim.utils.colors import COLORS
+
+
+class TestutilsIngestStreamRecords:
+    ''' Test for stream_records '''
+
+    def test_stream_records_t0(self):
+        records = ({'name': f'cat{i}', 'mood': i, 'color': 'tabi'} for i in range(25))
+        chunks = list(ingest.stream_records(records, chunk_size=10))
+        assert [len(chunk['name']) for chunk in chunks] == [10, 10, 5]
+        assert chunks[2]['mood'].tolist() == [20, 21, 22, 23, 24]
+        assert chunks[0]['color'].tolist() == [COLORS.index('tabby')] * 10
+        assert np.isnan(chunks[0]['age']).all()
+
+    def test_stream_records_t1(self):
+        consumed = []
+
+        def records():
+            for i in range(100):
+                consumed.append(i)
+                yield {'name': f'cat{i}'}
+
+        chunks = ingest.stream_records(records(), chunk_size=30)
+        next(chunks)
+        assert len(consumed) == 30
+
+    @pytest.mark.xfail
+    def test_stream_records_t2(self):
+        list(ingest.stream_records([{'mood': 1}]))
+
+
+class TestutilsIngestStreamCsv:
+    ''' Test for stream_csv '''
+
+    def test_stream_csv_t0(self, tmp_path):
+        path = tmp_path / 'cats.csv'
+        path.write_text("name,age,color,mood,owner\nNutmeg,3,tortoiseshell,2,John\nUna,,,,\n"
+                        "Mochi,1.5,black,-1,Sasha\n")
+        chunks = list(ingest.stream_csv(path, chunk_size=2))
+        assert chunks[0]['name'] == ['Nutmeg', 'Una']
+        assert chunks[0]['mood'].tolist() == [2, 0]
+        assert chunks[0]['color'].tolist() == [COLORS.index('tortoiseshell'), -1]
+        assert chunks[1]['age'].tolist() == [1.5]
+
+    def test_stream_csv_t1(self, tmp_path):
+        path = tmp_path / 'cats.csv'
+        path.write_text("name,mood,energy\nNutmeg,2.0,-3\n")
+        chunk = next(ingest.stream_csv(path))
+        assert chunk['mood'].tolist() == [2]
+        assert chunk['energy'].tolist() == [-3]
+
+    @pytest.mark.xfail
+    def test_stream_csv_t2(self, tmp_path):
+        path = tmp_path / 'cats.csv'
+        path.write_text("name,mood\nNutmeg,2.7\n")
+        next(ingest.stream_csv(path))
+
+
+class TestutilsIngestStreamJsonl:
+    ''' Test for stream_jsonl '''
+
+    def test_stream_jsonl_t0(self, tmp_path):
+        path = tmp_path / 'cats.jsonl'
+        lines = [json.dumps({'name': f'cat{i}', 'energy': i, 'age': None}) for i in range(5)]
+        path.write_text('\n'.join(lines) + '\n\n')
+        chunks = list(ingest.stream_jsonl(path, chunk_size=4))
+        assert [chunk['energy'].tolist() for chunk in chunks] == [[0, 1, 2, 3], [4]]
+
+    def test_stream_jsonl_t1(self, tmp_path):
+        path = tmp_path / 'cats.jsonl'
+        path.write_text(json.dumps({'name': 'Nutmeg', 'mood': 2.0}) + '\n')
+        chunk = next(ingest.stream_jsonl(path))
+        assert chunk['mood'].tolist() == [2]
+
+    @pytest.mark.xfail
+    def test_stream_jsonl_t2(self, tmp_path):
+        path = tmp_path / 'cats.jsonl'
+        path.write_text(json.dumps({'name': 'Nutmeg', 'mood': 2.7}) + '\n')
+        next(ingest.stream_jsonl(path))
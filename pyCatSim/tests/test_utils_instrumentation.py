@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the instrumentation registry
+"""
+
+''' Tests for pyCatSim.utils.instrumentation
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import pytest
+from pyCatSim import Cat, Clowder, Owner
+from pyCatSim.utils import instrumentation, noises
+
+
+class TestutilsInstrumentationInstrumented:
+    ''' Test for instrumented, enable and disable '''
+
+    def test_instrumented_t0(self):
+        originals = (Cat.play, Owner.feed, Clowder.add_cat, noises.meow)
+        with instrumentation.instrumented() as registry:
+            assert instrumentation.get_registry() is registry
+            cat = Cat('Nutmeg', hunger_level=2)
+            for _ in range(3):
+                cat.play()
+            Owner('John', cat).feed(cat)
+            Clowder().add_cat(cat)
+            cat.make_noise()
+        assert (Cat.play, Owner.feed, Clowder.add_cat, noises.meow) == originals
+        assert instrumentation.get_registry() is None
+        counts = {name: entry['count'] for name, entry in registry.as_dict().items()}
+        assert counts == {'Cat.play': 3, 'Owner.feed': 1, 'Clowder.add_cat': 1,
+                          'Cat.make_noise': 1, 'noises.meow': 1}
+
+    def test_instrumented_t1(self):
+        with instrumentation.instrumented() as registry:
+            with pytest.raises(ValueError):
+                Cat('Nutmeg').make_noise('bark')
+        assert registry.as_dict()['Cat.make_noise']['count'] == 1
+
+    def test_instrumented_t2(self):
+        first = instrumentation.enable()
+        second = instrumentation.enable()
+        Cat('Nutmeg').groom()
+        assert instrumentation.disable() is second
+        assert first.as_dict() == {}
+        assert second.as_dict()['Cat.groom']['count'] == 1
+        assert instrumentation.disable() is None
+
+
+class TestutilsInstrumentationRegistry:
+    ''' Test for Registry '''
+
+    def test_Registry_t0(self):
+        registry = instrumentation.Registry()
+        for i in range(1, 101):
+            registry.observe('Cat.play', i * 1e-3)
+        entry = registry.as_dict()['Cat.play']
+        assert entry['count'] == 100
+        assert entry['total_seconds'] == pytest.approx(5.05)
+        assert entry['max_seconds'] == pytest.approx(0.1)
+        assert 0.05 <= entry['p50_seconds'] <= 0.05 * 1.42
+        assert 0.099 <= entry['p99_seconds'] <= 0.1
+
+    def test_Registry_t1(self):
+        registry = instrumentation.Registry()
+        registry.observe('Cat.eat', 2e-6)
+        registry.observe('Cat.eat', 1000)
+        text = registry.to_prometheus()
+        assert 'pycatsim_calls_total{function="Cat.eat"} 2' in text
+        assert 'pycatsim_call_duration_seconds_bucket{function="Cat.eat",le="+Inf"} 2' in text
+        assert 'pycatsim_call_duration_seconds_count{function="Cat.eat"} 2' in text
+        assert '# TYPE pycatsim_call_duration_seconds histogram' in text
+        registry.reset()
+        assert registry.as_dict() == {}
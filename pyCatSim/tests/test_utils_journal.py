@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the event journal
+"""
+
+''' Tests for pyCatSim.utils.journal
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import pytest
+import numpy as np
+from pyCatSim import Cat, Clowder, Owner
+from pyCatSim.utils.journal import Journal, replay
+
+
+def make_records(n=30):
+    return [{'name': f'cat{i}', 'hunger_level': i % 4, 'mood': i % 5 - 2} for i in range(n)]
+
+
+class TestutilsJournalJournalRecord:
+    ''' Test for Journal.record '''
+
+    def test_record_t0(self):
+        group = Clowder([Cat('Nutmeg', hunger_level=0), Cat('Una', hunger_level=2)])
+        journal = group.attach_journal(Journal())
+        group.eat()
+        events = journal.read()
+        assert events['cat_id'].tolist() == [0, 1]
+        assert Journal.event_names(events['event']) == ['eat', 'eat']
+        assert events['hunger_level'].tolist() == [0, -1]
+        assert events['mood'].tolist() == [1, 1]
+
+    def test_record_t1(self):
+        nutmeg = Cat('Nutmeg', hunger_level=3)
+        group = Clowder([Cat('Una'), nutmeg])
+        journal = group.attach_journal()
+        nutmeg.play()
+        nutmeg.mood = 10
+        Owner('John', nutmeg).feed(nutmeg)
+        events = journal.read()
+        assert Journal.event_names(events['event']) == ['play', 'set', 'feed']
+        assert events['cat_id'].tolist() == [1, 1, 1]
+        assert events['mood'].tolist() == [1, 9, 1]
+
+    def test_record_t2(self):
+        journal = Journal(capacity=4)
+        journal.record(np.arange(10), 1, [1, 0, 0, 0])
+        assert len(journal) == 4
+        assert journal.dropped == 6
+        assert journal.read()['cat_id'].tolist() == [6, 7, 8, 9]
+        journal.record([10, 11], 2, [0, 0, 0, 1])
+        assert journal.read()['cat_id'].tolist() == [8, 9, 10, 11]
+
+    def test_record_t3(self, tmp_path):
+        journal = Journal(capacity=4, spill_dir=tmp_path)
+        for i in range(5):
+            journal.record(np.arange(3) + 3 * i, 1, [1, 0, 0, 0])
+            journal.advance()
+        events = journal.read()
+        assert journal.dropped == 0
+        assert len(journal) == 15
+        assert events['cat_id'].tolist() == list(range(15))
+        assert events['tick'].tolist() == [i // 3 for i in range(15)]
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_record_t4(self):
+        group = Clowder.from_records(make_records())
+        group.detach_journal()
+        group.simulate(5, seed=0)
+        assert group._store.journal is None
+
+
+class TestutilsJournalReplay:
+    ''' Test for replay '''
+
+    def test_replay_t0(self):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal()
+        group.simulate(20, seed=4)
+        group.catlist[3].groom()
+        Owner('John', group.catlist[:5]).feed_all()
+        group.get(7).energy = -4
+        rebuilt = replay(journal, Clowder.from_records(make_records()))
+        for field in ['mood', 'hunger_level', 'energy', 'health']:
+            assert getattr(rebuilt, field).tolist() == getattr(group, field).tolist()
+
+    def test_replay_t1(self, tmp_path):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal(Journal(capacity=50, spill_dir=tmp_path))
+        group.simulate(10, seed=1)
+        checkpoint = group.mood.copy()
+        group.simulate(10, seed=2)
+        rebuilt = replay(journal, Clowder.from_records(make_records()), until_tick=10)
+        assert rebuilt.mood.tolist() == checkpoint.tolist()
+
+    def test_replay_t4(self):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal()
+        group.simulate(10, seed=3)
+        rebuilt = Clowder.from_records(make_records())
+        rebuilt.stats()
+        replay(journal, rebuilt)
+        assert rebuilt.stats(verify=True)['mood']['sum'] == int(group.mood.sum())
+
+    def test_replay_t5(self):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal()
+        group.simulate(10, seed=3)
+        rebuilt = Clowder.from_records(make_records())
+        rebuilt.where(mood__gt=1)
+        replay(journal, rebuilt)
+        assert len(rebuilt.where(mood__gt=1)) == int((group.mood > 1).sum())
+
+    @pytest.mark.xfail
+    def test_replay_t2(self):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal(Journal(capacity=8))
+        group.simulate(2, seed=1)
+        replay(journal, Clowder.from_records(make_records()))
+
+    @pytest.mark.xfail
+    def test_replay_t3(self):
+        group = Clowder.from_records(make_records())
+        journal = group.attach_journal()
+        group.play()
+        replay(journal, Clowder.from_records(make_records(5)))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for mixer utilities
+"""
+
+''' Tests for pyCatSim.utils.mixer
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import io
+import wave
+import pytest
+import numpy as np
+from pyCatSim import Cat, Clowder
+from pyCatSim.utils import mixer
+
+RATE = 100
+CLIPS = [np.full(10, 0.1 * (i + 1)) for i in range(5)]
+
+
+class TestutilsMixerMix:
+    ''' Test for mix '''
+
+    def test_mix_t0(self):
+        samples = mixer.mix([0, 1], ['meow', 'purr'], [0, 0.05], gains=[1, 0.5],
+                            rate=RATE, clips=CLIPS)
+        assert samples.dtype == np.float32
+        assert len(samples) == 15
+        expected = np.zeros(15)
+        expected[:10] += 0.1
+        expected[5:] += 0.5 * 0.2
+        assert np.allclose(samples, expected)
+
+    @pytest.mark.parametrize('direct_cost', [0, mixer.DIRECT_COST])
+    def test_mix_t1(self, direct_cost, monkeypatch):
+        monkeypatch.setattr(mixer, 'DIRECT_COST', direct_cost)
+        rng = np.random.default_rng(0)
+        cats = rng.integers(0, 40, 2000)
+        codes = rng.integers(0, 5, 2000)
+        starts = rng.uniform(0, 5, 2000)
+        gains, offsets = rng.uniform(0, 1, 40), rng.uniform(0, 1, 40)
+        samples = mixer.mix(cats, codes, starts, gains=gains, offsets=offsets, rate=RATE,
+                            duration=4, clips=CLIPS, normalize=False)
+        expected = np.zeros(1000)
+        for cat, code, start in zip(cats, codes, starts):
+            position = int(round((start + offsets[cat]) * RATE))
+            expected[position:position + 10] += gains[cat] * CLIPS[code]
+        assert np.allclose(samples, expected[:400], atol=1e-4)
+
+    def test_mix_t2(self):
+        samples = mixer.mix([0] * 100, ['hiss'] * 100, [0] * 100, rate=RATE, clips=CLIPS)
+        assert np.abs(samples).max() == pytest.approx(1)
+        assert len(mixer.mix([], [], [], clips=CLIPS)) == 0
+
+    @pytest.mark.xfail
+    def test_mix_t3(self):
+        mixer.mix([0], ['roar'], [0], clips=CLIPS)
+
+    @pytest.mark.xfail
+    def test_mix_t4(self):
+        mixer.mix([0], [0], [0], offsets=[-1], clips=CLIPS)
+
+
+class TestutilsMixerWriteWav:
+    ''' Test for write_wav and decode_clip '''
+
+    def test_write_wav_t0(self):
+        buffer = mixer.write_wav(np.array([0, 0.5, -2]), io.BytesIO(), rate=RATE)
+        buffer.seek(0)
+        with wave.open(buffer) as f:
+            assert f.getframerate() == RATE
+            frames = np.frombuffer(f.readframes(3), dtype='<i2')
+        assert frames.tolist() == [0, 16384, -32767]
+
+    def test_decode_clip_t0(self):
+        pytest.importorskip('soundfile')
+        clip = mixer.decode_clip('meow', 8000)
+        assert clip.dtype == np.float32
+        assert mixer.decode_clip('meow', 8000) is clip
+        assert np.abs(clip).max() <= 1
+
+    def test_chorus_t0(self, tmp_path):
+        pytest.importorskip('soundfile')
+        group = Clowder([Cat('Nutmeg', mood=-5), Cat('Una')])
+        path = group.chorus(tmp_path / 'chorus.wav', starts=[0, 0.5], gains=0.5, duration=2,
+                            seed=0, rate=8000)
+        with wave.open(str(path)) as f:
+            assert f.getnframes() == 16000
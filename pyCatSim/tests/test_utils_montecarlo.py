@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Monte Carlo runner
+"""
+
+''' Tests for pyCatSim.utils.montecarlo
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import numpy as np
+from pyCatSim.utils.montecarlo import Scenario, run_scenarios
+from pyCatSim.utils.simulation import needs_policy
+
+
+def make_scenarios():
+    records = [{'name': f'cat{i}', 'hunger_level': i % 5, 'mood': i % 3} for i in range(30)]
+    scenarios = [Scenario(records, 20) for _ in range(5)]
+    scenarios.append(Scenario(records, 20, policy=needs_policy()))
+    return scenarios
+
+
+class TestutilsMontecarloRunScenarios:
+    ''' Test for run_scenarios '''
+
+    def test_run_scenarios_t0(self):
+        serial = run_scenarios(make_scenarios(), n_workers=1, seed=7)
+        parallel = run_scenarios(make_scenarios(), n_workers=3, seed=7)
+        assert serial.n_scenarios == 6
+        for field in ['mood', 'hunger_level', 'energy', 'health']:
+            for stat in ['mean', 'std', 'min', 'max']:
+                assert np.array_equal(serial.summary[field][stat], parallel.summary[field][stat])
+            assert np.array_equal(serial.distribution[field][0], parallel.distribution[field][0])
+            assert np.array_equal(serial.distribution[field][1], parallel.distribution[field][1])
+
+    def test_run_scenarios_t1(self):
+        result = run_scenarios(make_scenarios(), n_workers=1, seed=7)
+        means = result.summary['mood']['mean']
+        # random scenarios use independent streams
+        assert len(set(means[:5].tolist())) > 1
+        values, counts = result.distribution['mood']
+        assert counts.sum() == 6 * 30
+        assert result.pooled_mean('mood') == pytest.approx(means.mean())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the playback utilities
+"""
+
+''' Tests for pyCatSim.utils.playback
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import sys
+import threading
+from pyCatSim.utils import playback
+
+
+class SlowBackend:
+    ''' Backend that blocks until released and tracks concurrent playback '''
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def play(self, noise, path):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.release.wait(timeout=5)
+        with self.lock:
+            self.active -= 1
+
+
+class TestutilsPlaybackSoundPlayer:
+    ''' Test for SoundPlayer '''
+
+    def test_play_t0(self):
+        backend = SlowBackend()
+        player = playback.SoundPlayer(backend, max_concurrency=2)
+        handles = [player.play('meow') for _ in range(6)]
+        # play returns before the clips finish
+        assert not any(handle.done() for handle in handles)
+        backend.release.set()
+        for handle in handles:
+            handle.result(timeout=5)
+        player.shutdown()
+        assert backend.peak == 2
+
+    def test_load_clip_t0(self):
+        pytest.importorskip('soundfile')
+        playback.decode_clip.cache_clear()
+        clips = [playback.load_clip('purr') for _ in range(5)]
+        assert playback.decode_clip.cache_info().misses == 1
+        assert all(clip is clips[0] for clip in clips)
+
+    def test_play_t2(self, monkeypatch):
+        # the recording backend never decodes, so it needs no codec
+        monkeypatch.setattr(playback, 'decode_clip', None)
+        player = playback.SoundPlayer(playback.RecordingBackend())
+        player.play('hiss').result(timeout=5)
+        player.shutdown()
+        assert player.backend.played == [('hiss', playback.clip_path('hiss'))]
+
+    def test_default_backend_t0(self, monkeypatch):
+        # without the audio extra, the clips are played from their files
+        monkeypatch.setitem(sys.modules, 'soundfile', None)
+        assert isinstance(playback.default_backend(), playback.PlaysoundBackend)
+
+    @pytest.mark.xfail
+    def test_play_t1(self):
+        playback.SoundPlayer(playback.NullBackend()).play('bark')
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for recorder utilities
+"""
+
+''' Tests for pyCatSim.utils.recorder
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+import pytest
+import numpy as np
+from pyCatSim import Cat, Clowder, Owner
+from pyCatSim.utils.recorder import Recorder
+
+FIELDS = ('mood', 'hunger_level', 'energy', 'health')
+
+
+def run(recorder, n_ticks=25, seed=0):
+    """Changes a few cats per tick, returning the expected recording"""
+    rng = np.random.default_rng(seed)
+    group = Clowder.from_records({'name': f'cat{i}', 'hunger_level': i % 3} for i in range(30))
+    recorder = group.attach_recorder(recorder)
+    expected = [np.stack([group.mood, group.hunger_level, group.energy, group.health])]
+    cats = group.catlist
+    for tick in range(n_ticks):
+        kind = tick % 4
+        if kind == 0:
+            cats[rng.integers(30)].play()
+        elif kind == 1:
+            Owner('Sasha', [cats[i] for i in rng.choice(30, 3, replace=False)]).feed_all()
+        elif kind == 2:
+            cats[rng.integers(30)].health = int(rng.integers(-5, 5))
+        else:
+            group.act(rng.integers(0, 6, 30))
+        recorder.advance()
+        expected.append(np.stack([group.mood, group.hunger_level, group.energy, group.health]))
+    return recorder, np.array(expected)
+
+
+class TestutilsRecorderRecord:
+    ''' Test for recording ticks '''
+
+    @pytest.mark.parametrize('capacity', [None, 1, 4, 7])
+    def test_record_t0(self, capacity):
+        recorder, expected = run(Recorder(capacity=capacity))
+        series = recorder.read()
+        assert series['tick'].tolist() == list(range(26))
+        assert series['id'].tolist() == list(range(30))
+        for j, field in enumerate(FIELDS):
+            assert np.array_equal(series[field], expected[:, j])
+
+    def test_record_t1(self):
+        recorder, expected = run(Recorder(fields=['energy'], stride=3, capacity=4))
+        series = recorder.read()
+        assert series['tick'].tolist() == list(range(0, 26, 3))
+        assert set(series) == {'tick', 'id', 'energy'}
+        assert np.array_equal(series['energy'], expected[::3, 2])
+
+    def test_record_t2(self):
+        group = Clowder.from_records({'name': f'cat{i}', 'mood': i} for i in range(4))
+        recorder = group.attach_recorder(Recorder(fields=['mood']))
+        removed = group.catlist[1]
+        group.remove_cat(removed)
+        group.add_cat(Cat('New', mood=9))
+        group.groom()
+        recorder.advance()
+        assert recorder.read()['mood'].tolist() == [[0, 1, 2, 3], [1, 1, 3, 4]]
+        assert group.detach_recorder() is recorder
+        group.play()
+        assert len(recorder) == 2
+
+    def test_record_t3(self):
+        group = Clowder.from_records({'name': f'cat{i}'} for i in range(50))
+        recorder = group.attach_recorder(Recorder(stride=5))
+        group.simulate(20, seed=1)
+        series = recorder.read()
+        assert series['tick'].tolist() == [0, 5, 10, 15, 20]
+        assert np.array_equal(series['mood'][-1], group.mood)
+
+    def test_record_t7(self):
+        from pyCatSim.utils.journal import replay
+        records = [{'name': f'cat{i}', 'hunger_level': i % 3} for i in range(30)]
+        group = Clowder.from_records(records)
+        journal = group.attach_journal()
+        group.simulate(5, seed=0)
+        rebuilt = Clowder.from_records(records)
+        recorder = rebuilt.attach_recorder(Recorder(fields=['mood']))
+        replay(journal, rebuilt)
+        recorder.advance()
+        assert np.array_equal(recorder.read()['mood'][-1], group.mood)
+
+    @pytest.mark.xfail
+    def test_record_t4(self):
+        Recorder(fields=['age'])
+
+    @pytest.mark.xfail
+    def test_record_t5(self):
+        recorder = Recorder()
+        Clowder([Cat('A')]).attach_recorder(recorder)
+        Clowder([Cat('B')]).attach_recorder(recorder)
+
+    def test_record_t6(self):
+        group = Clowder.from_records({'name': f'cat{i}'} for i in range(100))
+        recorder = group.attach_recorder(Recorder(fields=['energy']))
+        for i in range(10):
+            group.catlist[i].play()
+            recorder.advance()
+        assert len(list(recorder.chunks())) == 1
+        group.simulate(3, seed=0)
+        chunks = list(recorder.chunks())
+        assert [len(chunk['tick']) for chunk in chunks] == [11, 1, 1, 1]
+        assert np.array_equal(chunks[-1]['energy'][0], group.energy)
+
+
+class TestutilsRecorderSpill:
+    ''' Test for chunks written to disk '''
+
+    @pytest.mark.parametrize('spill_format', ['npz', 'memmap'])
+    def test_spill_t0(self, tmp_path, spill_format):
+        recorder, expected = run(Recorder(capacity=4, spill_dir=tmp_path, spill_format=spill_format))
+        recorder.flush()
+        suffix = '.npz' if spill_format == 'npz' else '.npy'
+        assert len([path for path in tmp_path.iterdir() if path.suffix == suffix]) > 1
+        series = recorder.read()
+        for j, field in enumerate(FIELDS):
+            assert np.array_equal(series[field], expected[:, j])
+        assert sum(len(chunk['tick']) for chunk in recorder.chunks()) == 26
+
+    def test_export_t0(self, tmp_path):
+        recorder, expected = run(Recorder(fields=['mood'], capacity=5))
+        recorder.export(tmp_path / 'run.npz')
+        with np.load(tmp_path / 'run.npz') as data:
+            assert np.array_equal(data['mood'], expected[:, 0])
+            assert data['tick'].tolist() == list(range(26))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the simulation engine
+"""
+
+''' Tests for pyCatSim.utils.simulation
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import pytest
+import numpy as np
+from pyCatSim import Cat, Clowder
+from pyCatSim.utils import simulation
+from pyCatSim.utils.store import ACTIONS
+
+
+def make_clowder(n=50):
+    return Clowder.from_records({'name': f'cat{i}', 'hunger_level': i % 5 - 1,
+                                 'mood': i % 7 - 3} for i in range(n))
+
+
+class TestutilsSimulationSimulate:
+    ''' Test for simulate '''
+
+    @pytest.mark.parametrize('action', ['idle', 'play', 'bathe', 'groom', 'eat', 'sleep'])
+    def test_simulate_t0(self, action):
+        group = make_clowder(20)
+        single = [Cat(name=cat.name, mood=cat.mood, hunger_level=cat.hunger_level)
+                  for cat in group.catlist]
+        result = group.simulate(3, policy=simulation.constant_policy(action), sleep_duration=7)
+        for cat in single:
+            for _ in range(3):
+                if action == 'sleep':
+                    cat.sleep(7)
+                elif action != 'idle':
+                    getattr(cat, action)()
+        for field in ['mood', 'hunger_level', 'energy', 'health']:
+            assert getattr(group, field).tolist() == [getattr(cat, field) for cat in single]
+        assert result.n_steps == 3
+        assert result.throughput > 0
+
+    def test_simulate_t1(self):
+        first = make_clowder()
+        second = make_clowder()
+        first.simulate(10, seed=3)
+        second.simulate(10, seed=3)
+        assert first.mood.tolist() == second.mood.tolist()
+        assert first.energy.tolist() == second.energy.tolist()
+
+    def test_simulate_t2(self):
+        group = make_clowder()
+        result = group.simulate(5, policy=simulation.needs_policy(), record_stats=True)
+        assert result.stats['mood']['mean'].shape == (5,)
+        assert result.stats['mood']['mean'][-1] == group.mood.mean()
+        assert result.stats['actions'].sum(axis=1).tolist() == [50] * 5
+
+    def test_simulate_t3(self):
+        group = make_clowder()
+        group.simulate(4, policy=simulation.random_policy({'eat': 1}))
+        assert group.hunger_level.min() == 0
+        assert group.hunger_level.max() == 0
+
+    @pytest.mark.xfail
+    def test_simulate_t4(self):
+        group = make_clowder()
+        group.simulate(1, policy=lambda clowder, tick, rng: len(ACTIONS))
+
+    @pytest.mark.xfail
+    def test_simulate_t5(self):
+        simulation.simulate(make_clowder(), 1, sleep_duration=-1)
+
+    def test_simulate_t6(self):
+        group = make_clowder()
+        mood = group.mood.copy()
+        with pytest.raises(ValueError, match="expected one per cat"):
+            simulation.simulate(group, 1, policy=lambda clowder, tick, rng: [1] * 49)
+        assert group.mood.tolist() == mood.tolist()
+
+
+class TestutilsSimulationPolicies:
+    ''' Test for the built-in policies '''
+
+    def test_needs_policy_t0(self):
+        group = Clowder([Cat('A', hunger_level=5), Cat('B', energy=-5),
+                         Cat('C', mood=-5), Cat('D')])
+        policy = simulation.needs_policy()
+        codes = policy(group, 0, np.random.default_rng(0))
+        assert [ACTIONS[code] for code in codes] == ['eat', 'sleep', 'groom', 'play']
+
+    @pytest.mark.xfail
+    def test_random_policy_t0(self):
+        simulation.random_policy({'dance': 1})
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the binary snapshot format
+"""
+
+''' Tests for pyCatSim.utils.snapshot
+
+Naming rules:
+1. class: Test{filename}{Class}{method} with appropriate camel case
+2. function: test_{method}_t{test_id}
+Notes on how to test:
+0. Make sure [pytest](https://docs.pytest.org) has been installed: `pip install pytest`
+1. execute `pytest {directory_path}` in terminal to perform all tests in all testing files inside the specified directory
+2. execute `pytest {file_path}` in terminal to perform all tests in the specified file
+3. execute `pytest {file_path}::{TestClass}::{test_method}` in terminal to perform a specific test class/method inside the specified file
+4. after `pip install pytest-xdist`, one may execute "pytest -n 4" to test in parallel with number of workers specified by `-n`
+5. for more details, see https://docs.pytest.org/en/stable/usage.html
+'''
+
+
+import pytest
+import numpy as np
+from pyCatSim import Clowder
+from pyCatSim.utils import snapshot
+from pyCatSim.utils.snapshot import StringTable
+
+
+class TestutilsSnapshotStringTable:
+    ''' Test for StringTable '''
+
+    def test_StringTable_t0(self):
+        table = StringTable.encode(['Nutmeg', '', 'Ünä'])
+        assert len(table) == 3
+        assert table[2] == 'Ünä'
+        assert table[-2] == ''
+        assert table[0:2] == ['Nutmeg', '']
+        assert list(table) == ['Nutmeg', '', 'Ünä']
+        table.append('Mochi')
+        table[0] = 'Chestnut'
+        assert table.pop(1) == ''
+        assert list(table) == ['Chestnut', 'Ünä', 'Mochi']
+
+    @pytest.mark.xfail
+    def test_StringTable_t1(self):
+        StringTable.encode(['Nutmeg', 3])
+
+
+class TestutilsSnapshotLoadSnapshot:
+    ''' Test for load_snapshot '''
+
+    def test_load_snapshot_t0(self, tmp_path):
+        c = Clowder.from_records({'name': f'cat{i}', 'energy': i} for i in range(50))
+        snapshot.save_snapshot(c._store, tmp_path / 'clowder.pcs')
+        store = snapshot.load_snapshot(tmp_path / 'clowder.pcs')
+        assert isinstance(store.column('energy').base, np.memmap)
+        store.column('energy')[:] = 0
+        reloaded = snapshot.load_snapshot(tmp_path / 'clowder.pcs', mmap=False)
+        assert reloaded.column('energy').tolist() == list(range(50))
+
+    def test_load_snapshot_t1(self, tmp_path, monkeypatch):
+        c = Clowder.from_records([{'name': 'A', 'color': 'black'}, {'name': 'B', 'color': 'tuxedo'},
+                                  {'name': 'C'}])
+        snapshot.save_snapshot(c._store, tmp_path / 'clowder.pcs')
+        # A later version reordered the colors and dropped 'tuxedo'
+        monkeypatch.setattr(snapshot, 'COLORS', ('black', 'tabby'))
+        store = snapshot.load_snapshot(tmp_path / 'clowder.pcs')
+        assert store.column('color').tolist() == [0, -1, -1]
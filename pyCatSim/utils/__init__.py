@@ -5,5 +5,18 @@ Contains all basic block functions for pyCatSim.
 """
 
 from .noises import *
+from .playback import *
 from .display import *
 from .facts import *
+from .colors import *
+from .store import *
+from .behavior import *
+from .simulation import *
+from .montecarlo import *
+from .journal import *
+from .recorder import *
+from .snapshot import *
+from .ingest import *
+from .instrumentation import *
+from .aio import *
+from .mixer import *
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module runs blocking work for the asyncio API.
+
+Picture decoding and rendering, and the start of sound playback, are handed
+to one shared pool of worker threads so that coroutines awaiting them do not
+block the event loop. The pool is bounded: thousands of coroutines waiting
+on pictures or sounds queue up on a fixed number of threads.
+"""
+
+__all__ = ['run_blocking',
+           'set_max_workers']
+
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Default number of worker threads
+MAX_WORKERS = 8
+
+_executor = None
+_max_workers = MAX_WORKERS
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers,
+                                           thread_name_prefix='pyCatSim-aio')
+        return _executor
+
+
+def set_max_workers(n):
+    """
+    Sets how many blocking calls may run at the same time
+
+    Calls already running finish on the previous threads.
+
+    Parameters
+    ----------
+    n : int
+        Number of worker threads. Default is 8 until changed.
+
+    Raises
+    ------
+    ValueError
+        If n is less than 1.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.aio import set_max_workers
+        set_max_workers(4)
+
+    """
+    global _executor, _max_workers
+    if n < 1:
+        raise ValueError("The number of workers must be at least 1.")
+    with _lock:
+        previous, _executor = _executor, None
+        _max_workers = n
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Runs a blocking function on the shared worker threads
+
+    Parameters
+    ----------
+    func : callable
+        The function to run.
+    *args, **kwargs
+        Its arguments.
+
+    Returns
+    -------
+    The value returned by func.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import asyncio
+        import time
+        from pyCatSim.utils.aio import run_blocking
+
+        async def main():
+            return await asyncio.gather(*[run_blocking(time.sleep, 0.1) for _ in range(8)])
+
+        asyncio.run(main())
+
+    """
+    # asyncio is imported here so that importing pyCatSim does not pay for it
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module draws random noises and actions for every cat of a Clowder at once.
+
+Each cat has its own weights over the possible choices, which may depend on
+its state (a grumpy cat is more likely to hiss). One uniform number is drawn
+per cat and turned into a choice by inverting the cumulative weights, so a
+whole Clowder costs one call to the random number generator. Choices come
+back as small integer codes into NOISES or ACTIONS rather than as strings.
+"""
+
+__all__ = ['NOISES',
+           'NOISE_TEXT',
+           'sample_codes',
+           'noise_weights',
+           'action_weights',
+           'draw_noises',
+           'draw_actions']
+
+import numpy as np
+
+from . import noises
+from .store import ACTIONS
+
+# Noises a cat can make, in the order used for their integer codes
+NOISES = ('meow', 'purr', 'chatter', 'hiss', 'chirrup')
+
+# Text of each noise, by code
+NOISE_TEXT = tuple(getattr(noises, noise)() for noise in NOISES)
+
+
+def sample_codes(weights, rng=None):
+    """
+    Draws one choice per row of a weight matrix
+
+    Parameters
+    ----------
+    weights : array-like of shape (n_cats, n_choices)
+        Non-negative relative weights of each choice, for each cat. Rows do
+        not need to sum to 1.
+    rng : int or numpy.random.Generator, optional
+        Seed or random number generator. Default is None.
+
+    Raises
+    ------
+    ValueError
+        If a weight is negative or all the weights of a cat are zero.
+
+    Returns
+    -------
+    numpy.ndarray of int8
+        The index of the choice drawn for each cat.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.behavior import sample_codes
+        print(sample_codes([[1, 0, 0], [0, 1, 1], [0, 0, 5]], rng=0))
+
+    """
+    # Column by column is faster than a cumulative sum along the rows
+    weights = np.asfortranarray(weights, dtype=np.float64)
+    if weights.ndim != 2:
+        raise ValueError("weights must have one row per cat and one column per choice.")
+    rng = np.random.default_rng(rng)
+    n, k = weights.shape
+    codes = np.zeros(n, dtype=np.int8)
+    if not weights.size:
+        return codes
+    if weights.min() < 0:
+        raise ValueError("Weights cannot be negative.")
+    total = weights.sum(axis=1)
+    if not total.all():
+        raise ValueError("Every cat needs at least one choice with a positive weight.")
+    u = rng.random(n) * total
+    # The code is the number of cumulative weights at or below u, so
+    # zero-weight choices are never drawn
+    cumulative = np.zeros(n)
+    for j in range(k - 1):
+        cumulative += weights[:, j]
+        codes += cumulative <= u
+    return codes
+
+
+def _weight_matrix(weights, choices, clowder, default):
+    """Turns None, a dict or a callable into an (n_cats, len(choices)) matrix"""
+    if weights is None:
+        weights = default
+    if callable(weights):
+        weights = weights(clowder)
+    n = len(clowder)
+    if isinstance(weights, dict):
+        matrix = np.zeros((n, len(choices)), order='F')
+        for choice, weight in weights.items():
+            if choice not in choices:
+                raise ValueError(f"Invalid choice '{choice}'. Valid options: {', '.join(choices)}")
+            matrix[:, choices.index(choice)] = weight
+        return matrix
+    matrix = np.asarray(weights, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = np.broadcast_to(matrix, (n, len(choices)))
+    if matrix.shape != (n, len(choices)):
+        raise ValueError(f"weights must have shape ({n}, {len(choices)}).")
+    return matrix
+
+
+def noise_weights(clowder):
+    """
+    Default weights of each noise, depending on the state of each cat
+
+    Every noise has a base weight of 1. Hungry cats meow more, happy cats
+    purr more and grumpy cats hiss more: the weight of meow grows with
+    hunger_level, that of purr with a positive mood and that of hiss with a
+    negative mood.
+
+    Parameters
+    ----------
+    clowder : pyCatSim.Clowder
+        The cats.
+
+    Returns
+    -------
+    dict
+        Maps each noise name to its weight for each cat.
+
+    """
+    mood = clowder.mood
+    return {'meow': 1 + np.maximum(clowder.hunger_level, 0),
+            'purr': 1 + np.maximum(mood, 0),
+            'chatter': 1,
+            'hiss': 1 + np.maximum(-mood, 0),
+            'chirrup': 1}
+
+
+def action_weights(clowder):
+    """
+    Default weights of each action, depending on the state of each cat
+
+    Every action has a base weight of 1. Hungry cats eat more, tired cats
+    sleep more and rested cats play more.
+
+    Parameters
+    ----------
+    clowder : pyCatSim.Clowder
+        The cats.
+
+    Returns
+    -------
+    dict
+        Maps each action name to its weight for each cat.
+
+    """
+    energy = clowder.energy
+    weights = dict.fromkeys(ACTIONS, 1)
+    weights['eat'] = 1 + np.maximum(clowder.hunger_level, 0)
+    weights['sleep'] = 1 + np.maximum(-energy, 0)
+    weights['play'] = 1 + np.maximum(energy, 0)
+    return weights
+
+
+def draw_noises(clowder, weights=None, rng=None):
+    """
+    Draws one noise for every cat of a Clowder
+
+    Parameters
+    ----------
+    clowder : pyCatSim.Clowder
+        The cats.
+    weights : dict, array-like or callable, optional
+        Relative weight of each noise: a dict mapping noise names (see
+        NOISES) to a weight or to one weight per cat, an array of shape
+        (len(NOISES),) or (n_cats, len(NOISES)), or a function of the Clowder
+        returning either. Noises left out of a dict are never drawn. Default
+        is None (noise_weights).
+    rng : int or numpy.random.Generator, optional
+        Seed or random number generator. Default is None.
+
+    Raises
+    ------
+    ValueError
+        If the weights are invalid.
+
+    Returns
+    -------
+    numpy.ndarray of int8
+        One code per cat, as an index in NOISES (or NOISE_TEXT).
+
+    """
+    return sample_codes(_weight_matrix(weights, NOISES, clowder, noise_weights), rng)
+
+
+def draw_actions(clowder, weights=None, rng=None):
+    """
+    Draws one action for every cat of a Clowder
+
+    Parameters
+    ----------
+    clowder : pyCatSim.Clowder
+        The cats.
+    weights : dict, array-like or callable, optional
+        Relative weight of each action, as for draw_noises but with action
+        names (see pyCatSim.utils.store.ACTIONS). Default is None
+        (action_weights).
+    rng : int or numpy.random.Generator, optional
+        Seed or random number generator. Default is None.
+
+    Raises
+    ------
+    ValueError
+        If the weights are invalid.
+
+    Returns
+    -------
+    numpy.ndarray of int8
+        One code per cat, as an index in ACTIONS, ready for Clowder.act.
+
+    """
+    return sample_codes(_weight_matrix(weights, ACTIONS, clowder, action_weights), rng)
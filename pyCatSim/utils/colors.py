@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module interprets coat colors.
+
+Inputs that already name a color are resolved with a dictionary lookup; other
+inputs go through fuzzy matching once and the result is kept in a bounded
+cache, so that repeated spellings cost a lookup rather than a new match.
+"""
+
+__all__ = ['COLORS',
+           'resolve_color',
+           'resolve_colors',
+           'color_code']
+
+import difflib
+from functools import lru_cache
+
+import numpy as np
+
+# Coat colors, in the order used for their integer codes
+COLORS = ('tabby', 'black', 'orange', 'tortoiseshell', 'tuxedo')
+
+_CODES = {color: code for code, color in enumerate(COLORS)}
+
+
+@lru_cache(maxsize=1024)
+def _fuzzy_match(color_normalized):
+    match = difflib.get_close_matches(color_normalized, COLORS, n=1, cutoff=0.6)
+    return match[0] if match else None
+
+
+def resolve_color(color):
+    """
+    Interprets a color input
+
+    Parameters
+    ----------
+    color : str or None
+        The color to interpret. Case and surrounding spaces are ignored and
+        close spellings are matched to the nearest color.
+
+    Returns
+    -------
+    str or None
+        One of COLORS, or None if the input is empty or too far from any color.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.colors import resolve_color
+        resolve_color(' Tortoiseshel')
+
+    """
+    if not color:
+        return None
+    if color in _CODES:
+        return color
+    color_normalized = color.lower().strip()
+    if color_normalized in _CODES:
+        return color_normalized
+    return _fuzzy_match(color_normalized)
+
+
+def color_code(color):
+    """
+    Returns the integer code of a color input
+
+    Parameters
+    ----------
+    color : str or None
+        The color to interpret (see resolve_color).
+
+    Returns
+    -------
+    int
+        The index of the color in COLORS, or -1 if it cannot be interpreted.
+
+    """
+    match = resolve_color(color)
+    return -1 if match is None else _CODES[match]
+
+
+def resolve_colors(colors):
+    """
+    Interprets many color inputs at once
+
+    Distinct inputs are found first and each one is interpreted once, so the
+    cost of fuzzy matching depends on the number of distinct spellings rather
+    than on the number of inputs.
+
+    Parameters
+    ----------
+    colors : iterable of str or None
+        The colors to interpret.
+
+    Returns
+    -------
+    numpy.ndarray
+        The int8 code of each input (index in COLORS, -1 when it cannot be interpreted).
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.colors import resolve_colors, COLORS
+        codes = resolve_colors(['tabby', 'Tabby ', 'blak', 'tabby', None])
+        print([COLORS[code] if code >= 0 else None for code in codes])
+
+    """
+    if isinstance(colors, np.ndarray) and colors.dtype.kind == 'U':
+        uniques, inverse = np.unique(colors, return_inverse=True)
+    else:
+        lookup = {}
+        inverse = np.fromiter((lookup.setdefault(color, len(lookup)) for color in colors),
+                              dtype=np.intp)
+        uniques = list(lookup)
+    unique_codes = np.array([color_code(color) for color in uniques], dtype=np.int8)
+    return unique_codes[inverse]
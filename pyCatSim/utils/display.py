@@ -1,18 +1,23 @@
+import math
 import os
 import random
+import struct
+import zlib
+from functools import lru_cache
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 
-__all__=['show']
+import numpy as np
+
+__all__=['show', 'load_image', 'load_thumbnail', 'render_grid']
 
 # Path to the sound files
 IMG_DIR = Path(__file__).parents[1].joinpath("images").resolve()
 
 
-def show(color):
+@lru_cache(maxsize=8)
+def load_image(color):
     """
-    
+    Decodes the picture of a cat, keeping the result in a bounded cache
 
     Parameters
     ----------
@@ -21,17 +26,298 @@ def show(color):
 
     Returns
     -------
-    None.
+    numpy.ndarray
+        The decoded image (read-only). Each file is decoded once, later
+        calls return the cached array.
 
-    """
-    
+    Raises
+    ------
+    FileNotFoundError
+        If there is no picture for this color.
 
+    """
+    # matplotlib is imported here rather than at module level so that
+    # importing pyCatSim does not pay for it
+    import matplotlib.image as mpimg
 
     filename = f"{color}.jpg"
     image_path = os.path.join(IMG_DIR, filename)
-    
 
     img = mpimg.imread(image_path)
+    img.flags.writeable = False
+    return img
+
+
+def show(color, output=None):
+    """
+    Shows the picture of a cat
+
+    Parameters
+    ----------
+    color : str
+        The color of the cat
+    output : str, path-like or file-like, optional
+        Where to write the picture as a PNG. If given, the picture is rendered
+        with the Agg backend without opening a window, which works on
+        headless machines. Default is None (show in a window).
+
+    Returns
+    -------
+    None or the output
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import io
+        from pyCatSim.utils.display import show
+        buffer = show('tabby', output=io.BytesIO())
+        print(len(buffer.getvalue()))
+
+    """
+
+    img = load_image(color)
+
+    if output is not None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.imshow(img)
+        ax.axis('off')
+        fig.savefig(output, format='png')
+        return output
+
+    import matplotlib.pyplot as plt
+
     plt.imshow(img)
     plt.axis('off')
     plt.show()
+
+
+@lru_cache(maxsize=64)
+def load_thumbnail(color, size=96):
+    """
+    Returns a small square picture of a cat, keeping the result in a cache
+
+    The picture is cropped to a square around its center and downscaled by
+    averaging blocks of pixels. Each thumbnail is built once per size.
+
+    Parameters
+    ----------
+    color : str
+        The color of the cat
+    size : int, optional
+        Width and height of the thumbnail, in pixels. Default is 96.
+
+    Returns
+    -------
+    numpy.ndarray
+        The thumbnail, of shape (size, size, 3) and type uint8 (read-only).
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no picture for this color.
+
+    """
+    img = load_image(color)[..., :3]
+    height, width = img.shape[:2]
+    side = min(height, width)
+    factor = max(side // size, 1)
+    crop = factor * min(size, side)
+    top, left = (height - crop) // 2, (width - crop) // 2
+    img = img[top:top + crop, left:left + crop]
+    blocks = img.reshape(crop // factor, factor, crop // factor, factor, 3)
+    thumb = blocks.mean(axis=(1, 3))
+    if thumb.shape[0] != size:
+        # pictures smaller than the thumbnail are enlarged by repeating pixels
+        rows = np.arange(size) * thumb.shape[0] // size
+        thumb = thumb[rows][:, rows]
+    thumb = np.ascontiguousarray(thumb.round().astype(np.uint8))
+    thumb.flags.writeable = False
+    return thumb
+
+
+class _PNGWriter:
+    """Writes an RGB PNG row band by row band, so the image is never whole in memory"""
+
+    def __init__(self, f, width, height, level):
+        self.f = f
+        self._compressor = zlib.compressobj(level)
+        f.write(b'\x89PNG\r\n\x1a\n')
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+
+    def _chunk(self, kind, data):
+        self.f.write(struct.pack('>I', len(data)))
+        self.f.write(kind)
+        self.f.write(data)
+        self.f.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(kind))))
+
+    def write(self, rows):
+        # every row starts with its filter type (0, none)
+        data = np.empty((rows.shape[0], rows.shape[1] * 3 + 1), dtype=np.uint8)
+        data[:, 0] = 0
+        data[:, 1:] = rows.reshape(rows.shape[0], -1)
+        compressed = self._compressor.compress(data.tobytes())
+        if compressed:
+            self._chunk(b'IDAT', compressed)
+
+    def close(self):
+        self._chunk(b'IDAT', self._compressor.flush())
+        self._chunk(b'IEND', b'')
+
+
+# Characters available for labels; the others are written as '?'
+_CHARSET = ''.join(chr(c) for c in (*range(32, 127), *range(160, 256)))
+
+
+@lru_cache(maxsize=8)
+def _glyphs(px):
+    """Rasterizes the characters of a monospace font once, as alpha masks of equal size"""
+    from matplotlib import font_manager
+    from matplotlib.ft2font import FT2Font
+
+    font = FT2Font(font_manager.findfont(font_manager.FontProperties(family='monospace')))
+    font.set_size(px, 72)
+    ascent = math.ceil(font.ascender * px / font.units_per_EM)
+    descent = math.ceil(-font.descender * px / font.units_per_EM)
+    advance = round(font.load_char(ord('M')).horiAdvance / 64)
+    height = ascent + descent + 2
+    glyphs = {}
+    for char in _CHARSET:
+        font.set_text(char)
+        font.draw_glyphs_to_bitmap()
+        bitmap = np.asarray(font.get_image())
+        # the bitmap has a one-pixel margin below the lowest point of the glyph
+        bottom = ascent + round(font.get_descent() / 64) + 1
+        top = bottom - bitmap.shape[0]
+        # in a monospace font, the ink of every glyph is centered in its cell
+        ink = np.flatnonzero(bitmap.any(axis=0))
+        cell = np.zeros((height, advance), dtype=np.uint8)
+        if ink.size:
+            bitmap = bitmap[:, ink[0]:ink[-1] + 1][:, :advance]
+            left = (advance - bitmap.shape[1]) // 2
+            rows = slice(max(top, 0), min(bottom, height))
+            cell[rows, left:left + bitmap.shape[1]] = bitmap[rows.start - top:rows.stop - top]
+        glyphs[char] = cell
+    return glyphs
+
+
+@lru_cache(maxsize=4096)
+def _text_mask(line, px):
+    """Coverage (0 to 1) of the pixels of one line of text; lines shared by many cats are only assembled once"""
+    glyphs = _glyphs(px)
+    unknown = glyphs['?']
+    mask = np.hstack([glyphs.get(char, unknown) for char in line] or [glyphs[' ']])
+    return (mask / np.float32(255))[:, :, None]
+
+
+def render_grid(colors, labels, output, columns=None, size=96, level=1):
+    """
+    Composes the pictures of many cats into one mosaic PNG
+
+    Each cat gets a square tile holding the thumbnail of its color (see
+    load_thumbnail) with its label written over the bottom of the picture.
+    Labels are written in a monospace font whose characters are rasterized
+    once, and the mosaic is streamed to the output one row of tiles at a
+    time: memory use depends on the number of columns rather than on the
+    number of cats, and no window or display is needed.
+
+    Parameters
+    ----------
+    colors : list of str or None
+        The color of each cat. Cats without a known color get a gray tile.
+    labels : list of str or None
+        The text written on each tile; may hold several lines. Characters
+        outside Latin-1 are written as '?'. None writes no text at all.
+    output : str, path-like or file-like
+        Where to write the PNG.
+    columns : int, optional
+        Number of tiles per row. Default is None (a roughly square mosaic).
+    size : int, optional
+        Width and height of each tile, in pixels. Default is 96.
+    level : int, optional
+        zlib compression level of the PNG, from 0 (fastest) to 9 (smallest).
+        Default is 1.
+
+    Raises
+    ------
+    ValueError
+        If there is not one label per color, or columns or size is not positive.
+
+    Returns
+    -------
+    The output
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import io
+        from pyCatSim.utils.display import render_grid
+        buffer = render_grid(['tabby', 'black', None], ['Nutmeg', 'Mochi', 'Una'], io.BytesIO())
+        print(len(buffer.getvalue()))
+
+    """
+    n = len(colors)
+    if labels is not None and len(labels) != n:
+        raise ValueError("There must be one label per cat.")
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    if columns is None:
+        columns = max(1, int(np.ceil(np.sqrt(n))))
+    if columns < 1:
+        raise ValueError("columns must be at least 1.")
+    n_rows = max(1, -(-n // columns))
+    width = columns * size
+
+    blank = np.full((size, size, 3), 200, dtype=np.uint8)
+    tiles = {}
+    for color in set(colors):
+        try:
+            tiles[color] = load_thumbnail(color, size) if color is not None else blank
+        except FileNotFoundError:
+            tiles[color] = blank
+    px = max(size // 11, 5)
+    line_height = 0
+    strip = 0
+    if labels is not None:
+        line_height = _glyphs(px)[' '].shape[0]
+        n_lines = max((label.count('\n') + 1 for label in labels), default=1)
+        strip = min(size, n_lines * line_height + 2)
+
+    band = np.empty((size, width, 3), dtype=np.uint8)
+    close = isinstance(output, (str, os.PathLike))
+    f = open(output, 'wb') if close else output
+    try:
+        png = _PNGWriter(f, width, n_rows * size, level)
+        for row in range(n_rows):
+            start = row * columns
+            stop = min(start + columns, n)
+            band[:] = 255
+            for i in range(start, stop):
+                left = (i - start) * size
+                band[:, left:left + size] = tiles[colors[i]]
+            if labels is not None:
+                # darken the bottom of the pictures behind the text
+                band[size - strip:, :(stop - start) * size] //= 3
+                for i in range(start, stop):
+                    left = (i - start) * size + 2
+                    top = size - strip + 1
+                    for line in labels[i].split('\n'):
+                        mask = _text_mask(line, px)[:, :size - 4]
+                        area = band[top:top + mask.shape[0], left:left + mask.shape[1]]
+                        # blend towards white by the coverage of each pixel
+                        area += ((255 - area) * mask[:area.shape[0]]).astype(np.uint8)
+                        top += line_height
+            png.write(band)
+        png.close()
+    finally:
+        if close:
+            f.close()
+    return output
@@ -3,29 +3,64 @@
 
 import random
 
-def random_facts():
+import numpy as np
+
+# Pre-defined fact pool
+CAT_FACTS = (
+    "Cats sleep for 70% of their lives.",
+    "A group of cats is called a clowder.",
+    "Cats can rotate their ears 180 degrees.",
+    "The world's oldest cat lived to be 38 years old.",
+    "Cats have five toes on their front paws, but only four on the back.",
+    "A cat can jump up to six times its length.",
+    "Each cat's nose print is unique, like a human fingerprint.",
+    "Cats use their whiskers to detect changes in their surroundings.",
+    "The average house cat can run at speeds up to 30 mph.",
+    "Cats meow only to communicate with humans."
+)
+
+def random_facts(k=None, rng=None, replace=True):
     """
     calls up random facts about cats
 
+    Parameters
+    ----------
+    k : int, optional
+        Number of facts to draw. Default is None (draw a single fact).
+    rng : int or numpy.random.Generator, optional
+        Seed or generator used for the draw. Default is None (Python's global
+        random module for a single fact, fresh entropy otherwise).
+    replace : bool, optional
+        Whether the same fact can be drawn more than once. Default is True.
+
+    Raises
+    ------
+    ValueError
+        If more facts than available are requested without replacement.
+
     Returns
     -------
-    str
-        A fact randomly chosen from a pre-defined fact pool 
+    str or list of str
+        A fact randomly chosen from a pre-defined fact pool, or a list of k
+        facts drawn in one call if k is given
 
-    """
+    Examples
+    --------
+
+    .. jupyter-execute::
 
-    cat_facts = [
-        "Cats sleep for 70% of their lives.",
-        "A group of cats is called a clowder.",
-        "Cats can rotate their ears 180 degrees.",
-        "The world's oldest cat lived to be 38 years old.",
-        "Cats have five toes on their front paws, but only four on the back.",
-        "A cat can jump up to six times its length.",
-        "Each cat's nose print is unique, like a human fingerprint.",
-        "Cats use their whiskers to detect changes in their surroundings.",
-        "The average house cat can run at speeds up to 30 mph.",
-        "Cats meow only to communicate with humans."
-    ]
-    return random.choice(cat_facts)
+        from pyCatSim.utils.facts import random_facts
+        random_facts(3, rng=42, replace=False)
+
+    """
 
+    if k is None and rng is None:
+        return random.choice(CAT_FACTS)
 
+    rng = np.random.default_rng(rng)
+    if not replace and (k or 1) > len(CAT_FACTS):
+        raise ValueError(f"Cannot draw {k} distinct facts from a pool of {len(CAT_FACTS)}.")
+    picks = rng.choice(len(CAT_FACTS), size=1 if k is None else k, replace=replace)
+    if k is None:
+        return CAT_FACTS[picks[0]]
+    return [CAT_FACTS[i] for i in picks]
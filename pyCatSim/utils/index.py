@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module indexes the state of the cats for range and top-k queries.
+
+A SortedIndex keeps the IDs of the cats sorted by the value of one attribute.
+Changes do not re-sort it: adding the same amount to every cat only moves an
+offset, and cats whose value changed otherwise are set aside as "dirty" and
+checked one by one at query time. Once too many cats are dirty, the index is
+rebuilt on the next query. Queries therefore cost about the size of the
+result plus the number of dirty cats, rather than a scan of every cat.
+"""
+
+__all__ = ['SortedIndex']
+
+import numpy as np
+
+# Dirty cats allowed before a rebuild: at least REBUILD_MIN, or one in REBUILD_FRACTION
+REBUILD_MIN = 64
+REBUILD_FRACTION = 16
+
+# Comparison operators understood by SortedIndex.select
+OPERATORS = ('lt', 'le', 'gt', 'ge', 'eq')
+
+
+class SortedIndex:
+    """
+    IDs of cats sorted by the value of one attribute
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The value of the attribute for each cat.
+    ids : numpy.ndarray
+        The ID of each cat.
+
+    Attributes
+    ----------
+    keys : numpy.ndarray
+        The values at build time, sorted. The current value of a clean cat is
+        its key plus offset.
+    ids : numpy.ndarray
+        The IDs, in the order of keys.
+    offset : int
+        Amount added to every cat since the index was built.
+    dirty : set of int
+        IDs whose value changed (or that were added or removed) since the
+        index was built. Their keys are out of date.
+    valid : bool
+        False once the index is too far out of date and needs a rebuild.
+
+    """
+
+    def __init__(self, values, ids):
+        order = np.argsort(values, kind='stable')
+        self.keys = values[order]
+        self.ids = ids[order]
+        self.offset = 0
+        self.dirty = set()
+        self.valid = True
+        self._limit = max(REBUILD_MIN, len(values) // REBUILD_FRACTION)
+
+    def shift(self, delta):
+        """Records that delta was added to every cat"""
+        self.offset += delta
+
+    def remap(self, func):
+        """Applies a non-decreasing function to every value, which keeps the order"""
+        self.keys = func(self.keys + self.offset)
+        self.offset = 0
+
+    def touch(self, ids):
+        """Records that the values of some cats changed in other ways"""
+        if not self.valid:
+            return
+        ids = np.atleast_1d(ids)
+        if len(self.dirty) + ids.size > self._limit:
+            self.invalidate()
+        else:
+            self.dirty.update(ids.tolist())
+
+    def invalidate(self):
+        """Marks the index for a rebuild"""
+        self.valid = False
+        self.dirty = set()
+
+    def _clean(self, ids):
+        if not self.dirty:
+            return ids
+        return ids[~np.isin(ids, np.fromiter(self.dirty, dtype=np.int64, count=len(self.dirty)))]
+
+    def select(self, op, value):
+        """
+        IDs of the clean cats whose value satisfies a comparison
+
+        Parameters
+        ----------
+        op : str
+            One of 'lt', 'le', 'gt', 'ge' or 'eq'.
+        value : number
+            The value to compare to.
+
+        Returns
+        -------
+        numpy.ndarray
+            The IDs, in increasing order of value. Dirty cats are left out.
+
+        """
+        key = value - self.offset
+        if op == 'lt':
+            ids = self.ids[:np.searchsorted(self.keys, key, 'left')]
+        elif op == 'le':
+            ids = self.ids[:np.searchsorted(self.keys, key, 'right')]
+        elif op == 'gt':
+            ids = self.ids[np.searchsorted(self.keys, key, 'right'):]
+        elif op == 'ge':
+            ids = self.ids[np.searchsorted(self.keys, key, 'left'):]
+        elif op == 'eq':
+            ids = self.ids[np.searchsorted(self.keys, key, 'left'):np.searchsorted(self.keys, key, 'right')]
+        else:
+            raise ValueError(f"Invalid operator '{op}'. Valid options: {', '.join(OPERATORS)}")
+        return self._clean(ids)
+
+    def top(self, k, largest=True):
+        """
+        IDs of candidates for the k largest (or smallest) values
+
+        The result holds the k clean cats with the largest (smallest) values,
+        possibly along with a few more; dirty cats are left out.
+
+        Parameters
+        ----------
+        k : int
+            Number of cats wanted.
+        largest : bool, optional
+            Whether to look for the largest values. Default is True.
+
+        Returns
+        -------
+        numpy.ndarray
+            The candidate IDs.
+
+        """
+        # At most len(dirty) of the entries at the end are dirty
+        m = min(len(self.ids), k + len(self.dirty))
+        ids = self.ids[len(self.ids) - m:] if largest else self.ids[:m]
+        return self._clean(ids)
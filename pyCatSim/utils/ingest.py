@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module reads cat records in chunks.
+
+Records come from any iterable of mappings, a CSV file with a header row, or
+a JSON Lines file (one object per line). They are consumed chunk by chunk and
+each chunk is turned into columns ready to be appended to a Clowder's storage,
+so only one chunk of raw records is held in memory at a time.
+"""
+
+__all__ = ['stream_records',
+           'stream_csv',
+           'stream_jsonl']
+
+import csv
+import json
+from itertools import islice
+
+import numpy as np
+
+from .colors import resolve_colors
+from .store import STATE_FIELDS
+
+
+def _numbers(field, values, dtype, default):
+    """Converts values (numbers, numeric strings, None or '') to an array
+
+    Every value is read as a float first, so that '2.0' in a CSV file and 2.0
+    in a JSON file give the same result. Integer columns reject values with a
+    fractional part rather than truncating them.
+    """
+    numbers = np.array([default if value is None or value == '' else value for value in values])
+    numbers = numbers.astype(np.float64)
+    if np.issubdtype(dtype, np.integer):
+        invalid = ~np.isfinite(numbers) | (numbers != np.round(numbers))
+        if invalid.any():
+            value = values[np.flatnonzero(invalid)[0]]
+            raise ValueError(f"{field} must be an integer, got {value!r}.")
+    return numbers.astype(dtype)
+
+
+def _process(records, parse_colors):
+    """Turns a list of records into a chunk of columns"""
+    chunk = {'name': [record['name'] for record in records]}
+    chunk['age'] = _numbers('age', [record.get('age') for record in records], np.float64, np.nan)
+    chunk['color'] = np.asarray(parse_colors([record.get('color') or None for record in records]),
+                                dtype=np.int8)
+    for field in STATE_FIELDS:
+        chunk[field] = _numbers(field, [record.get(field) for record in records], np.int64, 0)
+    return chunk
+
+
+def stream_records(records, chunk_size=10000, parse_colors=resolve_colors):
+    """
+    Processes cat records chunk by chunk
+
+    Parameters
+    ----------
+    records : iterable of dict
+        One mapping per cat with a 'name' key and, optionally, 'age', 'color',
+        'mood', 'hunger_level', 'energy' and 'health' keys. Missing, None or
+        empty values take their default.
+    chunk_size : int, optional
+        Number of records per chunk. Default is 10000.
+    parse_colors : callable, optional
+        Turns a list of color inputs into integer codes into COLORS. Default
+        is pyCatSim.utils.colors.resolve_colors.
+
+    Raises
+    ------
+    KeyError
+        If a record has no name.
+    ValueError
+        If chunk_size is not positive, a value is not a number, or a state
+        value is not a whole number.
+
+    Yields
+    ------
+    dict
+        Maps 'name' to a list of str and 'age', 'color', 'mood',
+        'hunger_level', 'energy' and 'health' to arrays, with one entry per
+        record of the chunk.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.ingest import stream_records
+        records = ({'name': f'cat{i}', 'color': 'tabby', 'mood': i} for i in range(25))
+        for chunk in stream_records(records, chunk_size=10):
+            print(len(chunk['name']), chunk['mood'].sum())
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    records = iter(records)
+    while True:
+        batch = list(islice(records, chunk_size))
+        if not batch:
+            return
+        yield _process(batch, parse_colors)
+
+
+def stream_csv(path, chunk_size=10000, parse_colors=resolve_colors):
+    """
+    Reads cat records from a CSV file, chunk by chunk
+
+    The first row holds the column names ('name' and, optionally, 'age',
+    'color', 'mood', 'hunger_level', 'energy' and 'health'). Other columns
+    are ignored.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The CSV file.
+    chunk_size : int, optional
+        Number of records per chunk. Default is 10000.
+    parse_colors : callable, optional
+        Turns a list of color inputs into integer codes. Default is
+        pyCatSim.utils.colors.resolve_colors.
+
+    Yields
+    ------
+    dict
+        One chunk of columns, see stream_records.
+
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        yield from stream_records(csv.DictReader(f), chunk_size, parse_colors)
+
+
+def stream_jsonl(path, chunk_size=10000, parse_colors=resolve_colors):
+    """
+    Reads cat records from a JSON Lines file, chunk by chunk
+
+    Each non-empty line holds one JSON object with the same keys as the
+    records of stream_records.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The JSON Lines file.
+    chunk_size : int, optional
+        Number of records per chunk. Default is 10000.
+    parse_colors : callable, optional
+        Turns a list of color inputs into integer codes. Default is
+        pyCatSim.utils.colors.resolve_colors.
+
+    Yields
+    ------
+    dict
+        One chunk of columns, see stream_records.
+
+    """
+    with open(path, encoding='utf-8') as f:
+        records = (json.loads(line) for line in f if line.strip())
+        yield from stream_records(records, chunk_size, parse_colors)
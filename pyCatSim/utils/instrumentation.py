@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module counts and times the actions of cats, owners and clowders.
+
+Instrumentation is opt-in: enable() wraps the instrumented functions so that
+every call updates a counter, a running total and a latency histogram in a
+Registry, and disable() puts the original functions back. While disabled,
+nothing is wrapped and instrumentation costs nothing.
+"""
+
+__all__ = ['Registry',
+           'enable',
+           'disable',
+           'instrumented',
+           'get_registry']
+
+import bisect
+import contextlib
+import functools
+import importlib
+import threading
+import time
+
+# Functions wrapped by enable(), by module and class (None for module-level functions)
+TARGETS = {
+    ('pyCatSim.api.cat', 'Cat'): ('play', 'bathe', 'groom', 'eat', 'sleep', 'make_noise', 'show'),
+    ('pyCatSim.api.human', 'Owner'): ('feed', 'feed_all', 'groom', 'groom_all', 'adopt'),
+    ('pyCatSim.api.clowder', 'Clowder'): ('add_cat', 'remove_cat', 'play', 'bathe', 'groom',
+                                          'eat', 'sleep', 'act', 'simulate'),
+    ('pyCatSim.utils.display', None): ('show',),
+    ('pyCatSim.utils.noises', None): ('meow', 'purr', 'chatter', 'hiss', 'chirrup'),
+}
+
+# Upper bounds of the latency buckets, in seconds: 1 microsecond to ~100 s,
+# two buckets per doubling
+BUCKETS = tuple(1e-6 * 2 ** (i / 2) for i in range(54))
+
+
+class _Stats:
+    """Counters of one instrumented function"""
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # One more bucket for the calls slower than the last bound
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Registry:
+    """
+    Call counts and latencies of the instrumented functions
+
+    Latencies are kept in a histogram with two buckets per doubling, so
+    quantiles are upper bounds accurate to within about 40%.
+
+    Parameters
+    ----------
+    quantiles : tuple of float, optional
+        The quantiles reported by as_dict and to_prometheus. Default is (0.5, 0.9, 0.99).
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        from pyCatSim.utils.instrumentation import instrumented
+
+        with instrumented() as registry:
+            nutmeg = cats.Cat('Nutmeg')
+            for _ in range(100):
+                nutmeg.play()
+            nutmeg.eat()
+        print(registry.as_dict()['Cat.play'])
+
+    """
+
+    def __init__(self, quantiles=(0.5, 0.9, 0.99)):
+        self.quantiles = quantiles
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        """
+        Records one call
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, e.g. 'Cat.play'.
+        seconds : float
+            How long the call took.
+
+        """
+        index = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _Stats()
+            stats.count += 1
+            stats.total += seconds
+            stats.buckets[index] += 1
+            if seconds > stats.max:
+                stats.max = seconds
+
+    def reset(self):
+        """Forgets every recorded call"""
+        with self._lock:
+            self._stats = {}
+
+    def as_dict(self):
+        """
+        Exports the counters
+
+        Returns
+        -------
+        dict
+            Maps each function name to a dict with its 'count', 'total_seconds',
+            'mean_seconds', 'max_seconds' and one 'p<quantile>_seconds' entry per
+            quantile (e.g. 'p99_seconds'). Functions are sorted by total time,
+            slowest first.
+
+        """
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: -item[1].total)
+            result = {}
+            for name, stats in items:
+                entry = {'count': stats.count,
+                         'total_seconds': stats.total,
+                         'mean_seconds': stats.total / stats.count,
+                         'max_seconds': stats.max}
+                for q in self.quantiles:
+                    entry[f'p{q * 100:g}_seconds'] = stats.quantile(q)
+                result[name] = entry
+            return result
+
+    def to_prometheus(self, prefix='pycatsim'):
+        """
+        Exports the counters in the Prometheus text format
+
+        Each function is a label of a call counter and of a latency histogram.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of the metric names. Default is 'pycatsim'.
+
+        Returns
+        -------
+        str
+            The metrics, ready to be served to a Prometheus scraper.
+
+        """
+        calls = f'{prefix}_calls_total'
+        latency = f'{prefix}_call_duration_seconds'
+        lines = [f'# HELP {calls} Number of calls of each pyCatSim function.',
+                 f'# TYPE {calls} counter']
+        with self._lock:
+            items = sorted(self._stats.items())
+            for name, stats in items:
+                lines.append(f'{calls}{{function="{name}"}} {stats.count}')
+            lines += [f'# HELP {latency} Duration of the calls of each pyCatSim function.',
+                      f'# TYPE {latency} histogram']
+            for name, stats in items:
+                seen = 0
+                for bound, n in zip(BUCKETS, stats.buckets):
+                    seen += n
+                    lines.append(f'{latency}_bucket{{function="{name}",le="{bound:.6g}"}} {seen}')
+                lines.append(f'{latency}_bucket{{function="{name}",le="+Inf"}} {stats.count}')
+                lines.append(f'{latency}_sum{{function="{name}"}} {stats.total!r}')
+                lines.append(f'{latency}_count{{function="{name}"}} {stats.count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _wrap(func, name, registry):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.observe(name, time.perf_counter() - start)
+    return wrapper
+
+
+_registry = None
+# (owner, attribute, original) for every wrapped function
+_patched = []
+
+
+def get_registry():
+    """
+    Returns the registry currently recording, if any
+
+    Returns
+    -------
+    Registry or None
+        The registry passed to enable, or None while instrumentation is disabled.
+
+    """
+    return _registry
+
+
+def enable(registry=None):
+    """
+    Starts counting and timing the instrumented functions
+
+    The Cat, Owner and Clowder actions, pyCatSim.utils.display.show and the
+    noise functions of pyCatSim.utils.noises are wrapped. Enabling again
+    switches to the new registry.
+
+    Parameters
+    ----------
+    registry : Registry, optional
+        Where to record the calls. Default is None (a new Registry).
+
+    Returns
+    -------
+    Registry
+        The registry recording the calls.
+
+    """
+    global _registry
+    disable()
+    registry = Registry() if registry is None else registry
+    for (module_name, class_name), names in TARGETS.items():
+        module = importlib.import_module(module_name)
+        owner = module if class_name is None else getattr(module, class_name)
+        prefix = class_name or module_name.rsplit('.', 1)[-1]
+        for attr in names:
+            original = owner.__dict__[attr] if class_name else getattr(module, attr)
+            _patched.append((owner, attr, original))
+            setattr(owner, attr, _wrap(original, f'{prefix}.{attr}', registry))
+    _registry = registry
+    return registry
+
+
+def disable():
+    """
+    Stops instrumentation and restores the original functions
+
+    Returns
+    -------
+    Registry or None
+        The registry that was recording, with its counters.
+
+    """
+    global _registry
+    while _patched:
+        owner, attr, original = _patched.pop()
+        setattr(owner, attr, original)
+    registry, _registry = _registry, None
+    return registry
+
+
+@contextlib.contextmanager
+def instrumented(registry=None):
+    """
+    Enables instrumentation for the duration of a with block
+
+    Parameters
+    ----------
+    registry : Registry, optional
+        Where to record the calls. Default is None (a new Registry).
+
+    Yields
+    ------
+    Registry
+        The registry recording the calls.
+
+    """
+    registry = enable(registry)
+    try:
+        yield registry
+    finally:
+        disable()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module records what happens to the cats of a Clowder.
+
+A Journal attached to a Clowder receives one record per cat and per state
+change (play, bathe, groom, eat, sleep, care from an Owner, or an attribute
+set directly): the tick, the cat ID, the event code (index in EVENTS) and the
+change of mood, hunger_level, energy and health. Records go into preallocated
+columns used as a ring buffer; when a spill directory is given, full buffers
+are written to disk instead of being overwritten.
+"""
+
+__all__ = ['Journal',
+           'replay']
+
+import os
+
+import numpy as np
+
+from .store import EVENTS, STATE_FIELDS
+
+# Columns of a journal, with their types
+_COLUMNS = {'tick': np.int64, 'cat_id': np.int64, 'event': np.int8}
+_COLUMNS.update({field: np.int64 for field in STATE_FIELDS})
+
+
+class Journal:
+    """
+    Append-only record of cat state changes
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of records held in memory. Default is 65536.
+    spill_dir : str or path-like, optional
+        Directory where full buffers are written as .npz chunks. If None, the
+        oldest records are overwritten once the buffer is full. Default is None.
+
+    Attributes
+    ----------
+    tick : int
+        Tick stamped on new records. Advanced by pyCatSim.Clowder.simulate,
+        or set by hand.
+    dropped : int
+        Number of records overwritten because the buffer was full.
+    n_spilled : int
+        Number of records written to disk.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        from pyCatSim.utils.journal import Journal
+        group = cats.Clowder([cats.Cat('Nutmeg'), cats.Cat('Una')])
+        journal = group.attach_journal(Journal())
+        group.play()
+        group.catlist[0].eat()
+        print(journal.read())
+
+    """
+
+    def __init__(self, capacity=65536, spill_dir=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.tick = 0
+        self.dropped = 0
+        self.n_spilled = 0
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in _COLUMNS.items()}
+        self._pos = 0
+        self._count = 0
+        self._chunks = []
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        return self.n_spilled + self._count
+
+    def advance(self, n=1):
+        """
+        Moves the journal forward by n ticks
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of ticks. Default is 1.
+
+        """
+        self.tick += n
+
+    def record(self, cat_ids, event, deltas):
+        """
+        Appends records
+
+        Parameters
+        ----------
+        cat_ids : int or array-like
+            The IDs of the cats that changed.
+        event : int or array-like
+            The event code (index in EVENTS), shared or one per cat.
+        deltas : list of array-like
+            The change of each state attribute (in the order mood,
+            hunger_level, energy, health), one value per cat.
+
+        """
+        cat_ids = np.atleast_1d(cat_ids)
+        n = cat_ids.size
+        values = {'tick': np.full(n, self.tick), 'cat_id': cat_ids,
+                  'event': np.broadcast_to(event, n)}
+        for field, delta in zip(STATE_FIELDS, deltas):
+            values[field] = np.broadcast_to(delta, n)
+
+        written = 0
+        while written < n:
+            if self._count == self.capacity and self.spill_dir is not None:
+                self.flush()
+            if self.spill_dir is None and n - written > self.capacity:
+                # only the most recent records can survive
+                skipped = n - written - self.capacity
+                self.dropped += skipped
+                written += skipped
+            stop = min(n, written + self.capacity - self._pos)
+            if self.spill_dir is not None:
+                stop = min(stop, written + self.capacity - self._count)
+            block = slice(self._pos, self._pos + stop - written)
+            for name, column in self._columns.items():
+                column[block] = values[name][written:stop]
+            added = stop - written
+            overwritten = max(0, self._count + added - self.capacity)
+            self.dropped += overwritten
+            self._count = min(self.capacity, self._count + added)
+            self._pos = (self._pos + added) % self.capacity
+            written = stop
+
+    def _ordered(self):
+        """Returns the in-memory records, oldest first"""
+        if self._count < self.capacity:
+            start = (self._pos - self._count) % self.capacity
+            return {name: column[start:start + self._count] for name, column in self._columns.items()}
+        return {name: np.concatenate([column[self._pos:], column[:self._pos]])
+                for name, column in self._columns.items()}
+
+    def flush(self):
+        """
+        Writes the in-memory records to the spill directory and empties the buffer
+
+        Raises
+        ------
+        ValueError
+            If the journal has no spill directory.
+
+        """
+        if self.spill_dir is None:
+            raise ValueError("This journal has no spill directory.")
+        if self._count == 0:
+            return
+        path = os.path.join(self.spill_dir, f"journal_{len(self._chunks):06d}.npz")
+        np.savez(path, **self._ordered())
+        self._chunks.append(path)
+        self.n_spilled += self._count
+        self._pos = 0
+        self._count = 0
+
+    def read(self):
+        """
+        Returns all the records still available, oldest first
+
+        Returns
+        -------
+        dict
+            Maps 'tick', 'cat_id', 'event', 'mood', 'hunger_level', 'energy'
+            and 'health' to arrays with one value per record.
+
+        """
+        parts = []
+        for path in self._chunks:
+            with np.load(path) as chunk:
+                parts.append({name: chunk[name] for name in _COLUMNS})
+        parts.append(self._ordered())
+        return {name: np.concatenate([part[name] for part in parts]).astype(dtype, copy=False)
+                for name, dtype in _COLUMNS.items()}
+
+    @staticmethod
+    def event_names(codes):
+        """
+        Translates event codes into names
+
+        Parameters
+        ----------
+        codes : array-like of int
+            Event codes, e.g. journal.read()['event'].
+
+        Returns
+        -------
+        list of str
+            The event names (see EVENTS).
+
+        """
+        return [EVENTS[code] for code in codes]
+
+
+def replay(journal, clowder, until_tick=None):
+    """
+    Rebuilds the state of a Clowder from a journal
+
+    The changes recorded in the journal are added to the cats of the Clowder,
+    matched by ID. The Clowder should hold the state at the start of the
+    journal, e.g. a Clowder rebuilt from the same records in the same order,
+    so that cats get the same IDs.
+
+    Parameters
+    ----------
+    journal : Journal
+        The journal to replay. It must not have dropped records.
+    clowder : pyCatSim.Clowder
+        The Clowder to update in place.
+    until_tick : int, optional
+        Only replay records stamped before this tick. Default is None (all records).
+
+    Raises
+    ------
+    ValueError
+        If the journal dropped records, or refers to a cat that is not in the Clowder.
+
+    Returns
+    -------
+    pyCatSim.Clowder
+        The updated Clowder.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        from pyCatSim.utils.journal import Journal, replay
+        records = [{'name': f'cat{i}', 'hunger_level': i} for i in range(5)]
+        group = cats.Clowder.from_records(records)
+        journal = group.attach_journal(Journal())
+        group.simulate(10, seed=0)
+        rebuilt = replay(journal, cats.Clowder.from_records(records))
+        print((rebuilt.mood == group.mood).all())
+
+    """
+    if journal.dropped:
+        raise ValueError(f"The journal dropped {journal.dropped} records and cannot be replayed.")
+    events = journal.read()
+    if until_tick is not None:
+        keep = events['tick'] < until_tick
+        events = {name: values[keep] for name, values in events.items()}
+    store = clowder._store
+    ids = events['cat_id']
+    rows = np.full(ids.size, -1, dtype=np.int64)
+    known = (ids >= 0) & (ids < store._next_id)
+    rows[known] = store._row_of_id[ids[known]]
+    if (rows < 0).any():
+        raise ValueError("The journal refers to cats that are not in the Clowder.")
+    # Total change of each cat, applied through the store so that its
+    # statistics, indexes and recorder follow
+    changed, positions = np.unique(rows, return_inverse=True)
+    deltas = {}
+    for field in STATE_FIELDS:
+        deltas[field] = np.zeros(changed.size, dtype=np.int64)
+        np.add.at(deltas[field], positions, events[field])
+    store.add_deltas(changed, deltas)
+    return clowder
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module mixes the noises of many cats into one recording.
+
+A chorus is a schedule of events: which cat makes which noise, and when.
+Each clip is decoded once, and all the events using the same clip are mixed
+in one pass by convolving the clip with a train of impulses (one per event,
+scaled by the gain of its cat) through the FFT. The cost therefore depends
+on the length of the recording and the number of distinct clips, not on the
+number of cats. Clips used by few events are simply added copy by copy,
+which is cheaper. The result is a NumPy array of samples that can be written
+as a WAV file.
+
+Decoding the mp3 clips shipped with pyCatSim requires the optional soundfile
+package (`pip install soundfile`); mixing clips given as arrays does not.
+"""
+
+__all__ = ['RATE',
+           'decode_clip',
+           'mix',
+           'write_wav']
+
+import os
+import wave
+
+import numpy as np
+
+from .behavior import NOISES
+from .playback import RATE, decode_clip
+
+# A clip is added copy by copy while the events using it times its length
+# stay below DIRECT_COST times the FFT size, and through the FFT beyond
+# (three transforms cost about as much as 50 additions per point)
+DIRECT_COST = 50
+
+
+def _noise_codes(noises):
+    """Turns noise names or codes into an array of codes into NOISES"""
+    noises = np.asarray(noises)
+    if noises.dtype.kind in 'US':
+        codes = np.full(noises.shape, -1, dtype=np.int8)
+        for code, noise in enumerate(NOISES):
+            codes[noises == noise] = code
+        if (codes < 0).any():
+            invalid = noises[codes < 0][0]
+            raise ValueError(f"Invalid noise '{invalid}'. Valid options: {', '.join(NOISES)}")
+        return codes
+    if noises.size and (noises.min() < 0 or noises.max() >= len(NOISES)):
+        raise ValueError(f"Invalid noise code. Valid codes are 0 to {len(NOISES) - 1}.")
+    return noises.astype(np.int8)
+
+
+def mix(cats, noises, starts, gains=None, offsets=None, rate=RATE, duration=None,
+        clips=None, normalize=True):
+    """
+    Mixes a schedule of noises into one buffer of samples
+
+    Each event is one cat making one noise at a given time. The cats are
+    numbered (e.g. by their row in a Clowder) so that each can have its own
+    gain and time offset.
+
+    Parameters
+    ----------
+    cats : array-like of int
+        The cat making each event's noise, as an index into gains and offsets.
+    noises : array-like of str or int
+        The noise of each event, as a name or a code into
+        pyCatSim.utils.behavior.NOISES (such as the codes returned by
+        Clowder.make_noises).
+    starts : array-like of float
+        When each noise starts, in seconds.
+    gains : array-like of float, optional
+        Volume of each cat, indexed by cats. Default is None (1 for every cat).
+    offsets : array-like of float, optional
+        Delay of each cat, in seconds, added to the starts of its noises.
+        Default is None (no delay).
+    rate : int, optional
+        Sample rate, in Hz. Default is 22050.
+    duration : float, optional
+        Length of the recording, in seconds. Noises running past the end are
+        cut. Default is None (until the last noise ends).
+    clips : sequence of numpy.ndarray, optional
+        Mono samples of each noise, in the order of NOISES, at the given
+        rate. Default is None (decode the clips of pyCatSim with decode_clip).
+    normalize : bool, optional
+        Whether to scale the result down so that it does not clip, if its
+        peak exceeds 1. Default is True.
+
+    Raises
+    ------
+    ValueError
+        If the events have different lengths, a noise is not valid or a
+        start is negative.
+
+    Returns
+    -------
+    numpy.ndarray of float32
+        The mixed samples.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import numpy as np
+        from pyCatSim.utils.mixer import mix, RATE
+
+        # Two short synthetic clips stand in for the recorded noises here
+        t = np.arange(RATE // 10) / RATE
+        clips = [np.sin(2 * np.pi * f * t) for f in (440, 220, 330, 110, 660)]
+        samples = mix(cats=[0, 1, 1], noises=['meow', 'purr', 'hiss'], starts=[0, 0.05, 0.2],
+                      gains=[1, 0.5], clips=clips)
+        print(len(samples) / RATE)
+
+    """
+    cats = np.asarray(cats, dtype=np.int64).ravel()
+    codes = _noise_codes(noises).ravel()
+    starts = np.asarray(starts, dtype=np.float64).ravel()
+    if not len(cats) == len(codes) == len(starts):
+        raise ValueError("cats, noises and starts must have one entry per event.")
+    if cats.size and cats.min() < 0:
+        raise ValueError("Cat indices cannot be negative.")
+    event_gains = np.ones(len(cats)) if gains is None else np.asarray(gains, dtype=np.float64)[cats]
+    if offsets is not None:
+        starts = starts + np.asarray(offsets, dtype=np.float64)[cats]
+    if starts.size and starts.min() < 0:
+        raise ValueError("Noises cannot start before 0.")
+    positions = np.round(starts * rate).astype(np.int64)
+
+    used = np.unique(codes).tolist()
+    if clips is None:
+        clips = {code: decode_clip(NOISES[code], rate) for code in used}
+    lengths = np.zeros(len(NOISES), dtype=np.int64)
+    for code in used:
+        lengths[code] = len(clips[code])
+    if duration is None:
+        n = int((positions + lengths[codes]).max()) if positions.size else 0
+    else:
+        n = int(round(duration * rate))
+    out = np.zeros(n)
+    for code in used:
+        clip = np.asarray(clips[code], dtype=np.float64)
+        events = (codes == code) & (positions < n)
+        if not events.any() or not len(clip):
+            continue
+        size = 1 << int(np.ceil(np.log2(n + len(clip) - 1)))
+        if np.count_nonzero(events) * len(clip) <= DIRECT_COST * size:
+            # Few events: add each copy of the clip directly
+            for position, gain in zip(positions[events].tolist(), event_gains[events].tolist()):
+                stop = min(position + len(clip), n)
+                out[position:stop] += gain * clip[:stop - position]
+        else:
+            # Impulse train of the events using this clip, convolved with the clip
+            impulses = np.bincount(positions[events], weights=event_gains[events], minlength=n)
+            mixed = np.fft.irfft(np.fft.rfft(impulses, size) * np.fft.rfft(clip, size), size)
+            out += mixed[:n]
+    if normalize and n:
+        peak = np.abs(out).max()
+        if peak > 1:
+            out /= peak
+    return out.astype(np.float32)
+
+
+def write_wav(samples, output, rate=RATE):
+    """
+    Writes samples as a 16-bit mono WAV file
+
+    Parameters
+    ----------
+    samples : array-like of float
+        The samples, between -1 and 1. Values outside are clipped.
+    output : str, path-like or file-like
+        Where to write the WAV.
+    rate : int, optional
+        Sample rate, in Hz. Default is 22050.
+
+    Returns
+    -------
+    The output
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import io
+        import numpy as np
+        from pyCatSim.utils.mixer import write_wav
+        wav = write_wav(np.zeros(22050), io.BytesIO())
+        print(len(wav.getvalue()))
+
+    """
+    pcm = (np.clip(np.asarray(samples, dtype=np.float64), -1, 1) * 32767).round().astype('<i2')
+    target = os.fspath(output) if isinstance(output, (str, os.PathLike)) else output
+    with wave.open(target, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(pcm.tobytes())
+    return output
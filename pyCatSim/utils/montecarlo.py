@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module runs many independent Clowder simulations in parallel.
+
+Scenarios are sharded across a process pool. Each scenario draws its random
+numbers from its own stream, spawned from a single seed according to the
+scenario's position, so results do not depend on the number of workers.
+"""
+
+__all__ = ['Scenario',
+           'MonteCarloResult',
+           'run_scenarios']
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .store import STATE_FIELDS
+
+
+class Scenario:
+    """
+    One independent Clowder simulation
+
+    Parameters
+    ----------
+    records : list of dict
+        The cats of the Clowder, as accepted by pyCatSim.Clowder.from_records.
+    n_steps : int
+        Number of ticks to simulate.
+    policy : callable, optional
+        The policy passed to pyCatSim.Clowder.simulate. Must be picklable to
+        run in a worker process (built-in policies are). Default is None.
+    sleep_duration : int or float, optional
+        Hours slept by a cat whose action is 'sleep'. Default is 8.
+
+    """
+
+    def __init__(self, records, n_steps, policy=None, sleep_duration=8):
+        self.records = list(records)
+        self.n_steps = n_steps
+        self.policy = policy
+        self.sleep_duration = sleep_duration
+
+
+class MonteCarloResult:
+    """
+    Final state of a set of scenarios, reduced to summaries and distributions
+
+    Attributes
+    ----------
+    n_scenarios : int
+        Number of scenarios run.
+    summary : dict
+        Maps each state attribute to a dict of 'mean', 'std', 'min' and 'max'
+        arrays with one value per scenario, in the order the scenarios were given.
+    distribution : dict
+        Maps each state attribute to a (values, counts) pair of arrays giving
+        the final values over all cats of all scenarios.
+
+    """
+
+    def __init__(self, summaries):
+        self.n_scenarios = len(summaries)
+        self.summary = {}
+        self.distribution = {}
+        for field in STATE_FIELDS:
+            self.summary[field] = {
+                stat: np.array([summary[field][stat] for summary in summaries])
+                for stat in ('mean', 'std', 'min', 'max')}
+            counts = {}
+            for summary in summaries:
+                for value, count in zip(*summary[field]['distribution']):
+                    counts[value] = counts.get(value, 0) + count
+            values = np.array(sorted(counts), dtype=np.int64)
+            self.distribution[field] = (values, np.array([counts[v] for v in values], dtype=np.int64))
+
+    def pooled_mean(self, field):
+        """
+        Mean final value of a state attribute over all cats of all scenarios
+
+        Parameters
+        ----------
+        field : str
+            One of 'mood', 'hunger_level', 'energy' or 'health'.
+
+        Returns
+        -------
+        float
+            The pooled mean (NaN if there were no cats).
+
+        """
+        values, counts = self.distribution[field]
+        total = counts.sum()
+        return float(values @ counts / total) if total else float('nan')
+
+    def __repr__(self):
+        return f"MonteCarloResult(n_scenarios={self.n_scenarios})"
+
+
+def _run_scenario(scenario, seed):
+    """Runs one scenario and summarizes the final state of its cats"""
+    from ..api.clowder import Clowder
+
+    group = Clowder.from_records(scenario.records)
+    group.simulate(scenario.n_steps, policy=scenario.policy,
+                   sleep_duration=scenario.sleep_duration, seed=seed)
+    summary = {}
+    for field in STATE_FIELDS:
+        values = group._store.column(field)
+        if values.size:
+            stats = {'mean': values.mean(), 'std': values.std(),
+                     'min': values.min(), 'max': values.max()}
+        else:
+            stats = {stat: np.nan for stat in ('mean', 'std', 'min', 'max')}
+        stats['distribution'] = np.unique(values, return_counts=True)
+        summary[field] = stats
+    return summary
+
+
+def _run_shard(shard):
+    return [_run_scenario(scenario, seed) for scenario, seed in shard]
+
+
+def run_scenarios(scenarios, n_workers=None, seed=None):
+    """
+    Runs independent Clowder simulations across a pool of processes
+
+    Parameters
+    ----------
+    scenarios : list of Scenario
+        The scenarios to run.
+    n_workers : int, optional
+        Number of worker processes. With 1, scenarios run in the calling
+        process. Default is the number of CPUs.
+    seed : int, optional
+        Root seed. Scenario i uses the i-th stream spawned from it, whatever
+        the number of workers. Default is None (fresh entropy).
+
+    Returns
+    -------
+    MonteCarloResult
+        The reduced final states.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.montecarlo import Scenario, run_scenarios
+        from pyCatSim.utils.simulation import needs_policy
+        records = [{'name': f'cat{i}', 'hunger_level': i % 5} for i in range(100)]
+        scenarios = [Scenario(records, 50, policy=needs_policy(hunger_threshold=t))
+                     for t in range(1, 5)]
+        result = run_scenarios(scenarios, n_workers=2, seed=42)
+        print(result.summary['hunger_level']['mean'])
+
+    """
+    scenarios = list(scenarios)
+    seeds = np.random.SeedSequence(seed).spawn(len(scenarios))
+    tasks = list(zip(scenarios, seeds))
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(tasks)))
+
+    if n_workers == 1:
+        return MonteCarloResult(_run_shard(tasks))
+
+    # A few shards per worker balances the load without paying for one task per scenario
+    n_shards = min(len(tasks), 4 * n_workers)
+    bounds = np.linspace(0, len(tasks), n_shards + 1).astype(int)
+    shards = [tasks[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        summaries = [summary for shard in executor.map(_run_shard, shards) for summary in shard]
+    return MonteCarloResult(summaries)
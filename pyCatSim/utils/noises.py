@@ -11,13 +11,11 @@ __all__=['meow',
          'chirrup',
          'hiss']
 
-from playsound import playsound
-import os
-from pathlib import Path 
+from .playback import SOUND_DIR, get_player
 
-
-# Path to the sound files
-SOUND_DIR = Path(__file__).parents[1].joinpath("sounds").resolve()
+def _play(noise):
+    """Queues a noise on the shared player and returns the playback handle"""
+    return get_player().play(noise)
 
 def meow(play=False):
     """
@@ -30,15 +28,16 @@ def meow(play=False):
 
     Returns
     -------
-    str
-        If play is False, returns the sound as text
+    str or concurrent.futures.Future
+        If play is False, returns the sound as text. Otherwise, returns
+        immediately with a handle on the playback (see pyCatSim.utils.playback).
 
     """
     
     if play is False:
         return "Meow!"
     else:
-        playsound(os.path.join(SOUND_DIR, "meow.mp3"))
+        return _play("meow")
 
 def purr(play=False):
     """
@@ -51,15 +50,16 @@ def purr(play=False):
 
     Returns
     -------
-    str
-        If play is False, returns the sound as text
+    str or concurrent.futures.Future
+        If play is False, returns the sound as text. Otherwise, returns
+        immediately with a handle on the playback (see pyCatSim.utils.playback).
 
     """
     
     if play is False:
         return "Purrr"
     else:
-        playsound(os.path.join(SOUND_DIR, "purr.mp3"))
+        return _play("purr")
 
 def chatter(play=False):
     """
@@ -72,14 +72,15 @@ def chatter(play=False):
 
     Returns
     -------
-    str
-        If play is False, returns the sound as text
+    str or concurrent.futures.Future
+        If play is False, returns the sound as text. Otherwise, returns
+        immediately with a handle on the playback (see pyCatSim.utils.playback).
     """
     
     if play is False:
         return "chattering"
     else:
-        playsound(os.path.join(SOUND_DIR, "chattering.mp3"))
+        return _play("chatter")
 
 def chirrup(play=False):
     """
@@ -92,15 +93,16 @@ def chirrup(play=False):
 
     Returns
     -------
-    str
-        If play is False, returns the sound as text
+    str or concurrent.futures.Future
+        If play is False, returns the sound as text. Otherwise, returns
+        immediately with a handle on the playback (see pyCatSim.utils.playback).
 
     """
         
     if play is False:
         return "Chirrup"
     else:
-        playsound(os.path.join(SOUND_DIR, "chirrup.mp3"))
+        return _play("chirrup")
 
 def hiss(play=False):
     """
@@ -113,11 +115,12 @@ def hiss(play=False):
 
     Returns
     -------
-    str
-        If play is False, returns the sound as text
+    str or concurrent.futures.Future
+        If play is False, returns the sound as text. Otherwise, returns
+        immediately with a handle on the playback (see pyCatSim.utils.playback).
     
     """
     if play is False:
         return "Hiss.."
     else:
-        playsound(os.path.join(SOUND_DIR, "hissing.mp3"))
+        return _play("hiss")
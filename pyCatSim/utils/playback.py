@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module plays cat sounds in the background.
+
+Playback requests go to a queue served by a small pool of worker threads, so
+callers get a handle back immediately instead of waiting for the clip to
+finish. The actual output is delegated to a backend, which can be swapped
+(e.g. for a recording backend on machines without an audio device).
+
+When the optional soundfile and sounddevice packages are installed
+(`pip install soundfile sounddevice`), each clip is decoded once on a worker
+thread and played from the samples kept in memory. Otherwise the clips are
+played from their files with playsound.
+"""
+
+__all__ = ['RATE',
+           'SoundPlayer',
+           'SounddeviceBackend',
+           'PlaysoundBackend',
+           'NullBackend',
+           'RecordingBackend',
+           'decode_clip',
+           'load_clip',
+           'clip_path',
+           'default_backend',
+           'get_player',
+           'set_backend']
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+
+# Path to the sound files
+SOUND_DIR = Path(__file__).parents[1].joinpath("sounds").resolve()
+
+# File holding each noise
+CLIPS = {
+    'meow': 'meow.mp3',
+    'purr': 'purr.mp3',
+    'chatter': 'chattering.mp3',
+    'chirrup': 'chirrup.mp3',
+    'hiss': 'hissing.mp3',
+}
+
+# Sample rate of the decoded clips, in Hz
+RATE = 22050
+
+
+def clip_path(noise):
+    """
+    Returns the path of the file holding a noise
+
+    Parameters
+    ----------
+    noise : str
+        One of 'meow', 'purr', 'chatter', 'chirrup' or 'hiss'.
+
+    Raises
+    ------
+    ValueError
+        If the noise is not valid.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the clip.
+
+    """
+    try:
+        return SOUND_DIR.joinpath(CLIPS[noise])
+    except KeyError:
+        raise ValueError(f"Invalid noise '{noise}'. Valid options: {', '.join(CLIPS)}")
+
+
+@lru_cache(maxsize=None)
+def decode_clip(noise, rate=RATE):
+    """
+    Decodes a clip into mono samples, once per sample rate
+
+    Parameters
+    ----------
+    noise : str
+        One of 'meow', 'purr', 'chatter', 'hiss' or 'chirrup'.
+    rate : int, optional
+        Sample rate of the result, in Hz. Default is 22050.
+
+    Raises
+    ------
+    ValueError
+        If the noise is not valid.
+    ImportError
+        If soundfile is not installed.
+
+    Returns
+    -------
+    numpy.ndarray of float32
+        The samples, between -1 and 1 (read-only).
+
+    """
+    path = clip_path(noise)
+    try:
+        # soundfile is optional and only needed to decode the mp3 files
+        import soundfile
+    except ImportError:
+        raise ImportError("Decoding the noises requires soundfile: pip install soundfile")
+    data, source_rate = soundfile.read(path, dtype='float32', always_2d=True)
+    samples = data.mean(axis=1)
+    if source_rate != rate:
+        n = int(round(len(samples) * rate / source_rate))
+        samples = np.interp(np.arange(n) * (source_rate / rate), np.arange(len(samples)),
+                            samples).astype(np.float32)
+    samples.flags.writeable = False
+    return samples
+
+
+def load_clip(noise):
+    """
+    Returns the samples played for a noise, decoding the clip on first use
+
+    Parameters
+    ----------
+    noise : str
+        One of 'meow', 'purr', 'chatter', 'chirrup' or 'hiss'.
+
+    Raises
+    ------
+    ValueError
+        If the noise is not valid.
+    ImportError
+        If soundfile is not installed.
+
+    Returns
+    -------
+    numpy.ndarray of float32
+        The mono samples of the clip at RATE (read-only, shared between calls).
+
+    """
+    return decode_clip(noise, RATE)
+
+
+class SounddeviceBackend:
+    """
+    Plays the decoded samples on the audio device with sounddevice
+
+    sounddevice is imported on first use. Each clip is decoded on the worker
+    thread the first time it is played, then played from memory (see
+    load_clip). Each clip gets its own output stream, so clips played on
+    different workers overlap.
+    """
+
+    def play(self, noise, path):
+        try:
+            import sounddevice
+        except (ImportError, OSError):
+            # OSError: sounddevice is installed but PortAudio is missing
+            raise ImportError("Playing the noises from memory requires sounddevice and "
+                              "PortAudio: pip install sounddevice")
+        data = load_clip(noise)
+        with sounddevice.OutputStream(samplerate=RATE, channels=1, dtype='float32') as stream:
+            stream.write(data)
+
+
+class PlaysoundBackend:
+    """
+    Plays the clip files on the audio device with playsound
+
+    playsound is imported on first use. It reads the file on every play, so
+    it is only the default when soundfile or sounddevice is not installed.
+    """
+
+    def play(self, noise, path):
+        from playsound import playsound
+        playsound(str(path))
+
+
+class NullBackend:
+    """
+    Discards every clip. Useful on machines without an audio device.
+    """
+
+    def play(self, noise, path):
+        pass
+
+
+class RecordingBackend:
+    """
+    Records the clips it is asked to play instead of playing them
+
+    Attributes
+    ----------
+    played : list of tuple
+        One (noise, path of the clip) pair per clip, in the order they were played.
+
+    """
+
+    def __init__(self):
+        self.played = []
+        self._lock = threading.Lock()
+
+    def play(self, noise, path):
+        with self._lock:
+            self.played.append((noise, path))
+
+
+def default_backend():
+    """
+    Returns the backend used when none is given
+
+    Returns
+    -------
+    SounddeviceBackend or PlaysoundBackend
+        SounddeviceBackend if soundfile and sounddevice (with PortAudio) can
+        be imported, PlaysoundBackend otherwise.
+
+    """
+    try:
+        import soundfile
+        import sounddevice
+    except (ImportError, OSError):
+        return PlaysoundBackend()
+    return SounddeviceBackend()
+
+
+class SoundPlayer:
+    """
+    Plays clips through a backend on background worker threads
+
+    Parameters
+    ----------
+    backend : object, optional
+        Any object with a play(noise, path) method. Default is default_backend().
+    max_concurrency : int, optional
+        Maximum number of clips playing at the same time. Further requests
+        wait in the queue. Default is 1.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.playback import SoundPlayer, RecordingBackend
+        player = SoundPlayer(RecordingBackend(), max_concurrency=2)
+        handles = [player.play(noise) for noise in ['meow', 'purr', 'hiss']]
+        player.shutdown()
+        print(player.backend.played)
+
+    """
+
+    def __init__(self, backend=None, max_concurrency=1):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.backend = default_backend() if backend is None else backend
+        self.max_concurrency = max_concurrency
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def play(self, noise):
+        """
+        Queues a clip for playback
+
+        Parameters
+        ----------
+        noise : str
+            One of 'meow', 'purr', 'chatter', 'chirrup' or 'hiss'.
+
+        Raises
+        ------
+        ValueError
+            If the noise is not valid.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Handle on the playback; call result() to wait for the clip to end.
+
+        """
+        path = clip_path(noise)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix='pyCatSim-sound')
+            return self._executor.submit(self.backend.play, noise, path)
+
+    def shutdown(self, wait=True):
+        """
+        Stops the worker threads
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the queued clips to finish. Default is True.
+
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_player = None
+
+
+def get_player():
+    """
+    Returns the player used by the noise functions
+
+    Returns
+    -------
+    SoundPlayer
+        The shared player, created with the default backend on first use.
+
+    """
+    global _player
+    if _player is None:
+        _player = SoundPlayer()
+    return _player
+
+
+def set_backend(backend, max_concurrency=1):
+    """
+    Replaces the shared player used by the noise functions
+
+    Clips already queued on the previous player still finish.
+
+    Parameters
+    ----------
+    backend : object
+        Any object with a play(noise, path) method.
+    max_concurrency : int, optional
+        Maximum number of clips playing at the same time. Default is 1.
+
+    Returns
+    -------
+    SoundPlayer
+        The new shared player.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        from pyCatSim.utils.playback import set_backend, NullBackend
+        set_backend(NullBackend())
+
+    """
+    global _player
+    previous = _player
+    _player = SoundPlayer(backend, max_concurrency)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _player
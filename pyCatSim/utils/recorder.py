@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module records the state of the cats of a Clowder over time.
+
+A Recorder attached to a Clowder gives one row per recorded tick and one
+column per cat for each recorded attribute. The Clowder tells the recorder
+which cats changed, so a tick only stores the new values of those cats: a
+chunk of ticks is kept as the full state at its first tick (a keyframe)
+followed by the changes of each later tick, and the full rows are rebuilt
+when the recording is read. A tick where every cat may have changed (such as
+a tick of Clowder.simulate) starts a new chunk. Finished chunks stay in
+memory, or are written to .npz files or memory-mapped .npy files.
+"""
+
+__all__ = ['Recorder']
+
+import os
+
+import numpy as np
+
+from .store import STATE_FIELDS
+
+# Ways of keeping full chunks
+SPILL_FORMATS = ('npz', 'memmap')
+
+
+class Recorder:
+    """
+    Time series of the state of every cat of a Clowder
+
+    The cats recorded are the ones in the Clowder when the recorder is
+    attached, in the order of their IDs. Cats added later are not recorded;
+    cats removed later keep their last recorded values.
+
+    Parameters
+    ----------
+    fields : list of str, optional
+        The attributes to record, among 'mood', 'hunger_level', 'energy' and
+        'health'. Default is None (all four).
+    stride : int, optional
+        Record one tick out of stride. Default is 1 (every tick).
+    capacity : int, optional
+        Maximum number of recorded ticks per chunk. Default is None (a chunk
+        ends when its changes would take more room than a new keyframe).
+    spill_dir : str or path-like, optional
+        Directory where chunks are kept once the run outgrows memory. If
+        None, every chunk stays in memory. Default is None.
+    spill_format : str, optional
+        With a spill directory, 'npz' writes each full chunk to a compressed
+        .npz file and frees it; 'memmap' writes each full chunk to .npy
+        files and maps them back in, so the operating system pages them in
+        and out as needed. Default is 'npz'.
+
+    Attributes
+    ----------
+    tick : int
+        Number of ticks since the recorder was attached. Advanced by
+        pyCatSim.Clowder.simulate, or by hand with advance.
+    ids : numpy.ndarray
+        The ID of the cat of each column.
+
+    Raises
+    ------
+    ValueError
+        If a field, the stride, the capacity or the spill format is not valid.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        from pyCatSim.utils.recorder import Recorder
+        group = cats.Clowder.from_records({'name': f'cat{i}'} for i in range(5))
+        recorder = group.attach_recorder(Recorder(fields=['mood', 'energy'], stride=2))
+        group.simulate(10, seed=0)
+        series = recorder.read()
+        print(series['tick'])
+        print(series['mood'])
+
+    """
+
+    def __init__(self, fields=None, stride=1, capacity=None, spill_dir=None, spill_format='npz'):
+        fields = STATE_FIELDS if fields is None else tuple(fields)
+        for field in fields:
+            if field not in STATE_FIELDS:
+                raise ValueError(f"Invalid field '{field}'. Valid options: {', '.join(STATE_FIELDS)}")
+        if stride < 1:
+            raise ValueError("stride must be at least 1.")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if spill_format not in SPILL_FORMATS:
+            raise ValueError(f"Invalid spill format '{spill_format}'. Valid options: {', '.join(SPILL_FORMATS)}")
+        self.fields = fields
+        self.stride = stride
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.spill_format = spill_format
+        self.tick = 0
+        self.ids = None
+        self._store = None
+        # Finished chunks: dicts of arrays in memory, memory-mapped, or paths of .npz files
+        self._chunks = []
+        self._chunk = None
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        """Number of recorded ticks"""
+        current = 0 if self._chunk is None else len(self._chunk['tick'])
+        return sum(self._chunk_length(chunk) for chunk in self._chunks) + current
+
+    def start(self, store):
+        """
+        Starts recording a store, writing the current state as tick 0
+
+        Called by pyCatSim.Clowder.attach_recorder.
+
+        Parameters
+        ----------
+        store : pyCatSim.utils.store.CatStore
+            The storage of the Clowder.
+
+        Raises
+        ------
+        ValueError
+            If the recorder already recorded another Clowder.
+
+        """
+        if self._store is not None:
+            raise ValueError("This recorder is already attached to a Clowder.")
+        self._store = store
+        self.ids = np.sort(store.column('id'))
+        self._column_of_id = np.full(store._next_id, -1, dtype=np.int64)
+        self._column_of_id[self.ids] = np.arange(len(self.ids))
+        # Values of every cat at the last recorded tick
+        self._last = {field: np.zeros(len(self.ids), dtype=np.int64) for field in self.fields}
+        # Whether _last is also the keyframe of the current chunk (copied before changing it)
+        self._last_shared = False
+        self._marked = []
+        self._all_marked = True
+        self._write()
+
+    def mark(self, cat_ids=None):
+        """
+        Records that some cats changed since the last recorded tick
+
+        Called by the storage of the Clowder whenever the state of cats changes.
+
+        Parameters
+        ----------
+        cat_ids : array-like of int, optional
+            The IDs of the cats. Default is None (every cat).
+
+        """
+        if self._all_marked:
+            return
+        if cat_ids is None:
+            self._all_marked = True
+            self._marked = []
+        else:
+            self._marked.append(np.atleast_1d(cat_ids))
+
+    def advance(self, n=1):
+        """
+        Moves the recorder forward by n ticks, recording every stride-th tick
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of ticks. Default is 1.
+
+        """
+        for _ in range(n):
+            self.tick += 1
+            if self.tick % self.stride == 0:
+                self._write()
+
+    def _write(self):
+        """Records the state of the marked cats at the current tick"""
+        store = self._store
+        if self._all_marked:
+            # every cat may have changed: read them all into a new keyframe
+            rows = store._row_of_id[self.ids]
+            present = rows >= 0
+            if present.all():
+                self._last = {field: store._data[field][rows] for field in self.fields}
+            else:
+                # removed cats keep their last values
+                rows = np.maximum(rows, 0)
+                self._last = {field: np.where(present, store._data[field][rows], self._last[field])
+                              for field in self.fields}
+            self._start_chunk()
+        else:
+            # read only the cats that changed (a cat marked twice is simply read twice)
+            ids = np.concatenate(self._marked) if self._marked else np.zeros(0, dtype=np.int64)
+            ids = ids[ids < len(self._column_of_id)]
+            cols = self._column_of_id[ids]
+            rows = store._row_of_id[ids]
+            keep = (cols >= 0) & (rows >= 0)
+            cols, rows = cols[keep], rows[keep]
+            if self._last_shared:
+                self._last = {field: values.copy() for field, values in self._last.items()}
+                self._last_shared = False
+            values = {field: store._data[field][rows] for field in self.fields}
+            for field in self.fields:
+                self._last[field][cols] = values[field]
+            chunk = self._chunk
+            if (chunk is None or len(chunk['tick']) == self.capacity
+                    or chunk['n_changes'] + len(cols) > len(self.ids)):
+                self._start_chunk()
+            else:
+                chunk['tick'].append(self.tick)
+                chunk['col'].append(cols)
+                for field in self.fields:
+                    chunk[field].append(values[field])
+                chunk['n_changes'] += len(cols)
+        self._marked = []
+        self._all_marked = False
+
+    def _start_chunk(self):
+        """Finishes the current chunk and starts one with the current state as keyframe"""
+        self._finish()
+        self._chunk = {'tick': [self.tick], 'col': [], 'n_changes': 0,
+                       'keyframe': self._last}
+        self._chunk.update({field: [] for field in self.fields})
+        self._last_shared = True
+
+    def _finish(self):
+        """Packs the current chunk into arrays and keeps them in memory, in .npz or in .npy files"""
+        chunk, self._chunk = self._chunk, None
+        if chunk is None:
+            return
+        counts = [len(cols) for cols in chunk['col']]
+        empty = np.zeros(0, dtype=np.int64)
+        packed = {'tick': np.array(chunk['tick'], dtype=np.int64),
+                  # changes of the i-th tick after the keyframe: offsets[i] to offsets[i + 1]
+                  'offsets': np.concatenate([[0], np.cumsum(counts, dtype=np.int64)]),
+                  'col': np.concatenate(chunk['col'] or [empty])}
+        for field in self.fields:
+            packed[f'{field}_keyframe'] = chunk['keyframe'][field]
+            packed[field] = np.concatenate(chunk[field] or [empty])
+        name = os.path.join(self.spill_dir or '', f"recorder_{len(self._chunks):06d}")
+        if self.spill_dir is not None and self.spill_format == 'npz':
+            np.savez_compressed(name + '.npz', **packed)
+            packed = name + '.npz'
+        elif self.spill_dir is not None:
+            for key, values in packed.items():
+                np.save(f"{name}_{key}.npy", values)
+            packed = {key: np.load(f"{name}_{key}.npy", mmap_mode='r') for key in packed}
+        self._chunks.append(packed)
+
+    def flush(self):
+        """
+        Completes the current chunk, even if it is not full
+
+        The next recorded tick starts a new chunk. With a spill directory,
+        this writes everything recorded so far to disk.
+
+        """
+        self._finish()
+
+    @staticmethod
+    def _chunk_length(chunk):
+        if isinstance(chunk, str):
+            with np.load(chunk) as data:
+                return len(data['tick'])
+        return len(chunk['tick'])
+
+    def _expand(self, packed):
+        """Rebuilds the full rows of a packed chunk"""
+        ticks = packed['tick']
+        offsets = packed['offsets']
+        cols = packed['col']
+        chunk = {'tick': np.asarray(ticks)}
+        for field in self.fields:
+            values = packed[field]
+            rows = np.empty((len(ticks), len(self.ids)), dtype=np.int64)
+            rows[0] = packed[f'{field}_keyframe']
+            for i in range(1, len(ticks)):
+                rows[i] = rows[i - 1]
+                rows[i, cols[offsets[i - 1]:offsets[i]]] = values[offsets[i - 1]:offsets[i]]
+            chunk[field] = rows
+        return chunk
+
+    def chunks(self):
+        """
+        Iterates over the recorded chunks, oldest first
+
+        Completes the current chunk first (see flush). Chunks written to
+        .npz files are loaded one at a time.
+
+        Yields
+        ------
+        dict
+            Maps 'tick' to the recorded ticks of the chunk and each recorded
+            field to an array of shape (ticks, cats).
+
+        """
+        self.flush()
+        for packed in self._chunks:
+            if isinstance(packed, str):
+                with np.load(packed) as data:
+                    yield self._expand({key: data[key] for key in data.files})
+            else:
+                yield self._expand(packed)
+
+    def read(self, fields=None):
+        """
+        Returns the whole recording
+
+        Parameters
+        ----------
+        fields : list of str, optional
+            The fields to return. Default is None (all recorded fields).
+
+        Returns
+        -------
+        dict
+            Maps 'tick' to the recorded ticks, 'id' to the ID of the cat of
+            each column and each field to an array of shape (ticks, cats).
+
+        """
+        fields = self.fields if fields is None else fields
+        parts = list(self.chunks())
+        n = 0 if self.ids is None else len(self.ids)
+        result = {'tick': np.concatenate([part['tick'] for part in parts] or [np.zeros(0, dtype=np.int64)]),
+                  'id': self.ids}
+        for field in fields:
+            result[field] = np.concatenate([np.asarray(part[field]) for part in parts]
+                                           or [np.zeros((0, n), dtype=np.int64)])
+        return result
+
+    def export(self, path):
+        """
+        Writes the whole recording to one .npz file
+
+        Parameters
+        ----------
+        path : str or path-like
+            The file to write, with the arrays returned by read.
+
+        """
+        np.savez(path, **self.read())
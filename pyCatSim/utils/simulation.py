@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module runs time forward for a Clowder.
+
+At every tick, a policy chooses one action per cat (as integer codes into
+ACTIONS) and the whole Clowder is updated with batched array operations.
+"""
+
+__all__ = ['simulate',
+           'SimulationResult',
+           'random_policy',
+           'weighted_policy',
+           'constant_policy',
+           'needs_policy']
+
+import time
+from functools import partial
+
+import numpy as np
+
+from .store import ACTIONS, STATE_FIELDS
+from .behavior import draw_actions
+
+
+def random_policy(weights=None):
+    """
+    Policy where each cat picks a random action at every tick
+
+    Parameters
+    ----------
+    weights : dict, optional
+        Relative weight of each action name (see ACTIONS). Actions left out
+        are never picked. Default is None (all actions equally likely).
+
+    Raises
+    ------
+    ValueError
+        If an action name is not valid.
+
+    Returns
+    -------
+    callable
+        The policy, to pass to simulate. Built-in policies can be pickled.
+
+    """
+    if weights is None:
+        p = np.full(len(ACTIONS), 1 / len(ACTIONS))
+    else:
+        p = np.zeros(len(ACTIONS))
+        for action, weight in weights.items():
+            p[_action_code(action)] = weight
+        p = p / p.sum()
+    return partial(_random_actions, p=p)
+
+
+def _random_actions(clowder, tick, rng, p):
+    return rng.choice(len(ACTIONS), size=len(clowder.mood), p=p).astype(np.int8)
+
+
+def weighted_policy(weights=None):
+    """
+    Policy where each cat picks a random action with its own weights
+
+    Unlike random_policy, the weights can differ between cats and change
+    with their state at every tick.
+
+    Parameters
+    ----------
+    weights : dict, array-like or callable, optional
+        Relative weight of each action, see pyCatSim.utils.behavior.draw_actions.
+        Default is None (pyCatSim.utils.behavior.action_weights: hungry cats
+        eat more, tired cats sleep more and rested cats play more).
+
+    Returns
+    -------
+    callable
+        The policy, to pass to simulate.
+
+    """
+    return partial(_weighted_actions, weights=weights)
+
+
+def _weighted_actions(clowder, tick, rng, weights):
+    return draw_actions(clowder, weights, rng)
+
+
+def constant_policy(action):
+    """
+    Policy where every cat takes the same action at every tick
+
+    Parameters
+    ----------
+    action : str
+        The action name (see ACTIONS).
+
+    Raises
+    ------
+    ValueError
+        If the action name is not valid.
+
+    Returns
+    -------
+    callable
+        The policy, to pass to simulate. Built-in policies can be pickled.
+
+    """
+    return partial(_constant_actions, code=_action_code(action))
+
+
+def _constant_actions(clowder, tick, rng, code):
+    return np.full(len(clowder.mood), code, dtype=np.int8)
+
+
+def needs_policy(hunger_threshold=3, energy_threshold=-3, mood_threshold=-3):
+    """
+    Policy where each cat attends to its most pressing need
+
+    Hungry cats eat, then tired cats sleep, then grumpy cats get groomed and
+    all the other cats play.
+
+    Parameters
+    ----------
+    hunger_threshold : int, optional
+        Cats with a hunger level at or above this value eat. Default is 3.
+    energy_threshold : int, optional
+        Cats with an energy level at or below this value sleep. Default is -3.
+    mood_threshold : int, optional
+        Cats with a mood at or below this value get groomed. Default is -3.
+
+    Returns
+    -------
+    callable
+        The policy, to pass to simulate. Built-in policies can be pickled.
+
+    """
+    return partial(_needs_actions, hunger_threshold=hunger_threshold,
+                   energy_threshold=energy_threshold, mood_threshold=mood_threshold)
+
+
+def _needs_actions(clowder, tick, rng, hunger_threshold, energy_threshold, mood_threshold):
+    eat, sleep, groom, play = (ACTIONS.index(action) for action in ('eat', 'sleep', 'groom', 'play'))
+    return np.select(
+        [clowder.hunger_level >= hunger_threshold,
+         clowder.energy <= energy_threshold,
+         clowder.mood <= mood_threshold],
+        [eat, sleep, groom], default=play).astype(np.int8)
+
+
+def _action_code(action):
+    try:
+        return ACTIONS.index(action)
+    except ValueError:
+        raise ValueError(f"Invalid action '{action}'. Valid options: {', '.join(ACTIONS)}")
+
+
+class SimulationResult:
+    """
+    Outcome of a simulation run
+
+    Attributes
+    ----------
+    n_steps : int
+        Number of ticks simulated.
+    n_cats : int
+        Number of cats in the Clowder.
+    elapsed : float
+        Wall-clock time of the run, in seconds.
+    throughput : float
+        Cat-ticks simulated per second.
+    stats : dict or None
+        If recorded, maps each state attribute to a dict of 'mean', 'min' and
+        'max' arrays (one value per tick), and 'actions' to an array of shape
+        (n_steps, len(ACTIONS)) counting how many cats took each action.
+
+    """
+
+    def __init__(self, n_steps, n_cats, elapsed, stats=None):
+        self.n_steps = n_steps
+        self.n_cats = n_cats
+        self.elapsed = elapsed
+        self.throughput = n_steps * n_cats / elapsed if elapsed > 0 else float('inf')
+        self.stats = stats
+
+    def __repr__(self):
+        return (f"SimulationResult(n_steps={self.n_steps}, n_cats={self.n_cats}, "
+                f"throughput={self.throughput:.3g} cat-ticks/s)")
+
+
+def simulate(clowder, n_steps, policy=None, sleep_duration=8, seed=None, record_stats=False):
+    """
+    Advances a Clowder by a number of ticks
+
+    Parameters
+    ----------
+    clowder : pyCatSim.Clowder
+        The Clowder to simulate, or a view of one. Its cats are updated in place.
+    n_steps : int
+        Number of ticks to simulate.
+    policy : callable, optional
+        Called as policy(clowder, tick, rng) at every tick; returns one action
+        code (index in ACTIONS) per cat, or a single code for all cats.
+        Default is random_policy().
+    sleep_duration : int or float, optional
+        Hours slept by a cat whose action is 'sleep', between 0 and 16. Default is 8.
+    seed : int or numpy.random.Generator, optional
+        Seed of the random number generator passed to the policy. Default is None.
+    record_stats : bool, optional
+        Whether to record summary statistics at every tick. Default is False.
+
+    Raises
+    ------
+    TypeError
+        If sleep_duration is not an integer or float.
+    ValueError
+        If n_steps is negative, sleep_duration is outside 0 to 16 hours, or the
+        policy returns an invalid action code or a number of codes other than
+        one per cat.
+
+    Returns
+    -------
+    SimulationResult
+        Timing and, optionally, per-tick statistics of the run.
+
+    Examples
+    --------
+
+    .. jupyter-execute::
+
+        import pyCatSim as cats
+        from pyCatSim.utils.simulation import simulate, needs_policy
+        group = cats.Clowder.from_records({'name': f'cat{i}'} for i in range(1000))
+        result = simulate(group, 100, policy=needs_policy(), seed=42)
+        print(result)
+
+    """
+    if n_steps < 0:
+        raise ValueError("n_steps must be non-negative.")
+    if type(sleep_duration) not in (int, float):
+        raise TypeError("sleep_duration must be an integer or float")
+    if not 0 <= sleep_duration <= 16:
+        raise ValueError("Cats sleep between 0 and 16 hours. sleep_duration must be between 0 and 16.")
+    if policy is None:
+        policy = random_policy()
+    rng = np.random.default_rng(seed)
+    store = clowder._store
+    # a view of a Clowder only acts on its own cats
+    rows = clowder._rows()
+    n_cats = len(clowder)
+
+    stats = None
+    if record_stats:
+        stats = {field: {stat: np.zeros(n_steps) for stat in ('mean', 'min', 'max')}
+                 for field in STATE_FIELDS}
+        stats['actions'] = np.zeros((n_steps, len(ACTIONS)), dtype=np.int64)
+
+    start = time.perf_counter()
+    for tick in range(n_steps):
+        codes = np.asarray(policy(clowder, tick, rng))
+        if codes.ndim == 0:
+            codes = np.full(n_cats, codes, dtype=np.int8)
+        elif codes.shape != (n_cats,):
+            raise ValueError(f"Policy returned {codes.size} action codes at tick {tick}, "
+                             f"expected one per cat ({n_cats}).")
+        if n_cats and (codes.min() < 0 or codes.max() >= len(ACTIONS)):
+            raise ValueError(f"Policy returned an invalid action code at tick {tick}.")
+        store.apply_actions(codes, sleep_duration, rows=rows)
+        if store.journal is not None:
+            store.journal.advance()
+        if store.recorder is not None:
+            store.recorder.advance()
+        if record_stats and n_cats:
+            for field in STATE_FIELDS:
+                values = getattr(clowder, field)
+                stats[field]['mean'][tick] = values.mean()
+                stats[field]['min'][tick] = values.min()
+                stats[field]['max'][tick] = values.max()
+            stats['actions'][tick] = np.bincount(codes, minlength=len(ACTIONS))
+    elapsed = time.perf_counter() - start
+
+    return SimulationResult(n_steps, n_cats, elapsed, stats)
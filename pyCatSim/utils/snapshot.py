@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This module saves the state of a Clowder to a compact binary file.
+
+A snapshot is a single file: a short header (magic bytes, then a JSON
+description of the columns), followed by the numeric columns of the
+columnar store as fixed-width arrays, the colors as int8 codes and the names
+as a string table (UTF-8 bytes plus offsets). Every block is aligned on 64
+bytes, so that the columns can be memory-mapped on load instead of read.
+"""
+
+__all__ = ['save_snapshot',
+           'load_snapshot',
+           'StringTable']
+
+import json
+import struct
+from collections.abc import MutableSequence
+
+import numpy as np
+
+from .colors import COLORS
+from .store import CatStore
+
+MAGIC = b'PYCATSIM'
+VERSION = 1
+_ALIGN = 64
+# magic, version, length of the JSON header
+_PREFIX = struct.Struct('<8sIQ')
+
+
+class StringTable(MutableSequence):
+    """
+    Read-mostly sequence of strings stored as UTF-8 bytes plus offsets
+
+    Strings are decoded when accessed, so opening a snapshot does not decode
+    every name. The table turns into a plain list the first time it is
+    modified.
+
+    Parameters
+    ----------
+    data : numpy.ndarray of uint8
+        The UTF-8 bytes of all the strings, back to back.
+    offsets : numpy.ndarray of int64
+        Where each string starts in data, followed by the end of the last one.
+
+    """
+
+    def __init__(self, data, offsets):
+        self._bytes = data
+        self._offsets = offsets
+        self._list = None
+
+    @classmethod
+    def encode(cls, strings):
+        """
+        Builds a table from strings
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to store.
+
+        Raises
+        ------
+        TypeError
+            If one of the values is not a str.
+
+        Returns
+        -------
+        StringTable
+
+        """
+        encoded = []
+        for string in strings:
+            if not isinstance(string, str):
+                raise TypeError(f"Names must be str to be saved, got {type(string).__name__}.")
+            encoded.append(string.encode('utf-8'))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return cls(data, offsets)
+
+    def _decode(self, i):
+        return bytes(self._bytes[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+
+    def _materialize(self):
+        if self._list is None:
+            self._list = [self._decode(i) for i in range(len(self._offsets) - 1)]
+        return self._list
+
+    def __len__(self):
+        if self._list is not None:
+            return len(self._list)
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if self._list is not None:
+            return self._list[i]
+        if isinstance(i, slice):
+            return [self._decode(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("StringTable index out of range")
+        return self._decode(i)
+
+    def __iter__(self):
+        if self._list is not None:
+            return iter(self._list)
+        return (self._decode(i) for i in range(len(self)))
+
+    def __setitem__(self, i, value):
+        self._materialize()[i] = value
+
+    def __delitem__(self, i):
+        del self._materialize()[i]
+
+    def insert(self, i, value):
+        self._materialize().insert(i, value)
+
+    def extend(self, values):
+        self._materialize().extend(values)
+
+
+def _layout(blocks, start):
+    """Gives each block an offset, aligned on _ALIGN bytes, after start"""
+    offsets = {}
+    position = start
+    for name, array in blocks.items():
+        position = -(-position // _ALIGN) * _ALIGN
+        offsets[name] = position
+        position += array.nbytes
+    return offsets
+
+
+def save_snapshot(store, path):
+    """
+    Writes a CatStore to a snapshot file
+
+    Parameters
+    ----------
+    store : pyCatSim.utils.store.CatStore
+        The store to save.
+    path : str or path-like
+        The file to write.
+
+    Raises
+    ------
+    TypeError
+        If a name is not a str.
+
+    """
+    names = store.names if isinstance(store.names, StringTable) and store.names._list is None \
+        else StringTable.encode(store.names)
+    blocks = {field: store.column(field) for field in store._data}
+    blocks['row_of_id'] = store._row_of_id[:store._next_id]
+    blocks['name_bytes'] = names._bytes
+    blocks['name_offsets'] = names._offsets
+
+    # The header holds the offsets of the blocks, so its length must be known first
+    columns = {name: {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': 0}
+               for name, array in blocks.items()}
+    header = {'size': store.size, 'next_id': store._next_id, 'colors': list(COLORS), 'columns': columns}
+    length = len(json.dumps(header)) + 20 * len(blocks)
+    for name, offset in _layout(blocks, _PREFIX.size + length).items():
+        columns[name]['offset'] = offset
+    encoded = json.dumps(header).encode('utf-8').ljust(length)
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, length))
+        f.write(encoded)
+        for name, array in blocks.items():
+            f.seek(columns[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Reads a CatStore from a snapshot file
+
+    Parameters
+    ----------
+    path : str or path-like
+        The file to read.
+    mmap : bool, optional
+        If True, the columns are mapped from the file rather than read, and
+        only the pages that are used get loaded. Changes made to the loaded
+        cats stay in memory and are never written back to the file. Default is True.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a pyCatSim snapshot, or was written by a newer version.
+
+    Returns
+    -------
+    pyCatSim.utils.store.CatStore
+        The loaded store.
+
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path} is not a pyCatSim snapshot.")
+        magic, version, length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pyCatSim snapshot.")
+        if version > VERSION:
+            raise ValueError(f"{path} was written by a newer version of pyCatSim (format {version}).")
+        header = json.loads(f.read(length).decode('utf-8'))
+
+        blocks = {}
+        for name, spec in header['columns'].items():
+            dtype = np.dtype(spec['dtype'])
+            shape = tuple(spec['shape'])
+            if mmap and np.prod(shape) > 0:
+                # Copy-on-write: the cats can change without touching the file
+                blocks[name] = np.memmap(path, dtype=dtype, mode='c', offset=spec['offset'], shape=shape)
+            else:
+                f.seek(spec['offset'])
+                blocks[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+    colors = tuple(header['colors'])
+    if colors != COLORS:
+        # Codes were written against another color table
+        remap = np.array([COLORS.index(color) if color in COLORS else -1 for color in colors] + [-1],
+                         dtype=np.int8)
+        blocks['color'] = remap[blocks['color']]
+
+    store = CatStore()
+    size = header['size']
+    for name in store._data:
+        store._data[name] = blocks[name]
+    store.size = size
+    store._capacity = size
+    store.names = StringTable(blocks['name_bytes'], blocks['name_offsets'])
+    store.cats = [None] * size
+    store._row_of_id = blocks['row_of_id']
+    store._next_id = header['next_id']
+    return store
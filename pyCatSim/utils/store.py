@@ -0,0 +1,929 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar storage for groups of cats.
+
+The state of every cat in a Clowder lives in contiguous NumPy arrays (one
+array per attribute) so that actions can be applied to the whole group in a
+single vectorized pass instead of one method call per cat.
+"""
+
+__all__ = ['CatStore', 'Aggregates', 'ACTIONS', 'EVENTS']
+
+import math
+from operator import attrgetter
+
+import numpy as np
+
+from .colors import COLORS
+from .index import SortedIndex, OPERATORS
+
+# Integer state attributes shared by Cat and CatStore
+STATE_FIELDS = ('mood', 'hunger_level', 'energy', 'health')
+
+# Actions a cat can take, in the order used for their integer codes
+ACTIONS = ('idle', 'play', 'bathe', 'groom', 'eat', 'sleep')
+EAT = ACTIONS.index('eat')
+SLEEP = ACTIONS.index('sleep')
+
+# Everything that can change the state of a cat: the actions, care given by
+# an Owner, and attributes set directly. Codes index this tuple.
+EVENTS = ACTIONS + ('feed', 'owner_groom', 'set')
+FEED = EVENTS.index('feed')
+OWNER_GROOM = EVENTS.index('owner_groom')
+SET = EVENTS.index('set')
+
+# Effect of each action on (mood, hunger_level, energy, health), with the
+# default play boosts. Eating also floors hunger at 0 and the energy gained
+# from sleep depends on the duration, see CatStore.apply_actions.
+ACTION_DELTAS = np.array([
+    [0, 0, 0, 0],    # idle
+    [1, 1, -1, 0],   # play
+    [-1, 0, 0, 1],   # bathe
+    [1, 0, 0, 1],    # groom
+    [1, -1, 0, 0],   # eat
+    [0, 0, 0, 0],    # sleep
+], dtype=np.int64)
+
+# Comparisons used by CatStore.rows_where, see pyCatSim.utils.index.OPERATORS
+_COMPARE = {'lt': np.less, 'le': np.less_equal, 'gt': np.greater,
+            'ge': np.greater_equal, 'eq': np.equal}
+
+# Value of unused rows, for the columns that do not default to 0
+_FILL = {'age': np.nan, 'color': -1}
+
+
+def _color_code(color):
+    """Index of a color in COLORS, -1 for None"""
+    if color is None:
+        return -1
+    if color not in COLORS:
+        raise ValueError(f"Invalid color '{color}'. Valid options: {', '.join(COLORS)}")
+    return COLORS.index(color)
+
+
+def _state_value(field, value):
+    """Checks that a state attribute is an integer, as its column stores integers"""
+    try:
+        integer = int(value)
+    except (TypeError, ValueError):
+        raise TypeError(f"{field} must be an integer, got {value!r}.")
+    if integer != value:
+        raise ValueError(f"{field} must be an integer, got {value!r}.")
+    return integer
+
+
+def _color_counts(codes):
+    """Number of cats of each color, with the unknown colors (-1) counted last"""
+    codes = np.asarray(codes)
+    return np.bincount(np.where(codes < 0, len(COLORS), codes), minlength=len(COLORS) + 1)
+
+
+class Aggregates:
+    """
+    Running statistics of the cats in a CatStore.
+
+    The count, the sum and sum of squares of each state attribute, and the
+    number of cats of each color are updated with every change to the store,
+    so reading them takes constant time. Minimum and maximum are updated too
+    when possible; a change that may lower a maximum (or raise a minimum)
+    marks it stale and it is recomputed on the next read.
+
+    Parameters
+    ----------
+    store : CatStore
+        The store to summarize. The statistics are computed once from its
+        current content.
+
+    Attributes
+    ----------
+    count : int
+        Number of cats.
+    sum, sumsq : dict
+        Sum and sum of squares of each state attribute, as exact Python ints.
+    colors : numpy.ndarray
+        Number of cats of each color, in the order of COLORS, followed by the
+        number of cats with no color.
+
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self.count = store.size
+        self.sum = {}
+        self.sumsq = {}
+        self._min = {}
+        self._max = {}
+        self._stale = set(STATE_FIELDS)
+        for field in STATE_FIELDS:
+            values = store.column(field)
+            self.sum[field] = int(values.sum())
+            self.sumsq[field] = int(np.dot(values, values))
+        self.colors = _color_counts(store.column('color'))
+
+    def minimum(self, field):
+        """Smallest value of a state attribute, or None if there are no cats"""
+        if not self.count:
+            return None
+        self._refresh(field)
+        return self._min[field]
+
+    def maximum(self, field):
+        """Largest value of a state attribute, or None if there are no cats"""
+        if not self.count:
+            return None
+        self._refresh(field)
+        return self._max[field]
+
+    def _refresh(self, field):
+        if field in self._stale:
+            values = self._store.column(field)
+            self._min[field] = int(values.min()) if values.size else None
+            self._max[field] = int(values.max()) if values.size else None
+            self._stale.discard(field)
+
+    def shift(self, field, delta):
+        """Records that delta was added to the field of every cat"""
+        self.sumsq[field] += 2 * delta * self.sum[field] + self.count * delta * delta
+        self.sum[field] += self.count * delta
+        if field not in self._stale and self.count:
+            self._min[field] += delta
+            self._max[field] += delta
+
+    def change(self, field, old, new):
+        """Records that some values of a field went from old to new (same shape)"""
+        old = np.asarray(old, dtype=np.int64)
+        new = np.asarray(new, dtype=np.int64)
+        if not new.size:
+            return
+        self.sum[field] += int(new.sum()) - int(old.sum())
+        self.sumsq[field] += int(np.vdot(new, new)) - int(np.vdot(old, old))
+        if field not in self._stale:
+            high, low = int(new.max()), int(new.min())
+            if high >= self._max[field]:
+                self._max[field] = high
+            elif (old == self._max[field]).any():
+                self._stale.add(field)
+            if low <= self._min[field]:
+                self._min[field] = low
+            elif (old == self._min[field]).any():
+                self._stale.add(field)
+
+    def add_deltas(self, field, old, deltas):
+        """Records that deltas (one per cat) are about to be added to old values"""
+        old = np.asarray(old, dtype=np.int64)
+        self.sum[field] += int(deltas.sum())
+        self.sumsq[field] += 2 * int(np.vdot(old, deltas)) + int(np.vdot(deltas, deltas))
+        self._stale.add(field)
+
+    def add_rows(self, rows):
+        """Records new cats, stored in rows (a slice)"""
+        n = rows.stop - rows.start
+        if not n:
+            return
+        self.count += n
+        for field in STATE_FIELDS:
+            values = self._store._data[field][rows]
+            self.sum[field] += int(values.sum())
+            self.sumsq[field] += int(np.dot(values, values))
+            if field not in self._stale:
+                if self.count == n or self._min.get(field) is None:
+                    self._min[field], self._max[field] = int(values.min()), int(values.max())
+                else:
+                    self._min[field] = min(self._min[field], int(values.min()))
+                    self._max[field] = max(self._max[field], int(values.max()))
+        self.colors += _color_counts(self._store._data['color'][rows])
+
+    def remove_row(self, row):
+        """Records that the cat in a row is about to be removed"""
+        self.count -= 1
+        for field in STATE_FIELDS:
+            value = int(self._store._data[field][row])
+            self.sum[field] -= value
+            self.sumsq[field] -= value * value
+            if field not in self._stale and value in (self._min[field], self._max[field]):
+                self._stale.add(field)
+        self.recolor(self._store._data['color'][row], None)
+
+    def recolor(self, old, new):
+        """Records a change of color code (None when a cat is added or removed)"""
+        for code, step in ((old, -1), (new, 1)):
+            if code is not None:
+                self.colors[len(COLORS) if code < 0 else code] += step
+
+    def verify(self):
+        """
+        Recomputes the statistics from scratch and compares them
+
+        Raises
+        ------
+        AssertionError
+            If a running statistic differs from the recomputed one.
+
+        """
+        fresh = Aggregates(self._store)
+        problems = []
+        if fresh.count != self.count:
+            problems.append(f"count: {self.count} != {fresh.count}")
+        for field in STATE_FIELDS:
+            for name, ours, theirs in (('sum', self.sum[field], fresh.sum[field]),
+                                       ('sumsq', self.sumsq[field], fresh.sumsq[field]),
+                                       ('min', self.minimum(field), fresh.minimum(field)),
+                                       ('max', self.maximum(field), fresh.maximum(field))):
+                if ours != theirs:
+                    problems.append(f"{name} of {field}: {ours} != {theirs}")
+        if not np.array_equal(fresh.colors, self.colors):
+            problems.append(f"colors: {self.colors.tolist()} != {fresh.colors.tolist()}")
+        if problems:
+            raise AssertionError("Running statistics out of sync: " + "; ".join(problems))
+
+
+class CatStore:
+    """
+    Struct-of-arrays storage for the state of a group of cats.
+
+    Each row holds one cat. Numeric attributes are stored in NumPy arrays,
+    names in a list of str and colors as integer codes into COLORS (-1 when
+    the color is unknown). A missing age is stored as NaN.
+
+    Every cat also gets an integer ID, unique within the store and increasing
+    in insertion order. Rows are looked up from IDs through a dense array and
+    from names through a dictionary built on first use, so adding, removing
+    and finding a cat take constant time. Removing a cat moves the last row
+    into the freed one.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of rows to preallocate. Default is 0.
+
+    Attributes
+    ----------
+    size : int
+        Number of cats currently stored.
+    journal : pyCatSim.utils.journal.Journal or None
+        If set, every change to the state of a cat is recorded in it.
+    names : list of str
+        The name of the cat in each row.
+    cats : list
+        The Cat object bound to each row, or None for rows created in bulk
+        whose Cat view has not been requested yet.
+
+    """
+
+    def __init__(self, capacity=0):
+        self.size = 0
+        self._capacity = capacity
+        self._data = {field: np.zeros(capacity, dtype=np.int64) for field in STATE_FIELDS}
+        self._data['age'] = np.full(capacity, np.nan)
+        self._data['color'] = np.full(capacity, -1, dtype=np.int8)
+        self._data['id'] = np.zeros(capacity, dtype=np.int64)
+        self.names = []
+        self.cats = []
+        # Row of each ID ever assigned (-1 once removed)
+        self._row_of_id = np.zeros(capacity, dtype=np.int64)
+        self._next_id = 0
+        # Name -> set of IDs, built on first lookup by name
+        self._name_index = None
+        self.journal = None
+        # Told which cats change, when recording time series (see pyCatSim.utils.recorder)
+        self.recorder = None
+        # Running statistics, created on first use (see aggregate)
+        self.aggregates = None
+        # Field -> SortedIndex, built on first query (see rows_where)
+        self._indexes = {}
+        # Incremented whenever cats change rows, so that views know to look their rows up again
+        self.layout = 0
+
+    def column(self, field):
+        """
+        Returns the live values of a numeric attribute
+
+        Parameters
+        ----------
+        field : str
+            One of 'id', 'age', 'color', 'mood', 'hunger_level', 'energy' or 'health'.
+
+        Returns
+        -------
+        numpy.ndarray
+            A view on the first `size` rows of the column.
+
+        """
+        return self._data[field][:self.size]
+
+    def aggregate(self):
+        """
+        Returns the running statistics of the store
+
+        The statistics are computed from scratch on the first call, then kept
+        up to date by every change to the store.
+
+        Returns
+        -------
+        Aggregates
+
+        """
+        if self.aggregates is None:
+            self.aggregates = Aggregates(self)
+        return self.aggregates
+
+    def _reserve(self, n):
+        """Makes sure there is room for n more rows, doubling the capacity as needed."""
+        needed = self.size + n
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, 16)
+        for field, values in self._data.items():
+            grown = np.full(capacity, _FILL.get(field, 0), dtype=values.dtype)
+            grown[:self.size] = values[:self.size]
+            self._data[field] = grown
+        self._capacity = capacity
+
+    def _assign_ids(self, start, n):
+        """Gives fresh IDs to rows start to start + n"""
+        ids = np.arange(self._next_id, self._next_id + n)
+        self._next_id += n
+        if self._next_id > len(self._row_of_id):
+            grown = np.full(max(self._next_id, 2 * len(self._row_of_id)), -1, dtype=np.int64)
+            grown[:len(self._row_of_id)] = self._row_of_id
+            self._row_of_id = grown
+        self._data['id'][start:start + n] = ids
+        self._row_of_id[ids] = np.arange(start, start + n)
+        if self._name_index is not None:
+            for cat_id, name in zip(ids.tolist(), self.names[start:start + n]):
+                self._name_index.setdefault(name, set()).add(cat_id)
+
+    def bind(self, cat):
+        """
+        Moves the state of a Cat into a new row and turns the Cat into a view on that row.
+
+        Parameters
+        ----------
+        cat : pyCatSim.Cat
+            The Cat to store.
+
+        Raises
+        ------
+        ValueError
+            If the Cat already belongs to a Clowder, its color is not one of
+            COLORS or one of its state attributes is not a whole number.
+        TypeError
+            If one of its state attributes is not a number.
+
+        Returns
+        -------
+        int
+            The row holding the cat.
+
+        """
+        if cat._store is not None:
+            raise ValueError(f"Cat '{cat.name}' already belongs to a Clowder.")
+        # checked before anything changes, so that a failure leaves the store as it was
+        state = {field: _state_value(field, getattr(cat, field)) for field in STATE_FIELDS}
+        color = _color_code(cat.color)
+        self._reserve(1)
+        row = self.size
+        for field, value in state.items():
+            self._data[field][row] = value
+        self._data['age'][row] = np.nan if cat.age is None else cat.age
+        self._data['color'][row] = color
+        self.names.append(cat.name)
+        self.cats.append(cat)
+        self.size += 1
+        self._assign_ids(row, 1)
+        if self.aggregates is not None:
+            self.aggregates.add_rows(slice(row, row + 1))
+        self._touch(STATE_FIELDS, row)
+        cat._store = self
+        cat._row = row
+        return row
+
+    def bind_many(self, cats):
+        """
+        Binds many Cats at once, as bind does for one
+
+        The state of all the cats is gathered into columns and appended in
+        one pass (see extend).
+
+        Parameters
+        ----------
+        cats : list of pyCatSim.Cat
+            The Cats to store.
+
+        Raises
+        ------
+        ValueError
+            If a Cat already belongs to a Clowder or appears twice, its color
+            is not one of COLORS or one of its state attributes is not a
+            whole number.
+        TypeError
+            If one of its state attributes is not a number.
+
+        Returns
+        -------
+        slice
+            The rows holding the cats.
+
+        """
+        # The cats are standalone, so their state is in their private attributes
+        fields = ('_store', '_name', '_age', '_color') + tuple('_' + field for field in STATE_FIELDS)
+        state = list(zip(*map(attrgetter(*fields), cats))) or [()] * len(fields)
+        stores, names, ages, colors = state[:4]
+        for cat, store in zip(cats, stores):
+            if store is not None:
+                raise ValueError(f"Cat '{cat.name}' already belongs to a Clowder.")
+        if len(set(map(id, cats))) != len(cats):
+            raise ValueError("A Cat cannot be added twice to a Clowder.")
+        columns = {}
+        for field, values in zip(STATE_FIELDS, state[4:]):
+            column = np.array(values)
+            if column.dtype.kind not in 'iub':
+                column = np.array([_state_value(field, value) for value in values], dtype=np.int64)
+            columns[field] = column
+        columns['age'] = np.array([np.nan if age is None else age for age in ages], dtype=float)
+        codes = {color: code for code, color in enumerate(COLORS)}
+        codes[None] = -1
+        try:
+            columns['color'] = np.array([codes[color] for color in colors], dtype=np.int8)
+        except (KeyError, TypeError):
+            for color in colors:
+                _color_code(color)
+        rows = self.extend(list(names), columns)
+        self.cats[rows] = cats
+        for row, cat in enumerate(cats, rows.start):
+            cat._store = self
+            cat._row = row
+        return rows
+
+    def extend(self, names, columns):
+        """
+        Appends many rows at once without creating Cat objects.
+
+        Parameters
+        ----------
+        names : list of str
+            The names of the new cats.
+        columns : dict
+            Maps attribute names to array-like values with one entry per name.
+            Missing attributes take their default (NaN for age, no color, 0 otherwise).
+            Colors are given as integer codes into COLORS.
+
+        Returns
+        -------
+        slice
+            The rows holding the new cats.
+
+        """
+        n = len(names)
+        self._reserve(n)
+        start = self.size
+        for field, values in columns.items():
+            self._data[field][start:start + n] = values
+        self.names.extend(names)
+        self.cats.extend([None] * n)
+        self.size += n
+        self._assign_ids(start, n)
+        if self.aggregates is not None:
+            self.aggregates.add_rows(slice(start, start + n))
+        self._touch(STATE_FIELDS, slice(start, start + n))
+        return slice(start, start + n)
+
+    def take(self, rows):
+        """
+        Copies some rows into a new store
+
+        The new store keeps the IDs of the cats, and new cats added to it get
+        IDs that were never used in this store. No Cat object is created.
+
+        Parameters
+        ----------
+        rows : slice or array-like of int
+            The rows to copy, in the order of the new store.
+
+        Returns
+        -------
+        CatStore
+            The new store.
+
+        """
+        ids = self._data['id'][:self.size][rows]
+        store = CatStore(capacity=len(ids))
+        for field, values in self._data.items():
+            store._data[field][:len(ids)] = values[:self.size][rows]
+        if isinstance(rows, slice):
+            store.names = list(self.names[rows])
+        else:
+            store.names = [self.names[row] for row in np.asarray(rows).tolist()]
+        store.cats = [None] * len(ids)
+        store.size = len(ids)
+        store._next_id = self._next_id
+        store._row_of_id = np.full(self._next_id, -1, dtype=np.int64)
+        store._row_of_id[ids] = np.arange(len(ids))
+        return store
+
+    def unbind(self, row):
+        """
+        Removes a row, handing its state back to the Cat that was viewing it.
+
+        The last row is moved into the freed row, so removal takes constant
+        time but does not preserve the order of the rows (the IDs do).
+
+        Parameters
+        ----------
+        row : int
+            The row to remove.
+
+        Returns
+        -------
+        pyCatSim.Cat or None
+            The detached Cat, if one was viewing the row.
+
+        """
+        cat = self.cats[row]
+        state = {field: self.get(row, field) for field in ('name', 'age', 'color') + STATE_FIELDS}
+        cat_id = int(self._data['id'][row])
+        if self.aggregates is not None:
+            self.aggregates.remove_row(row)
+        self._touch(STATE_FIELDS, row)
+        last = self.size - 1
+        for values in self._data.values():
+            values[row] = values[last]
+        self.names[row] = self.names[last]
+        self.cats[row] = self.cats[last]
+        self.names.pop()
+        self.cats.pop()
+        self.size = last
+        self.layout += 1
+        self._row_of_id[cat_id] = -1
+        if row != last:
+            self._row_of_id[self._data['id'][row]] = row
+            if self.cats[row] is not None:
+                self.cats[row]._row = row
+        if self._name_index is not None:
+            named = self._name_index[state['name']]
+            named.discard(cat_id)
+            if not named:
+                del self._name_index[state['name']]
+        if cat is not None:
+            cat._store = None
+            cat._row = None
+            for field, value in state.items():
+                setattr(cat, '_' + field, value)
+        return cat
+
+    def row_of(self, cat_id):
+        """
+        Finds the row of a cat from its ID
+
+        Parameters
+        ----------
+        cat_id : int
+            The ID of the cat.
+
+        Returns
+        -------
+        int
+            The row, or -1 if no cat in the store has this ID.
+
+        """
+        if 0 <= cat_id < self._next_id:
+            return int(self._row_of_id[cat_id])
+        return -1
+
+    def rows_named(self, name):
+        """
+        Finds the rows of the cats with a given name
+
+        Parameters
+        ----------
+        name : str
+            The name to look up.
+
+        Returns
+        -------
+        list of int
+            The rows, in insertion order.
+
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            for cat_id, cat_name in zip(self.column('id').tolist(), self.names):
+                self._name_index.setdefault(cat_name, set()).add(cat_id)
+        return [int(self._row_of_id[cat_id]) for cat_id in sorted(self._name_index.get(name, ()))]
+
+    def _sorted_index(self, field):
+        """The index of a state attribute, built or rebuilt as needed"""
+        if field not in STATE_FIELDS:
+            raise ValueError(f"Cannot query '{field}'. Valid options: {', '.join(STATE_FIELDS)}")
+        index = self._indexes.get(field)
+        if index is None or not index.valid:
+            index = self._indexes[field] = SortedIndex(self.column(field), self.column('id'))
+        return index
+
+    def _dirty_rows(self, index):
+        """The rows of the cats still in the store whose key is out of date"""
+        ids = np.fromiter(index.dirty, dtype=np.int64, count=len(index.dirty))
+        rows = self._row_of_id[ids]
+        return rows[rows >= 0]
+
+    def rows_where(self, field, op, value):
+        """
+        Finds the cats whose state satisfies a comparison, through an index
+
+        The index of the field is built on the first query and then kept up
+        to date, so a query costs about the size of its result.
+
+        Parameters
+        ----------
+        field : str
+            One of 'mood', 'hunger_level', 'energy' or 'health'.
+        op : str
+            One of 'lt', 'le', 'gt', 'ge' or 'eq'.
+        value : number
+            The value to compare to.
+
+        Raises
+        ------
+        ValueError
+            If the field or the operator is not valid.
+
+        Returns
+        -------
+        numpy.ndarray
+            The rows, in no particular order.
+
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Invalid operator '{op}'. Valid options: {', '.join(OPERATORS)}")
+        index = self._sorted_index(field)
+        rows = self._row_of_id[index.select(op, value)]
+        dirty = self._dirty_rows(index)
+        if dirty.size:
+            keep = _COMPARE[op](self._data[field][dirty], value)
+            rows = np.concatenate([rows, dirty[keep]])
+        return rows
+
+    def top_rows(self, field, k, largest=True):
+        """
+        Finds the cats with the k largest (or smallest) values of a field, through an index
+
+        Parameters
+        ----------
+        field : str
+            One of 'mood', 'hunger_level', 'energy' or 'health'.
+        k : int
+            Number of cats.
+        largest : bool, optional
+            Whether to find the largest values. Default is True.
+
+        Returns
+        -------
+        numpy.ndarray
+            The rows, from the largest (smallest) value. Tied cats come in no
+            guaranteed order.
+
+        """
+        index = self._sorted_index(field)
+        rows = np.concatenate([self._row_of_id[index.top(k, largest)], self._dirty_rows(index)])
+        values = self._data[field][rows]
+        order = np.lexsort((self._data['id'][rows], -values if largest else values))
+        return rows[order[:k]]
+
+    def get(self, row, field):
+        """
+        Reads a single attribute of a single cat
+
+        Parameters
+        ----------
+        row : int
+            The row of the cat.
+        field : str
+            The attribute name.
+
+        Returns
+        -------
+        The value as a Python object (int, str or None).
+
+        """
+        if field == 'name':
+            return self.names[row]
+        value = self._data[field][row]
+        if field == 'age':
+            if math.isnan(value):
+                return None
+            return int(value) if value.is_integer() else float(value)
+        if field == 'color':
+            return None if value < 0 else COLORS[value]
+        return int(value)
+
+    def set(self, row, field, value):
+        """
+        Writes a single attribute of a single cat
+
+        Parameters
+        ----------
+        row : int
+            The row of the cat.
+        field : str
+            The attribute name.
+        value : object
+            The new value.
+
+        Raises
+        ------
+        ValueError
+            If a color is not one of COLORS, or a state attribute is not a
+            whole number.
+        TypeError
+            If a state attribute is not a number.
+
+        """
+        if field == 'name':
+            if self._name_index is not None:
+                cat_id = int(self._data['id'][row])
+                named = self._name_index[self.names[row]]
+                named.discard(cat_id)
+                if not named:
+                    del self._name_index[self.names[row]]
+                self._name_index.setdefault(value, set()).add(cat_id)
+            self.names[row] = value
+        elif field == 'age':
+            self._data['age'][row] = np.nan if value is None else value
+        elif field == 'color':
+            code = _color_code(value)
+            if self.aggregates is not None:
+                self.aggregates.recolor(self._data['color'][row], code)
+            self._data['color'][row] = code
+        else:
+            value = _state_value(field, value)
+            before = self._snapshot(row)
+            if self.aggregates is not None:
+                self.aggregates.change(field, self._data[field][row], value)
+            self._touch((field,), row)
+            self._data[field][row] = value
+            self._log(SET, row, before)
+
+    # Vectorized actions. `rows` selects the cats to act on (all cats if None,
+    # without duplicates otherwise) and `code` is the event recorded in the
+    # journal, if any.
+
+    def _select(self, rows):
+        return slice(0, self.size) if rows is None else rows
+
+    def _is_all(self, idx):
+        return isinstance(idx, slice) and idx == slice(0, self.size)
+
+    def _mark(self, idx):
+        """Tells the recorder, if any, that the selected rows changed"""
+        if self.recorder is not None:
+            self.recorder.mark(None if self._is_all(idx) else self._data['id'][idx])
+
+    def _touch(self, fields, idx):
+        """Marks the selected rows as changed in the indexes of some fields"""
+        self._mark(idx)
+        for field in fields:
+            index = self._indexes.get(field)
+            if index is not None:
+                if self._is_all(idx):
+                    index.invalidate()
+                else:
+                    index.touch(self._data['id'][idx])
+
+    def _shift(self, field, delta, idx):
+        """Adds delta to the selected rows of a field, keeping statistics and indexes up to date"""
+        values = self._data[field]
+        full = self._is_all(idx)
+        self._mark(idx)
+        index = self._indexes.get(field)
+        if index is not None:
+            if full:
+                index.shift(delta)
+            else:
+                index.touch(self._data['id'][idx])
+        if self.aggregates is None:
+            values[idx] += delta
+        elif full:
+            self.aggregates.shift(field, delta)
+            values[idx] += delta
+        else:
+            old = values[idx]
+            new = old + delta
+            self.aggregates.change(field, old, new)
+            values[idx] = new
+
+    def _snapshot(self, idx):
+        """Copies the state of the selected rows, only when journaling"""
+        if self.journal is None:
+            return None
+        return [np.array(self._data[field][idx]) for field in STATE_FIELDS]
+
+    def _log(self, code, idx, before):
+        """Records the changes made to the selected rows since _snapshot"""
+        if before is None:
+            return
+        deltas = [self._data[field][idx] - old for field, old in zip(STATE_FIELDS, before)]
+        self.journal.record(self._data['id'][idx], code, deltas)
+
+    def add(self, field, delta, rows=None, code=SET):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._shift(field, delta, idx)
+        self._log(code, idx, before)
+
+    def add_deltas(self, rows, deltas):
+        """
+        Adds its own change to each selected cat, keeping statistics, indexes and the recorder up to date
+
+        Parameters
+        ----------
+        rows : numpy.ndarray of int
+            The rows to change, without duplicates.
+        deltas : dict
+            Maps state attributes to the change of each selected cat.
+
+        """
+        self._touch(STATE_FIELDS, rows)
+        for field, delta in deltas.items():
+            values = self._data[field]
+            if self.aggregates is not None:
+                self.aggregates.add_deltas(field, values[rows], delta)
+            values[rows] += delta
+
+    def play(self, mood_boost, hunger_boost, energy_boost, rows=None):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._shift('mood', mood_boost, idx)
+        self._shift('hunger_level', hunger_boost, idx)
+        self._shift('energy', energy_boost, idx)
+        self._log(ACTIONS.index('play'), idx, before)
+
+    def bathe(self, rows=None):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._shift('mood', -1, idx)
+        self._shift('health', 1, idx)
+        self._log(ACTIONS.index('bathe'), idx, before)
+
+    def groom(self, rows=None):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._shift('mood', 1, idx)
+        self._shift('health', 1, idx)
+        self._log(ACTIONS.index('groom'), idx, before)
+
+    def eat(self, rows=None, code=EAT):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        hunger = self._data['hunger_level']
+        updated = np.maximum(hunger[idx] - 1, 0)
+        if self.aggregates is not None:
+            self.aggregates.change('hunger_level', hunger[idx], updated)
+        index = self._indexes.get('hunger_level')
+        if index is not None and self._is_all(idx):
+            # max(h - 1, 0) keeps the order of the cats
+            index.remap(lambda keys: np.maximum(keys - 1, 0))
+        else:
+            self._touch(('hunger_level',), idx)
+        hunger[idx] = updated
+        self._shift('mood', 1, idx)
+        self._log(code, idx, before)
+
+    def sleep(self, duration, rows=None):
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._shift('energy', math.floor(duration / 3), idx)
+        self._log(SLEEP, idx, before)
+
+    def apply_actions(self, codes, sleep_duration=0, rows=None):
+        """
+        Applies a different action to each cat in one vectorized pass.
+
+        Parameters
+        ----------
+        codes : numpy.ndarray
+            One action code (index in ACTIONS) per selected cat.
+        sleep_duration : int or float, optional
+            Hours slept by the cats whose action is 'sleep'. Default is 0.
+        rows : array-like, optional
+            The rows to act on. Default is all rows.
+
+        """
+        idx = self._select(rows)
+        before = self._snapshot(idx)
+        self._touch(STATE_FIELDS, idx)
+        deltas = ACTION_DELTAS.copy()
+        deltas[SLEEP, 2] = math.floor(sleep_duration / 3)
+        for j, field in enumerate(STATE_FIELDS):
+            values = self._data[field]
+            if field == 'hunger_level':
+                updated = values[idx] + deltas[codes, j]
+                np.maximum(updated, 0, out=updated, where=codes == EAT)
+                if self.aggregates is not None:
+                    self.aggregates.change(field, values[idx], updated)
+                values[idx] = updated
+            else:
+                if self.aggregates is not None:
+                    self.aggregates.add_deltas(field, values[idx], deltas[codes, j])
+                values[idx] += deltas[codes, j]
+        self._log(codes, idx, before)